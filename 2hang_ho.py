@@ -181,14 +181,21 @@ def build_article_index(nodes: List[Dict[str, Any]]):
                     if str(onode.get("number", "")).isdigit()
                     else None
                 )
-                if o_txt:
+                # 목(가. 나. …)은 호 텍스트에서 빠져 자식 노드가 되므로 같은 호의 세그먼트로 이어 붙임
+                m_txts = [
+                    (nodes_by_id.get(mid) or {}).get("text") or ""
+                    for mid in onode.get("Children_id", []) or []
+                ]
+                for seg_txt in [o_txt] + [t.strip() for t in m_txts]:
+                    if not seg_txt:
+                        continue
                     segments.append(
                         {
                             "scope": "호",
                             "hang": h_no,
                             "ho": o_no,
-                            "text": o_txt,
-                            "text_norm": norm_for_match(o_txt),
+                            "text": seg_txt,
+                            "text_norm": norm_for_match(seg_txt),
                         }
                     )
 
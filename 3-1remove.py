@@ -1,9 +1,26 @@
 # -*- coding: utf-8 -*-
-import re
+"""
+링크 대상 텍스트 셀마다 편/장/절·조/항/호/목 노드 JSON 컬럼을 만듭니다. (law_parser.parse_cell)
+
+셀 파싱은 서로 독립인 CPU 작업이므로 프로세스 풀에서 나눠 처리합니다.
+결과 순서는 입력 행 순서와 같습니다.
+같은 내용의 셀은 파일이 달라도 한 번만 파싱합니다. (parse_cache.py, 내용 해시 키)
+
+  python 3-1remove.py                # 작업자 = CPU 코어 수
+  python 3-1remove.py --workers 1    # 풀 없이 순차 처리
+  python 3-1remove.py --persist      # 파싱 결과를 디스크에도 저장해 다음 실행에서 재사용
+"""
+
+import argparse
 import json
 import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
 import pandas as pd
-from typing import List, Dict, Any, Tuple, Optional
+from blob_store import resolve_text
+from law_parser import parse_cell
+from parse_cache import PARSE_CACHE_PATH, ParseCache, content_key
+from typing import List, Optional, Sequence, Tuple
 
 # ====================================
 # 처리할 파일 목록
@@ -36,259 +53,6 @@ FILES_TO_PROCESS = [
 ]
 
 
-# ====================================
-# 정규식 (기존과 동일)
-# ====================================
-CIRCLED_CHARS = [
-    "①",
-    "②",
-    "③",
-    "④",
-    "⑤",
-    "⑥",
-    "⑦",
-    "⑧",
-    "⑨",
-    "⑩",
-    "⑪",
-    "⑫",
-    "⑬",
-    "⑭",
-    "⑮",
-    "⑯",
-    "⑰",
-    "⑱",
-    "⑲",
-    "⑳",
-]
-CIRCLED_MAP = {ch: i + 1 for i, ch in enumerate(CIRCLED_CHARS)}
-CIRCLED_RE = re.compile("|".join(map(re.escape, CIRCLED_CHARS)))
-JOSA_RE = re.compile(
-    r"^제\s*(\d+)(?:\s*조의\s*(\d+)|\s*조)(?:\(([^)]*)\))?", re.MULTILINE
-)
-HANG_TEXT_RE = re.compile(r"(?m)^\s*제\s*(\d+)\s*항\b")
-HO_LINE_RE = re.compile(r"(?m)^\s*(\d+)\.\s")
-META_LINE_RE = re.compile(r"^(?:\s*\[[^\]]+\]\s*)+$")
-
-
-# ====================================
-# 유틸리티 및 파싱 함수 (기존과 동일)
-# ====================================
-def normalize_text(s: str) -> str:
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    s = s.replace("\xa0", " ")
-    s = re.sub(r"[ \t]+", " ", s)
-    return s.strip()
-
-
-def extract_law_title_and_body(raw: str) -> Tuple[str, str]:
-    if not isinstance(raw, str):
-        return "", ""
-    txt = normalize_text(raw)
-    lines = [ln for ln in txt.split("\n")]
-    title = ""
-    i = 0
-    while i < len(lines) and not title:
-        cand = lines[i].strip()
-        if cand:
-            title = cand
-        i += 1
-    if not title:
-        return "", ""
-    while i < len(lines) and META_LINE_RE.match(lines[i].strip() or ""):
-        i += 1
-    body = "\n".join(lines[i:]).strip()
-    return title, body
-
-
-def make_article_id(prefix: str, main_no: str, sub_no: Optional[str] = None) -> str:
-    return f"{prefix}-{main_no}_{sub_no}" if sub_no else f"{prefix}-{main_no}"
-
-
-def make_article_number_field(main_no: str, sub_no: Optional[str] = None) -> str:
-    return f"{main_no}의{sub_no}" if sub_no else str(main_no)
-
-
-def split_by_articles(full_text: str) -> List[Tuple[str, Optional[str], str, int, int]]:
-    matches = list(JOSA_RE.finditer(full_text))
-    chunks: List[Tuple[str, Optional[str], str, int, int]] = []
-    for i, m in enumerate(matches):
-        main_no = m.group(1)
-        sub_no = m.group(2)
-        title = m.group(3) or ""
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(full_text)
-        chunks.append((main_no, sub_no, title, start, end))
-    return chunks
-
-
-def find_first_hang_start(block: str) -> int:
-    p1 = CIRCLED_RE.search(block)
-    pos1 = p1.start() if p1 else -1
-    p2 = HANG_TEXT_RE.search(block)
-    pos2 = p2.start() if p2 else -1
-    if pos1 == -1 and pos2 == -1:
-        return -1
-    if pos1 == -1:
-        return pos2
-    if pos2 == -1:
-        return pos1
-    return min(pos1, pos2)
-
-
-def find_hang_positions(block_text: str):
-    positions = []
-    for m in CIRCLED_RE.finditer(block_text):
-        sym = m.group(0)
-        positions.append((m.start(), CIRCLED_MAP[sym], sym))
-    positions.sort(key=lambda x: x[0])
-    return positions
-
-
-def split_hang_texts(block_text: str, hang_positions):
-    parts = []
-    if not hang_positions:
-        return parts
-    for i, (pos, num, sym) in enumerate(hang_positions):
-        start = pos
-        end = (
-            hang_positions[i + 1][0] if i + 1 < len(hang_positions) else len(block_text)
-        )
-        raw = block_text[start:end].lstrip()
-        if raw.startswith(sym):
-            raw = raw[len(sym) :].lstrip()
-        parts.append((num, raw.rstrip()))
-    return parts
-
-
-def split_ho_with_preface(hang_text: str):
-    matches = list(HO_LINE_RE.finditer(hang_text))
-    if not matches:
-        return hang_text.strip(), []
-    preface_end = matches[0].start()
-    preface = hang_text[:preface_end].strip()
-    results = []
-    for i, m in enumerate(matches):
-        ho_no = int(m.group(1))
-        start = m.start()
-        end = matches[i + 1].start() if i + 1 < len(matches) else len(hang_text)
-        piece = hang_text[start:end].strip()
-        piece = re.sub(r"^\s*\d+\.\s*", "", piece)
-        results.append((ho_no, piece.strip()))
-    return preface, results
-
-
-def hard_cut_article_text(article_text: str) -> str:
-    m = CIRCLED_RE.search(article_text)
-    if m:
-        return article_text[: m.start()].rstrip()
-    m2 = HANG_TEXT_RE.search(article_text)
-    if m2:
-        return article_text[: m2.start()].rstrip()
-    return article_text.rstrip()
-
-
-def build_nodes_for_cell(cell_text: str) -> List[Dict[str, Any]]:
-    law_title, body = extract_law_title_and_body(cell_text)
-    if not law_title:
-        return []
-
-    nodes: List[Dict[str, Any]] = []
-    node_map: Dict[str, Dict[str, Any]] = {}
-    chunks = split_by_articles(body)
-
-    if not chunks and ("별표" in law_title or "별지" in law_title):
-        node_id_text = law_title
-        special_node = {
-            "id": node_id_text,
-            "law_title": node_id_text,
-            "level": "기타",
-            "number": "기타",
-            "parent_id": None,
-            "Children_id": [],
-            "text": node_id_text,
-            "refs": [],
-        }
-        return [special_node]
-
-    if not chunks:
-        return []
-
-    for main_no, sub_no, title, start, end in chunks:
-        block = body[start:end].strip()
-        m_head = JOSA_RE.match(block)
-        header_txt = (
-            m_head.group(0).strip() if m_head else block.split("\n", 1)[0].strip()
-        )
-        first_hang_idx = find_first_hang_start(block)
-
-        if first_hang_idx != -1 and m_head:
-            preface = block[m_head.end() : first_hang_idx].strip()
-            article_text = header_txt if not preface else (header_txt + "\n" + preface)
-        else:
-            article_text = block
-
-        article_text = hard_cut_article_text(article_text)
-        article_id = make_article_id(law_title, main_no, sub_no)
-        number_field = make_article_number_field(main_no, sub_no)
-        art_node = {
-            "id": article_id,
-            "law_title": law_title,
-            "level": "조",
-            "number": number_field,
-            "parent_id": None,
-            "Children_id": [],
-            "text": article_text,
-            "refs": [],
-        }
-        nodes.append(art_node)
-        node_map[article_id] = art_node
-
-        if first_hang_idx == -1:
-            continue
-
-        after_header = block[first_hang_idx:]
-        hang_positions = find_hang_positions(after_header)
-        hang_parts = split_hang_texts(after_header, hang_positions)
-        if not hang_parts:
-            continue
-
-        for hang_no, hang_txt in hang_parts:
-            hang_preface, ho_list = split_ho_with_preface(hang_txt)
-            hang_id = f"{article_id}({hang_no})"
-            hang_node = {
-                "id": hang_id,
-                "law_title": law_title,
-                "level": "항",
-                "number": str(hang_no),
-                "parent_id": article_id,
-                "Children_id": [],
-                "text": hang_preface,
-                "refs": [],
-            }
-            nodes.append(hang_node)
-            node_map[article_id]["Children_id"].append(hang_id)
-            node_map[hang_id] = hang_node
-
-            for ho_no, ho_txt in ho_list:
-                ho_id = f"{hang_id}[{ho_no}]"
-                ho_node = {
-                    "id": ho_id,
-                    "law_title": law_title,
-                    "level": "호",
-                    "number": str(ho_no),
-                    "parent_id": hang_id,
-                    "Children_id": [],
-                    "text": ho_txt,
-                    "refs": [],
-                }
-                nodes.append(ho_node)
-                node_map[hang_id]["Children_id"].append(ho_id)
-                node_map[ho_id] = ho_node
-
-    return nodes
-
-
 def read_excel_first_or_named(path: str, sheet_name=None) -> tuple[pd.DataFrame, str]:
     xls = pd.ExcelFile(path)
     chosen = (
@@ -301,11 +65,87 @@ def read_excel_first_or_named(path: str, sheet_name=None) -> tuple[pd.DataFrame,
     return df, chosen
 
 
+# 셀 파싱에 쓸 프로세스 수
+PARSE_WORKERS = os.cpu_count() or 1
+# 작업자에게 한 번에 넘길 셀 수 (프로세스 간 전달 횟수를 줄임)
+PARSE_CHUNK_SIZE = 64
+
+
+def cell_to_json(txt: str) -> Tuple[str, float]:
+    """
+    셀 하나 → (노드 JSON 문자열, 걸린 초).
+    프로세스 풀 작업자가 실행하므로 모듈 최상위에 둠.
+    """
+    started = time.perf_counter()
+    # 긴 텍스트는 크롤러가 blob 저장소에 두고 참조("blob:...")만 남김 → 여기서 읽어 옴
+    nodes = parse_cell(resolve_text(txt))
+    nodes_json = json.dumps(nodes, ensure_ascii=False, separators=(",", ":"))
+    return nodes_json, time.perf_counter() - started
+
+
+def parse_cells(
+    texts: Sequence[str],
+    executor: Optional[Executor] = None,
+    cache: Optional[ParseCache] = None,
+    chunk_size: int = PARSE_CHUNK_SIZE,
+) -> List[str]:
+    """
+    셀 목록을 JSON 문자열 목록으로 변환합니다. (입력 순서 유지)
+    내용이 같은 셀은 한 번만, 캐시에 있는 셀은 아예 파싱하지 않고,
+    나머지만 executor가 있으면 나눠 처리합니다.
+    """
+    if cache is None:
+        cache = ParseCache()
+    keys = [content_key(txt) for txt in texts]
+    first_text = {}
+    for key, txt in zip(keys, texts):
+        first_text.setdefault(key, txt)
+
+    found = {}
+    pending = []
+    for key in first_text:
+        entry = cache.get(key)
+        if entry is None:
+            pending.append(key)
+        else:
+            found[key] = entry
+
+    pending_texts = [first_text[key] for key in pending]
+    if executor is None:
+        parsed = map(cell_to_json, pending_texts)
+    else:
+        parsed = executor.map(cell_to_json, pending_texts, chunksize=max(1, chunk_size))
+    for key, (nodes_json, seconds) in zip(pending, parsed):
+        cache.put(key, nodes_json, seconds)
+        found[key] = (nodes_json, seconds)
+    cache.flush()
+
+    # 키마다 처음 나온 행만 실제로 파싱함. 나머지 행은 캐시 적중으로 셈
+    parsed_once = set(pending)
+    results = []
+    for key in keys:
+        nodes_json, seconds = found[key]
+        if key in parsed_once:
+            parsed_once.discard(key)
+        else:
+            cache.record_hit(seconds)
+        results.append(nodes_json)
+    return results
+
+
 # ====================================
 # 핵심 로직 함수
 # ====================================
-def process_single_file(file_base: str, sheet_name: Optional[str] = None):
-    """단일 파일을 읽어 JSON 컬럼을 추가하고 저장하는 함수"""
+def process_single_file(
+    file_base: str,
+    sheet_name: Optional[str] = None,
+    executor: Optional[Executor] = None,
+    cache: Optional[ParseCache] = None,
+):
+    """
+    단일 파일을 읽어 JSON 컬럼을 추가하고 저장하는 함수
+    (executor: 셀 파싱용 프로세스 풀, cache: 파일 사이에 공유하는 파싱 결과 캐시)
+    """
     in_xlsx = f"{file_base}_labeled.xlsx"
     out_xlsx = f"{file_base}_Ref_labeled_with_json.xlsx"
 
@@ -322,31 +162,52 @@ def process_single_file(file_base: str, sheet_name: Optional[str] = None):
     if col_src not in df.columns:
         raise ValueError(f"입력 엑셀에 '{col_src}' 컬럼이 없습니다.")
 
-    json_col = []
-    for txt in df[col_src].fillna(""):
-        nodes = build_nodes_for_cell(txt)
-        json_str = json.dumps(nodes, ensure_ascii=False, separators=(",", ":"))
-        json_col.append(json_str)
-
-    df["링크데이터_JSON"] = json_col
+    started = time.perf_counter()
+    df["링크데이터_JSON"] = parse_cells(
+        df[col_src].fillna("").tolist(), executor, cache
+    )
+    elapsed = time.perf_counter() - started
 
     with pd.ExcelWriter(out_xlsx, engine="openpyxl") as writer:
         df.to_excel(writer, index=False, sheet_name=sheet)
 
     print(f"✅ 저장 완료 → {out_xlsx}")
-    print(f"  총 행수: {len(df)}\n")
+    print(f"  총 행수: {len(df)} (파싱 {elapsed:.1f}초)\n")
 
 
 # ====================================
 # 실행
 # ====================================
 if __name__ == "__main__":
-    print("===== JSON 변환 작업 시작 =====")
-    for file_base_path in FILES_TO_PROCESS:
-        try:
-            process_single_file(file_base_path)
-        except Exception as e:
-            file_name = os.path.basename(file_base_path)
-            print(f"🚨 '{file_name}' 처리 중 오류 발생!")
-            print(f"  오류 내용: {e}\n")
+    parser = argparse.ArgumentParser(description="링크 대상 텍스트 → 노드 JSON 컬럼")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=PARSE_WORKERS,
+        help="셀 파싱 프로세스 수 (1이면 순차 처리)",
+    )
+    parser.add_argument(
+        "--persist",
+        action="store_true",
+        help=f"파싱 결과를 디스크 캐시({PARSE_CACHE_PATH})에도 저장·재사용",
+    )
+    args = parser.parse_args()
+
+    print(f"===== JSON 변환 작업 시작 (작업자 {max(1, args.workers)}개) =====")
+    # 파일마다 풀을 새로 띄우지 않도록 모든 파일에 같은 풀을 씀
+    executor = ProcessPoolExecutor(args.workers) if args.workers > 1 else None
+    cache = ParseCache(PARSE_CACHE_PATH if args.persist else None)
+    try:
+        for file_base_path in FILES_TO_PROCESS:
+            try:
+                process_single_file(file_base_path, executor=executor, cache=cache)
+            except Exception as e:
+                file_name = os.path.basename(file_base_path)
+                print(f"🚨 '{file_name}' 처리 중 오류 발생!")
+                print(f"  오류 내용: {e}\n")
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        print(cache.report())
+        cache.close()
     print("===== 모든 작업 완료 =====")
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+"""
+별표·서식 목록(select#bylList) 색인.
+
+별표/별지/서식 링크의 팝업은 같은 법령이면 항상 같은 목록을 보여 주고, 그중 링크에
+해당하는 항목 하나를 고르는 것이 전부입니다. 예전에는 링크마다 팝업을 열고
+"[별표 1의2]" 같은 검색 문자열을 만들어 모든 option을 차례로 비교했습니다.
+
+AnnexIndex는 처음 연 목록을 (종류, 번호, 가지번호) → [(option 텍스트, value), ...]
+형태로 색인해 두고, 같은 법령을 가리키는 다음 링크는 팝업 없이 바로 찾습니다.
+
+- 종류는 "별표"와 "서식" 두 가지로 맞춥니다. ('별지 제3호서식', '[별지 3]', '[서식 3]' → 서식)
+- 목록은 팝업 대상의 식별자별로 따로 둡니다. 식별자는 앵커의 onclick/href에 들어 있는
+  법령 번호(lsiSeq, admRulSeq 등)입니다. 링크 텍스트만으로는 어느 법령의 별표인지 알 수
+  없으므로(예: '같은 법 시행규칙' 뒤에 따로 떨어진 '별표 2') 식별자를 모르면 색인하지 않습니다.
+- 앞부분이 없거나('별표 2') '같은 법 …'처럼 앞 문맥에 따라 달라지는 링크에는 색인 목록을
+  쓰지 않고 항상 팝업을 엽니다.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional, Tuple
+
+AnnexKey = Tuple[str, int, int]  # (종류, 번호, 가지번호 / 없으면 0)
+
+_FORM_LINK_RE = re.compile(r"제(\d+)호(?:의(\d+))?서식")
+_TABLE_LINK_RE = re.compile(r"별표\s*(\d+)(?:의(\d+))?")
+_OPTION_RE = re.compile(r"^\[\s*(별표|별지|서식)\s*(\d+)(?:\s*의\s*(\d+))?\s*\]")
+_PREFIX_SPLIT_RE = re.compile(r"별표|별지")
+# 팝업 대상 법령을 가리키는 onclick/href 파라미터 (예: lsiSeq=123456, 'admRulSeq', '2100000')
+_TARGET_PARAM_RE = re.compile(
+    r"\b(lsiSeq|admRulSeq|lsId|admRulId)\b['\"]?\s*[=:,]\s*['\"]?(\d+)", re.I
+)
+
+
+def annex_not_found_text(merged_text: str) -> str:
+    return f"'{merged_text}'에 해당하는 항목을 찾지 못했습니다."
+
+
+def link_annex_key(merged_text: str) -> Optional[Tuple[str, AnnexKey]]:
+    """
+    링크 텍스트에서 (법령 앞부분, 색인 키)를 만듭니다. 별표·서식 링크가 아니면 None.
+    예) "「산업안전보건법 시행규칙」 별지 제3호의2서식" → ("「산업안전보건법 시행규칙」", ("서식", 3, 2))
+    """
+    if "별지" in merged_text and "서식" in merged_text:
+        match = _FORM_LINK_RE.search(merged_text)
+        kind = "서식"
+    elif "별표" in merged_text:
+        match = _TABLE_LINK_RE.search(merged_text)
+        kind = "별표"
+    else:
+        return None
+    if not match:
+        return None
+    main_num, sub_num = match.groups()
+    prefix = _PREFIX_SPLIT_RE.split(merged_text, 1)[0].strip()
+    return prefix, (kind, int(main_num), int(sub_num or 0))
+
+
+def annex_scope(onclick: str, href: str) -> Optional[str]:
+    """
+    앵커의 onclick/href에서 팝업 대상 법령의 식별자를 만듭니다. 모르면 None.
+    예) href="/LSW/lsBylInfoPLinkR.do?lsiSeq=123&bylNo=0002" → "lsiseq=123"
+    """
+    params = {
+        f"{name.lower()}={value}"
+        for name, value in _TARGET_PARAM_RE.findall(f"{onclick or ''} {href or ''}")
+    }
+    return "&".join(sorted(params)) or None
+
+
+def _is_relative_prefix(prefix: str) -> bool:
+    """앞부분이 없거나 '같은 법 …'이면 링크 텍스트만으로는 대상 법령을 알 수 없음"""
+    return not prefix or prefix.startswith("같은")
+
+
+def option_annex_key(option_text: str) -> Optional[AnnexKey]:
+    """목록 항목 텍스트('[별표 1의2] ...', '[서식 3의 2] ...')의 색인 키. 형식이 다르면 None."""
+    match = _OPTION_RE.match(option_text.strip())
+    if not match:
+        return None
+    kind, main_num, sub_num = match.groups()
+    kind = "별표" if kind == "별표" else "서식"
+    return kind, int(main_num), int(sub_num or 0)
+
+
+def build_option_index(
+    options: List[Tuple[str, str]],
+) -> Dict[AnnexKey, List[Tuple[str, str]]]:
+    """[(option 텍스트, value), ...] → {색인 키: [(텍스트, value), ...]} (목록 순서 유지)"""
+    index: Dict[AnnexKey, List[Tuple[str, str]]] = {}
+    for text, value in options:
+        key = option_annex_key(text)
+        if key is not None:
+            index.setdefault(key, []).append((text.strip(), value))
+    return index
+
+
+class AnnexIndex:
+    """
+    법령 하나를 크롤링하는 동안 쓰는 별표·서식 목록 색인. (샤드 스레드에서 함께 사용)
+    scope는 annex_scope()로 만든 팝업 대상 식별자입니다. None이면 색인을 쓰지 않습니다.
+    """
+
+    def __init__(self):
+        self._lists: Dict[str, Dict[AnnexKey, List[Tuple[str, str]]]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+
+    def matches(
+        self, merged_text: str, scope: Optional[str]
+    ) -> Optional[List[Tuple[str, str]]]:
+        """
+        이미 색인한 목록에서 링크에 해당하는 항목들을 찾습니다.
+        반환: 항목 목록(없으면 []) / 이 링크의 목록을 아직 모르면 None
+        """
+        parsed = link_annex_key(merged_text)
+        if scope is None or parsed is None or _is_relative_prefix(parsed[0]):
+            return None
+        with self._lock:
+            options = self._lists.get(scope)
+            if options is None:
+                return None
+            self.hits += 1
+        return options.get(parsed[1], [])
+
+    def lookup(self, merged_text: str, scope: Optional[str]) -> Optional[str]:
+        """팝업 없이 링크 대상 텍스트를 반환합니다. 목록을 아직 모르면 None."""
+        found = self.matches(merged_text, scope)
+        if found is None:
+            return None
+        return found[0][0] if found else annex_not_found_text(merged_text)
+
+    def remember(
+        self, merged_text: str, options: List[Tuple[str, str]], scope: Optional[str]
+    ) -> List[Tuple[str, str]]:
+        """
+        팝업에서 읽은 목록을 색인에 넣고, 이 링크에 해당하는 항목들을 반환합니다.
+        options: [(option 텍스트, value), ...]
+        """
+        option_index = build_option_index(options)
+        parsed = link_annex_key(merged_text)
+        if parsed is None:
+            return []
+        if scope is not None:
+            with self._lock:
+                self._lists.setdefault(scope, option_index)
+        return option_index.get(parsed[1], [])
+
+    def learn(
+        self, merged_text: str, options: List[Tuple[str, str]], scope: Optional[str]
+    ) -> str:
+        """remember와 같지만 링크 대상 텍스트(첫 항목 또는 못 찾음 안내)를 반환합니다."""
+        found = self.remember(merged_text, options, scope)
+        return found[0][0] if found else annex_not_found_text(merged_text)
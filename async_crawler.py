@@ -0,0 +1,401 @@
+# -*- coding: utf-8 -*-
+"""
+asyncio + DevTools 프로토콜(Playwright) 크롤링 엔진. (선택 사항)
+
+Selenium 경로는 링크마다 클릭 → 팝업 로딩 대기 → 추출 → 창 닫기를 차례로 하므로
+팝업이 뜨는 동안 아무 일도 하지 않습니다. 이 엔진은 브라우저 하나를 CDP로 제어하며
+링크를 차례로 클릭해 팝업 탭만 만들고, 팝업 로딩 대기·DOM 수집·탭 닫기는 여러 탭에서
+동시에 진행합니다. 동시에 열린 팝업 수는 MAX_INFLIGHT_LINKS(세마포어)로 제한합니다.
+Selenium 경로와 같은 요청 속도 제한(TokenBucket), 링크 캐시(LinkCache), 일시 오류
+재시도(RetryPolicy)를 받아 여러 법령을 함께 돌려도 사이트에 보내는 요청 수는 같게 유지합니다.
+
+scrape_law_data_with_clicks(url, output_filename)는 law_crawling의 같은 이름 함수와
+출력 파일(RowSink), 체크포인트(crawl_journal), 변경 감지(crawl_fingerprint), 반환값이 같아
+다음 단계는 어느 엔진으로 수집했는지 구분하지 않습니다.
+팝업 텍스트는 HTTP 빠른 경로와 같은 link_http.parse_popup_html 규칙으로 추출합니다.
+
+필요: pip install playwright && playwright install chromium
+  python async_crawler.py <URL> <출력파일.csv|.jsonl>
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from annex_index import AnnexIndex, annex_scope
+from blob_store import BlobStore
+from crawl_fingerprint import (
+    article_fingerprint,
+    fingerprint_path_for,
+    load_unchanged_rows,
+    save_fingerprints,
+)
+from crawl_journal import ArticleJournal, journal_path_for
+from crawl_output import RowSink, make_row
+from crawl_throttle import (
+    TRANSIENT_MESSAGES,
+    RetryPolicy,
+    ThrottledError,
+    TransientError,
+    is_throttle_page,
+)
+from law_crawling import RETRY_ATTEMPTS, get_article_num, iter_article_link_groups
+from link_cache import make_link_key
+from link_grouping import merge_group_text
+from link_http import parse_popup_html
+from popup_wait import MAX_TIMEOUT, POPUP_SELECTORS
+from resource_blocking import apply_playwright_blocking
+
+try:
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+    from playwright.async_api import async_playwright
+except ImportError:
+    async_playwright = None
+
+# 동시에 열어 둘 팝업 탭 수
+MAX_INFLIGHT_LINKS = 8
+PAGE_TIMEOUT_MS = int(MAX_TIMEOUT * 1000)
+POPUP_CONTENT_CSS = ", ".join(css for _, css in POPUP_SELECTORS)
+
+# law_crawling.SNAPSHOT_ARTICLES_JS와 같은 구조. CDP로는 DOM 요소를 돌려받을 수 없으므로
+# 앵커마다 data-crawl-id를 붙이고 요소 대신 그 번호("id")를 반환합니다.
+SNAPSHOT_ARTICLES_JS = """
+() => {
+    var result = [];
+    var nextId = 0;
+    var divs = document.querySelectorAll("div.lawcon");
+    for (var i = 0; i < divs.length; i++) {
+        var title = divs[i].querySelector("p.pty1_p4");
+        var paragraphs = [];
+        var ps = divs[i].getElementsByTagName("p");
+        for (var j = 0; j < ps.length; j++) {
+            var anchors = ps[j].querySelectorAll('a.link, a[class*="sfon"]');
+            if (!anchors.length) continue;
+            var links = [];
+            for (var k = 0; k < anchors.length; k++) {
+                anchors[k].setAttribute("data-crawl-id", String(nextId));
+                links.push({
+                    cls: anchors[k].getAttribute("class") || "",
+                    text: (anchors[k].innerText || "").trim(),
+                    onclick: anchors[k].getAttribute("onclick") || "",
+                    href: anchors[k].getAttribute("href") || "",
+                    id: nextId
+                });
+                nextId++;
+            }
+            paragraphs.push(links);
+        }
+        result.push({
+            title: title ? title.innerText : null,
+            text: divs[i].innerText,
+            paragraphs: paragraphs
+        });
+    }
+    return result;
+}
+"""
+
+
+async def open_link_target(
+    page,
+    click_lock,
+    semaphore,
+    anchor_id,
+    merged_text,
+    annex_index=None,
+    limiter=None,
+    scope=None,
+):
+    """
+    링크 하나를 클릭해 팝업 탭의 내용을 수집합니다. (한 번 시도)
+    클릭 → 팝업 탭 생성까지만 click_lock으로 순서를 지키고(어느 탭이 어느 링크인지 구분),
+    팝업 로딩 대기와 추출, 닫기는 다른 링크와 동시에 진행합니다.
+    limiter(TokenBucket)가 있으면 클릭 전에 토큰을 받습니다. (다른 작업을 막지 않도록 스레드에서 대기)
+    일시 오류면 TransientError를, 차단 안내 페이지면 ThrottledError를 올립니다. (crawl_throttle.py)
+    새 창이 열리지 않는 링크(죽은 링크)와 알 수 없는 형식은 다시 눌러도 같으므로
+    law_crawling.fetch_link_target처럼 행에 오류로 남깁니다.
+    """
+    async with semaphore:
+        popup = None
+        try:
+            anchor = await page.query_selector(f'[data-crawl-id="{anchor_id}"]')
+            if anchor is None:
+                return "오류 발생 또는 텍스트 수집 실패: 링크 요소를 찾을 수 없습니다."
+            if limiter is not None:
+                await asyncio.to_thread(limiter.acquire)
+            async with click_lock:
+                try:
+                    async with page.expect_popup(timeout=PAGE_TIMEOUT_MS) as popup_info:
+                        await anchor.evaluate("a => a.click()")
+                    popup = await popup_info.value
+                except PlaywrightTimeoutError:
+                    # 죽은 링크는 다시 눌러도 같으므로 Selenium 경로처럼 행에 오류로 남김
+                    return "오류: 링크를 클릭해도 새 창이 열리지 않았습니다."
+            try:
+                await popup.wait_for_selector(
+                    POPUP_CONTENT_CSS, state="attached", timeout=PAGE_TIMEOUT_MS
+                )
+            except PlaywrightTimeoutError:
+                pass
+            html = await popup.content()
+            new_window_text = parse_popup_html(html, merged_text, annex_index, scope)
+            if new_window_text is None:
+                message = "오류: 새 창에서 알려진 데이터 형식(#linkedJoContent, Table, #bylList, .byl_con)을 찾을 수 없습니다."
+                if is_throttle_page(html):
+                    raise ThrottledError(message)
+                return message
+            return new_window_text
+        except TransientError:
+            raise
+        except Exception as e:
+            message = f"오류 발생 또는 텍스트 수집 실패: {e}"
+            if any(m in str(e) for m in TRANSIENT_MESSAGES):
+                raise TransientError(message)
+            return message
+        finally:
+            if popup is not None:
+                try:
+                    await popup.close()
+                except Exception:
+                    pass
+
+
+async def fetch_link_target(
+    page,
+    click_lock,
+    semaphore,
+    link,
+    merged_text,
+    annex_index=None,
+    link_cache=None,
+    page_url="",
+    limiter=None,
+    retry_policy=None,
+):
+    """
+    링크 그룹 하나의 대상 내용을 수집합니다. (law_crawling.scrape_link_group과 같은 순서)
+    annex_index에 이미 목록이 있는 별표·서식 링크는 팝업 없이 바로 찾고,
+    link_cache가 있으면 클릭 전에 캐시를 조회하고 새로 수집한 내용은 캐시에 저장합니다.
+    일시 오류는 retry_policy대로 기다렸다가 다시 시도합니다. 기다리는 동안 팝업 자리는 비워 둡니다.
+    """
+    scope = annex_scope(link["onclick"], link["href"])
+    if annex_index is not None:
+        annex_text = annex_index.lookup(merged_text, scope)
+        if annex_text is not None:
+            return annex_text
+    cache_key = None
+    if link_cache is not None:
+        cache_key = make_link_key(link["onclick"], link["href"], page_url, merged_text)
+        cached_text = link_cache.get(cache_key)
+        if cached_text is not None:
+            return cached_text
+    if retry_policy is None:
+        retry_policy = RetryPolicy(max_attempts=RETRY_ATTEMPTS)
+
+    attempt = 0
+    while True:
+        try:
+            new_window_text = await open_link_target(
+                page,
+                click_lock,
+                semaphore,
+                link["id"],
+                merged_text,
+                annex_index,
+                limiter,
+                scope,
+            )
+            break
+        except TransientError as e:
+            if limiter is not None and isinstance(e, ThrottledError):
+                limiter.penalize()
+            attempt += 1
+            if attempt > retry_policy.max_attempts:
+                return str(e)
+            await asyncio.sleep(retry_policy.delay(attempt))
+    # 오류 행은 성공이 아니므로 속도를 올리지 않음
+    if limiter is not None and not str(new_window_text).startswith("오류"):
+        limiter.reward()
+    if link_cache is not None:
+        link_cache.put(cache_key, new_window_text)
+    return new_window_text
+
+
+async def scrape_article(
+    page,
+    click_lock,
+    semaphore,
+    article,
+    annex_index=None,
+    blob_store=None,
+    **fetch_opts,
+):
+    """
+    '조' 하나의 링크 그룹을 동시에 수집해, 문서 순서대로 행 목록을 반환합니다.
+    fetch_opts는 fetch_link_target에 그대로 넘깁니다. (link_cache, page_url, limiter, retry_policy)
+    """
+    article_num = get_article_num(article)
+    groups = list(iter_article_link_groups(article))
+    texts = await asyncio.gather(
+        *(
+            fetch_link_target(
+                page,
+                click_lock,
+                semaphore,
+                group[-1],
+                merge_group_text(group),
+                annex_index,
+                **fetch_opts,
+            )
+            for group in groups
+        )
+    )
+    return [
+        make_row(article_num, merge_group_text(group), text, blob_store)
+        for group, text in zip(groups, texts)
+    ]
+
+
+async def scrape_law_async(
+    url,
+    output_filename,
+    max_inflight=MAX_INFLIGHT_LINKS,
+    resume=True,
+    incremental=True,
+    blob_store=None,
+    link_cache=None,
+    rate_limiter=None,
+    retry_policy=None,
+):
+    """scrape_law_data_with_clicks의 비동기 본체. 반환값도 같습니다."""
+    sink = None
+    result = {"output": output_filename, "rows": 0, "error": None}
+    print("-" * 50)
+    print(f"▶️ 작업을 시작합니다 (비동기 CDP 엔진): {output_filename}")
+    try:
+        async with async_playwright() as playwright:
+            browser = await playwright.chromium.launch(headless=True)
+            try:
+                context = await browser.new_context(
+                    viewport={"width": 1920, "height": 1080}
+                )
+                # 팝업 탭도 같은 컨텍스트에서 열리므로 차단 규칙이 함께 적용됨
+                await apply_playwright_blocking(context)
+                page = await context.new_page()
+                if rate_limiter is not None:
+                    await asyncio.to_thread(rate_limiter.acquire)
+                await page.goto(
+                    url, timeout=PAGE_TIMEOUT_MS, wait_until="domcontentloaded"
+                )
+                await page.wait_for_selector("div.lawcon", timeout=PAGE_TIMEOUT_MS)
+                law_articles = await page.evaluate(SNAPSHOT_ARTICLES_JS)
+
+                total_articles = len(law_articles)
+                print(
+                    f"✅ 총 {total_articles}개의 '조'를 발견했습니다. 분석을 시작합니다."
+                )
+                journal = ArticleJournal(
+                    journal_path_for(output_filename),
+                    url,
+                    total_articles,
+                    resume=resume,
+                )
+                fingerprints = [article_fingerprint(a["text"]) for a in law_articles]
+                if incremental:
+                    unchanged = load_unchanged_rows(output_filename, url, fingerprints)
+                    journal.restore(
+                        {
+                            i: rows
+                            for i, rows in unchanged.items()
+                            if not journal.is_done(i)
+                        }
+                    )
+                if journal.completed:
+                    print(
+                        f"♻️ {journal.completed}개 '조'는 이전 결과를 사용합니다. 나머지만 수집합니다."
+                    )
+                if os.path.exists(fingerprint_path_for(output_filename)):
+                    os.remove(fingerprint_path_for(output_filename))
+                sink = RowSink(output_filename)
+
+                click_lock = asyncio.Lock()
+                semaphore = asyncio.Semaphore(max(1, int(max_inflight)))
+                annex_index = AnnexIndex()
+                if blob_store is None:
+                    blob_store = BlobStore()
+
+                async def _run_article(i):
+                    if journal.is_done(i):
+                        sink.write_article(i, journal.take_rows(i))
+                        return
+                    if not get_article_num(law_articles[i]):
+                        sink.write_article(i, [])
+                        return
+                    rows = await scrape_article(
+                        page,
+                        click_lock,
+                        semaphore,
+                        law_articles[i],
+                        annex_index,
+                        blob_store,
+                        link_cache=link_cache,
+                        page_url=page.url,
+                        limiter=rate_limiter,
+                        retry_policy=retry_policy,
+                    )
+                    journal.record(i, rows)
+                    sink.write_article(i, rows)
+                    print(
+                        f"⏳ 제{get_article_num(law_articles[i])}조 분석 완료 "
+                        f"({journal.completed}/{total_articles})"
+                    )
+
+                # '조'들도 동시에 진행. 출력 순서는 RowSink가 '조' 번호순으로 맞춤
+                await asyncio.gather(*(_run_article(i) for i in range(total_articles)))
+            finally:
+                await browser.close()
+
+        result["rows"] = sink.close()
+        if result["rows"]:
+            print(f"✅ 작업 완료! '{output_filename}' 파일로 저장되었습니다.")
+        else:
+            sink.discard()
+            print("⚠️ 수집된 데이터가 없습니다.")
+        save_fingerprints(
+            fingerprint_path_for(output_filename),
+            url,
+            fingerprints,
+            [sink.article_row_counts.get(i, 0) for i in range(total_articles)],
+        )
+        journal.finish()
+    except Exception as e:
+        result["error"] = str(e)
+        if sink is not None:
+            result["rows"] = sink.close()
+        print(f"❌ '{output_filename}' 작업 중 오류가 발생했습니다: {e}")
+    return result
+
+
+def scrape_law_data_with_clicks(url, output_filename, **kwargs):
+    """
+    law_crawling.scrape_law_data_with_clicks와 같은 계약의 비동기 엔진 진입점.
+    kwargs: max_inflight, resume, incremental, blob_store, link_cache, rate_limiter, retry_policy
+    반환: {"output": 파일명, "rows": 저장 행수, "error": 오류 메시지 or None}
+    """
+    if async_playwright is None:
+        raise ImportError(
+            "비동기 엔진에는 playwright가 필요합니다: "
+            "pip install playwright && playwright install chromium"
+        )
+    return asyncio.run(scrape_law_async(url, output_filename, **kwargs))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 3:
+        print("사용법: python async_crawler.py <URL> <출력파일.csv|.jsonl>")
+        sys.exit(1)
+    started = time.time()
+    r = scrape_law_data_with_clicks(sys.argv[1], sys.argv[2])
+    print(f"{r['rows']}행, {time.time() - started:.1f}초")
+    sys.exit(1 if r["error"] else 0)
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+"""
+긴 링크 대상 텍스트를 행 밖에 보관하는 내용 주소 기반 저장소.
+
+예전에는 TEXT_LENGTH_LIMIT(5000/10000자)를 넘는 텍스트를 "내용이 너무 길어 수집 제외"로
+바꿔 내용이 사라졌습니다. 이제 INLINE_TEXT_LIMIT를 넘는 텍스트는 SHA-256 해시를 이름으로
+gzip 압축해 저장하고, 행에는 참조 문자열("blob:<해시>")만 남깁니다.
+같은 내용은 한 번만 저장되므로(중복 제거) 여러 법령이 같은 긴 별표를 가리켜도 파일은 하나입니다.
+
+다음 단계는 resolve_text()로 참조일 때만 필요한 순간에 읽어 옵니다.
+
+  {BLOB_DIR}/ab/abcdef....txt.gz
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from functools import lru_cache
+
+BLOB_DIR = "./data/blobs"
+BLOB_PREFIX = "blob:"
+# 이보다 긴 텍스트는 행 대신 저장소에 둠
+INLINE_TEXT_LIMIT = 5000
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_PREFIX)
+
+
+class BlobStore:
+    def __init__(self, root: str = BLOB_DIR):
+        self.root = root
+        self.stored = 0
+        self.deduplicated = 0
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], f"{digest}.txt.gz")
+
+    def put(self, text: str) -> str:
+        """텍스트를 저장하고 참조 문자열을 반환합니다. 이미 있는 내용이면 다시 쓰지 않습니다."""
+        data = str(text).encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path(digest)
+        if os.path.exists(path):
+            self.deduplicated += 1
+            return BLOB_PREFIX + digest
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # 스레드·프로세스마다 다른 임시 파일에 쓴 뒤 옮김 (같은 내용을 동시에 저장해도 안전)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with gzip.open(os.fdopen(fd, "wb"), "wb") as f:
+                f.write(data)
+            if os.path.exists(path):
+                # 그사이 다른 스레드가 같은 내용을 저장함. 내용 주소이므로 그대로 성공
+                self.deduplicated += 1
+            else:
+                os.replace(tmp_path, path)
+                self.stored += 1
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return BLOB_PREFIX + digest
+
+    def get(self, ref: str) -> str:
+        digest = ref[len(BLOB_PREFIX) :]
+        with gzip.open(self._path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def inline_or_ref(self, text: str, limit: int = INLINE_TEXT_LIMIT) -> str:
+        """limit보다 긴 텍스트는 저장소에 넣고 참조를, 아니면 그대로 반환합니다."""
+        if text is not None and len(text) > limit:
+            return self.put(text)
+        return text
+
+
+@lru_cache(maxsize=256)
+def _load(root: str, ref: str) -> str:
+    return BlobStore(root).get(ref)
+
+
+def resolve_text(value, root: str = BLOB_DIR):
+    """행의 값이 참조면 저장소에서 읽어 오고, 아니면 그대로 반환합니다."""
+    if is_blob_ref(value):
+        return _load(root, value)
+    return value
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+"""
+법령 크롤링 통합 실행기.
+
+작업(법령명, URL, 페이지 유형)은 소스 코드가 아니라 매니페스트 파일(jobs.yaml)에 둡니다.
+페이지 유형에 따라 목록형(div.lawcon '조'마다 링크 클릭) 또는 본문형(#content 전체)으로
+수집하며, 유형을 "auto"로 두면 페이지를 열어 보고 알아서 고릅니다. (law_crawling.py)
+
+  python crawl.py                                  # jobs.yaml의 enabled 작업 전체
+  python crawl.py --jobs jobs.yaml --workers 4
+  python crawl.py --only 중대재해처벌법 --only 안전보건규칙
+  python crawl.py --no-resume --cache-dir /tmp/law_cache
+  python crawl.py --no-resume --no-incremental --cache-dir ""   # 전부 처음부터 다시 수집
+  python crawl.py --replay ./data/archive          # 재생: 결과는 ./data/archive/output,
+                                                   # 링크 캐시는 --cache-dir를 줄 때만
+
+매니페스트 (YAML 또는 JSON):
+  jobs:
+    - name: 중대재해처벌법          # 출력: {output_dir}/{name}_data.csv
+      url: https://www.law.go.kr/...
+      type: list                    # list | content | auto (기본 auto)
+      enabled: false                # 선택: false면 --only로 지정할 때만 수집
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Dict, List, Optional
+
+import law_crawling
+
+try:
+    import yaml  # 선택: 없으면 JSON 매니페스트만 읽을 수 있음
+except ImportError:
+    yaml = None
+
+DEFAULT_MANIFEST = "jobs.yaml"
+PAGE_TYPES = ("auto", "list", "content")
+
+
+def load_manifest(path: str) -> List[Dict]:
+    """
+    매니페스트를 읽어 [{"name", "url", "type", "enabled"}, ...]를 반환합니다.
+    최상위가 목록이거나 {"jobs": [...]}인 YAML/JSON을 받습니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError(
+                    "YAML 매니페스트에는 PyYAML이 필요합니다: pip install pyyaml"
+                )
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    entries = data.get("jobs", []) if isinstance(data, dict) else data or []
+
+    jobs = []
+    seen = set()
+    for n, entry in enumerate(entries, 1):
+        name = str(entry.get("name") or "").strip()
+        url = str(entry.get("url") or "").strip()
+        page_type = entry.get("type") or "auto"
+        if not name or not url:
+            raise ValueError(f"{path}: {n}번째 작업에 name 또는 url이 없습니다.")
+        if page_type not in PAGE_TYPES:
+            raise ValueError(
+                f"{path}: '{name}'의 type '{page_type}'은(는) {PAGE_TYPES} 중 하나여야 합니다."
+            )
+        if name in seen:
+            raise ValueError(f"{path}: 작업 이름 '{name}'이(가) 중복됩니다.")
+        seen.add(name)
+        jobs.append(
+            {
+                "name": name,
+                "url": url,
+                "type": page_type,
+                "enabled": entry.get("enabled", True) is not False,
+            }
+        )
+    return jobs
+
+
+def select_jobs(jobs: List[Dict], only: Optional[List[str]] = None) -> List[Dict]:
+    """only가 없으면 enabled 작업 전체, 있으면 이름이 일치하는 작업만 (enabled 무시)."""
+    if not only:
+        return [job for job in jobs if job["enabled"]]
+    names = [name.strip() for value in only for name in value.split(",")]
+    by_name = {job["name"]: job for job in jobs}
+    unknown = [name for name in names if name and name not in by_name]
+    if unknown:
+        raise ValueError(f"매니페스트에 없는 작업: {', '.join(unknown)}")
+    return [by_name[name] for name in dict.fromkeys(names) if name]
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="법령 크롤링 통합 실행기")
+    parser.add_argument(
+        "--jobs", default=DEFAULT_MANIFEST, help="작업 매니페스트 (YAML/JSON)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=law_crawling.MAX_WORKERS,
+        help="브라우저 총수 (동시에 크롤링할 법령 수의 상한)",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="NAME",
+        help="이 이름의 작업만 실행 (여러 번 또는 쉼표로 구분)",
+    )
+    parser.add_argument(
+        "--resume",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="중단된 법령을 체크포인트부터 이어서 수집 "
+        "(--no-resume: 체크포인트를 버림. "
+        "본문이 바뀌지 않은 '조'의 재사용 여부는 --incremental)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action=argparse.BooleanOptionalAction,
+        default=law_crawling.INCREMENTAL_RECRAWL,
+        help="본문이 바뀌지 않은 '조'는 지난 결과를 재사용 "
+        "(--no-incremental: 모든 '조'를 다시 수집)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="링크 캐시 디렉터리 (빈 문자열이면 캐시를 쓰지 않음, "
+        "기본: --replay면 쓰지 않고 그 밖에는 "
+        f"{os.path.dirname(law_crawling.LINK_CACHE_PATH)})",
+    )
+    parser.add_argument(
+        "--output-dir",
+        default=None,
+        help="결과 파일 디렉터리 (기본: ./data, --replay면 {아카이브}/output)",
+    )
+    parser.add_argument(
+        "--format", choices=("csv", "jsonl"), default=law_crawling.OUTPUT_FORMAT
+    )
+    parser.add_argument(
+        "--engine", choices=("selenium", "cdp"), default=law_crawling.CRAWL_ENGINE
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=law_crawling.SHARDS_PER_LAW,
+        help="법령 하나를 나눠 클릭할 최대 구간 수 (남는 브라우저가 있을 때만 나눔)",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="ARCHIVE_DIR",
+        help="기록한 아카이브로 재생 (crawl_archive.py)",
+    )
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        jobs = select_jobs(load_manifest(args.jobs), args.only)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"❌ 작업 목록을 읽을 수 없습니다: {e}")
+        return 2
+    if not jobs:
+        print(f"⚠️ 실행할 작업이 없습니다. ({args.jobs})")
+        return 0
+
+    if args.cache_dir is None:
+        # 재생은 벤치마크용이므로 지난 실행의 캐시 적중이 측정에 섞이지 않게 함
+        args.cache_dir = (
+            "" if args.replay else os.path.dirname(law_crawling.LINK_CACHE_PATH)
+        )
+    cache_path = (
+        os.path.join(args.cache_dir, os.path.basename(law_crawling.LINK_CACHE_PATH))
+        if args.cache_dir
+        else None
+    )
+    if cache_path:
+        os.makedirs(args.cache_dir, exist_ok=True)
+    print(
+        f"📋 {len(jobs)}개 작업: "
+        + ", ".join(f"{job['name']}({job['type']})" for job in jobs)
+    )
+    results = law_crawling.run_jobs_parallel(
+        {job["name"]: job["url"] for job in jobs},
+        output_dir=args.output_dir,
+        max_workers=max(1, args.workers),
+        shards=max(1, args.shards),
+        cache_path=cache_path,
+        resume=args.resume,
+        incremental=args.incremental,
+        output_format=args.format,
+        engine=args.engine,
+        replay_archive=args.replay,
+        page_types={job["name"]: job["type"] for job in jobs},
+    )
+    print("\n🎉 모든 작업이 완료되었습니다.")
+    return 1 if any(r["error"] for r in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
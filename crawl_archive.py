@@ -0,0 +1,265 @@
+# -*- coding: utf-8 -*-
+"""
+오프라인 기록/재생 아카이브.
+
+record: 법령 본문 페이지와 그 페이지의 모든 링크 팝업을 브라우저로 열어,
+        렌더링이 끝난 HTML(스크립트 제거)을 아카이브 디렉터리에 저장합니다.
+        본문의 링크는 기록한 팝업 주소를 window.open으로 여는 onclick으로 바꿔 두므로,
+        재생할 때 law.go.kr의 스크립트가 없어도 클릭·HTTP 빠른 경로가 그대로 동작합니다.
+serve:  저장한 HTML을 로컬 HTTP 서버(ArchiveServer)로 제공합니다.
+        replay_url(원래 URL)로 바꾼 주소를 scrape_law_data_with_clicks에 넘기면
+        네트워크 없이 같은 결과를 얻으므로, 벤치마크·회귀 확인을 반복할 수 있습니다.
+
+아카이브 구조:
+  {archive_dir}/index.json    {"laws": {법령명: 원래 URL}, "pages": {경로?쿼리: 파일명}}
+  {archive_dir}/pages/*.html.gz
+
+  python crawl_archive.py record ./data/archive 중대재해처벌법 "<URL>"
+  python crawl_archive.py serve ./data/archive [포트]
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+from urllib.parse import quote, unquote, urlsplit
+
+from bs4 import BeautifulSoup
+
+REPLAY_HOST = "127.0.0.1"
+REPLAY_PORT = 8765
+
+# 본문 링크마다 팝업 URL을 알아내고(클릭은 window.open을 가로챈 상태로),
+# onclick을 그 주소를 여는 코드로 바꿉니다. 반환: 링크별 절대 URL ("" = 알 수 없음)
+RECORD_LINKS_JS = """
+var anchors = document.querySelectorAll(
+    'div.lawcon a.link, div.lawcon a[class*="sfon"]'
+);
+var captured = [];
+var origOpen = window.open;
+window.open = function (u) { captured.push(u ? String(u) : ""); return null; };
+var urls = [];
+try {
+    for (var i = 0; i < anchors.length; i++) {
+        var a = anchors[i];
+        var href = a.getAttribute("href") || "";
+        var target = "";
+        if (href && !/^(javascript:|#)/i.test(href)) {
+            target = href;
+        } else {
+            captured = [];
+            try { a.click(); } catch (e) {}
+            if (captured.length) target = captured[captured.length - 1];
+        }
+        if (!target) { urls.push(""); continue; }
+        var u = new URL(target, location.href);
+        a.setAttribute("href", "#");
+        a.setAttribute(
+            "onclick",
+            "window.open(" + JSON.stringify(u.pathname + u.search) + "); return false;"
+        );
+        urls.push(u.href);
+    }
+} finally {
+    window.open = origOpen;
+}
+return urls;
+"""
+
+
+def archive_key(url: str) -> str:
+    """URL을 아카이브 키(경로?쿼리)로 바꿉니다. 퍼센트 인코딩 차이는 통일합니다."""
+    parts = urlsplit(url)
+    key = parts.path or "/"
+    if parts.query:
+        key += "?" + parts.query
+    return quote(unquote(key), safe="/?&=:;,@+!$'()*~-._")
+
+
+def strip_scripts(html: str) -> str:
+    """재생 시 원본 사이트 스크립트가 실행되지 않도록 <script>를 제거합니다."""
+    soup = BeautifulSoup(html, "html.parser")
+    for script in soup.find_all("script"):
+        script.decompose()
+    return str(soup)
+
+
+class CrawlArchive:
+    def __init__(self, root: str):
+        self.root = root
+        self._pages_dir = os.path.join(root, "pages")
+        self._index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self.laws: Dict[str, str] = {}
+        self.pages: Dict[str, str] = {}
+        if os.path.exists(self._index_path):
+            with open(self._index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            self.laws = index.get("laws", {})
+            self.pages = index.get("pages", {})
+
+    def _save_index(self) -> None:
+        os.makedirs(self.root, exist_ok=True)
+        tmp_path = self._index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"laws": self.laws, "pages": self.pages},
+                f,
+                ensure_ascii=False,
+                indent=1,
+            )
+        os.replace(tmp_path, self._index_path)
+
+    def put(self, url: str, html: str) -> None:
+        key = archive_key(url)
+        filename = hashlib.sha1(key.encode("utf-8")).hexdigest() + ".html.gz"
+        os.makedirs(self._pages_dir, exist_ok=True)
+        with gzip.open(os.path.join(self._pages_dir, filename), "wb") as f:
+            f.write(html.encode("utf-8"))
+        with self._lock:
+            self.pages[key] = filename
+            self._save_index()
+
+    def get(self, key: str) -> Optional[bytes]:
+        filename = self.pages.get(archive_key(key))
+        if filename is None:
+            return None
+        with gzip.open(os.path.join(self._pages_dir, filename), "rb") as f:
+            return f.read()
+
+    def add_law(self, name: str, url: str) -> None:
+        with self._lock:
+            self.laws[name] = url
+            self._save_index()
+
+
+# ====================================
+# 기록
+# ====================================
+def record_law(archive: CrawlArchive, name: str, url: str, driver=None) -> int:
+    """
+    법령 본문과 모든 링크 팝업을 아카이브에 저장합니다. 저장한 팝업 수를 반환합니다.
+    팝업 URL을 알아낼 수 없는 링크는 기록하지 않습니다. (재생 시 그 링크는 오류로 남음)
+    """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    from law_crawling import create_driver
+    from popup_wait import PopupWaiter
+
+    own_driver = driver is None
+    if own_driver:
+        driver = create_driver()
+    try:
+        driver.get(url)
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.lawcon"))
+        )
+        popup_urls = driver.execute_script(RECORD_LINKS_JS)
+        archive.put(url, strip_scripts(driver.page_source))
+        archive.add_law(name, url)
+
+        targets = list(dict.fromkeys(u for u in popup_urls if u))
+        missing = sum(1 for u in popup_urls if not u)
+        print(
+            f"📼 {name}: 링크 {len(popup_urls)}개 → 팝업 {len(targets)}개 기록"
+            + (f" (URL을 알 수 없는 링크 {missing}개 제외)" if missing else "")
+        )
+        waiter = PopupWaiter()
+        for n, popup_url in enumerate(targets, 1):
+            if archive_key(popup_url) in archive.pages:
+                continue
+            driver.get(popup_url)
+            waiter.wait_for_content(driver)
+            archive.put(popup_url, strip_scripts(driver.page_source))
+            if n % 50 == 0 or n == len(targets):
+                print(f"⏳ 팝업 기록 {n}/{len(targets)}")
+        return len(targets)
+    finally:
+        if own_driver:
+            driver.quit()
+
+
+# ====================================
+# 재생
+# ====================================
+class ArchiveServer:
+    """아카이브를 제공하는 로컬 HTTP 서버 (백그라운드 스레드)."""
+
+    def __init__(
+        self, archive: CrawlArchive, host: str = REPLAY_HOST, port: int = REPLAY_PORT
+    ):
+        self.archive = archive
+        archive_ref = archive
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = archive_ref.get(self.path)
+                if body is None:
+                    self.send_error(404, "not in archive")
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), _Handler)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def replay_url(self, url: str) -> str:
+        """원래 URL을 이 서버의 주소로 바꿉니다."""
+        return self.base_url + archive_key(url)
+
+    def start(self) -> "ArchiveServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """현재 스레드에서 서버를 실행합니다. (Ctrl+C로 종료)"""
+        try:
+            self._server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self._server.server_close()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) >= 5 and sys.argv[1] == "record":
+        record_law(CrawlArchive(sys.argv[2]), sys.argv[3], sys.argv[4])
+    elif len(sys.argv) >= 3 and sys.argv[1] == "serve":
+        port = int(sys.argv[3]) if len(sys.argv) > 3 else REPLAY_PORT
+        server = ArchiveServer(CrawlArchive(sys.argv[2]), port=port)
+        for law_name, law_url in server.archive.laws.items():
+            print(f"{law_name}: {server.replay_url(law_url)}")
+        print(f"📼 재생 서버: {server.base_url} (Ctrl+C로 종료)")
+        server.serve_forever()
+    else:
+        print("사용법: python crawl_archive.py record <아카이브> <법령명> <URL>")
+        print("        python crawl_archive.py serve <아카이브> [포트]")
+        sys.exit(1)
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+법령 본문 변경 감지 (증분 재크롤링).
+
+크롤링이 성공하면 '조'마다 본문(div.lawcon) 텍스트의 해시와 그 '조'가 만든 행 수를
+{출력파일}.fingerprints.json 에 저장합니다. 다음 실행은 본문만 먼저 읽어 해시를 비교하고,
+해시가 같은 '조'는 이전 출력 파일의 행을 그대로 쓰며 링크를 클릭하지 않습니다.
+바뀐 '조'만 새로 수집하므로, 변경이 없는 법령은 본문을 한 번 여는 시간에 끝납니다.
+
+파일 형식 (JSON):
+  {"url": ..., "articles": [{"hash": sha1, "rows": 행 수}, ...]}   ← 출력 파일의 '조' 순서
+
+해시로 짝을 맞추므로 '조'가 추가·삭제되어 위치가 밀려도 나머지 '조'는 재사용됩니다.
+오류 행("오류 ...")이 있던 '조'는 재사용하지 않고 다시 수집합니다.
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import Counter, defaultdict, deque
+from itertools import islice
+from typing import Any, Dict, List
+
+from crawl_output import read_rows
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def fingerprint_path_for(output_filename: str) -> str:
+    return f"{output_filename}.fingerprints.json"
+
+
+def article_fingerprint(text: str) -> str:
+    """'조' 본문 텍스트의 해시. 공백 차이(줄바꿈, 들여쓰기)는 무시합니다."""
+    normalized = _WHITESPACE_RE.sub(" ", text or "").strip()
+    return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+
+def save_fingerprints(
+    path: str, url: str, fingerprints: List[str], row_counts: List[int]
+) -> None:
+    """성공한 실행의 '조'별 해시와 행 수를 저장합니다."""
+    data = {
+        "url": url,
+        "articles": [{"hash": h, "rows": n} for h, n in zip(fingerprints, row_counts)],
+    }
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+def load_unchanged_rows(
+    output_filename: str, url: str, fingerprints: List[str]
+) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    이번 본문 해시(fingerprints)와 지난 실행을 비교해, 변경되지 않은 '조'의 이전 행을 반환합니다.
+    반환: {'조' 순번: 행 목록}. 이전 기록이 없거나 출력 파일과 맞지 않으면 빈 dict
+    """
+    path = fingerprint_path_for(output_filename)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            previous = json.load(f)
+    except ValueError:
+        return {}
+    if previous.get("url") != url:
+        return {}
+
+    # 이번에 필요한 해시별 개수만큼만 보관하고 나머지 '조'의 행은 읽고 버림
+    wanted = Counter(fingerprints)
+    reusable = defaultdict(deque)
+    # 행이 하나도 없던 실행은 출력 파일을 남기지 않음
+    rows = iter(read_rows(output_filename) if os.path.exists(output_filename) else [])
+    mismatched = False
+    for article in previous.get("articles", []):
+        article_rows = list(islice(rows, article["rows"]))
+        if len(article_rows) != article["rows"]:
+            mismatched = True
+            break
+        h = article["hash"]
+        if len(reusable[h]) >= wanted[h]:
+            continue
+        if any(
+            str(r.get("링크텍스트 클릭시 데이터", "")).startswith("오류")
+            for r in article_rows
+        ):
+            continue
+        reusable[h].append(article_rows)
+    if not mismatched:
+        mismatched = next(rows, None) is not None
+    if hasattr(rows, "close"):
+        rows.close()
+    if mismatched:
+        # 출력 파일이 지워졌거나 다른 실행으로 덮어써짐
+        print(f"⚠️ 이전 출력과 변경 감지 기록이 맞지 않아 전체를 수집합니다: {path}")
+        return {}
+
+    unchanged = {}
+    for i, h in enumerate(fingerprints):
+        if reusable.get(h):
+            unchanged[i] = reusable[h].popleft()
+    return unchanged
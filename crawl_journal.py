@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+'조' 단위 체크포인트(저널).
+
+크롤링 중 '조' 하나가 끝날 때마다 그 '조'의 행들을 {출력파일}.journal.jsonl 에
+한 줄씩 추가합니다. 크롬이 죽거나 작업이 중단된 뒤 다시 실행하면
+저널에 기록된 '조'는 클릭하지 않고 저장된 행을 그대로 사용합니다.
+
+파일 형식 (JSON Lines):
+  {"url": ..., "total_articles": N}          ← 첫 줄(헤더)
+  {"article_index": i, "rows": [...]}        ← 완료된 '조'마다 한 줄
+
+URL이나 '조' 개수가 달라졌으면(페이지 개정 등) 이전 저널은 버리고 새로 시작합니다.
+CSV 저장이 끝나면 finish()로 저널을 지웁니다.
+"""
+
+import json
+import os
+import threading
+from typing import Any, Dict, List, Set
+
+
+def journal_path_for(output_filename: str) -> str:
+    return f"{output_filename}.journal.jsonl"
+
+
+class ArticleJournal:
+    def __init__(self, path: str, url: str, total_articles: int, resume: bool = True):
+        self.path = path
+        self.url = url
+        self.total_articles = total_articles
+        self._lock = threading.Lock()
+        self._done: Set[int] = set()
+        # 이전 실행에서 복원한 행. 출력에 한 번 넘기면 메모리에서 비움
+        self._restored: Dict[int, List[Dict[str, Any]]] = {}
+
+        if resume and os.path.exists(path):
+            self._load()
+        if not self._done:
+            self._start_new()
+
+    def _load(self) -> None:
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+        if not lines:
+            return
+        try:
+            header = json.loads(lines[0])
+        except ValueError:
+            return
+        if (
+            header.get("url") != self.url
+            or header.get("total_articles") != self.total_articles
+        ):
+            print(f"⚠️ 페이지가 달라져 이전 체크포인트를 버립니다: {self.path}")
+            return
+        valid_lines = [lines[0]]
+        for line in lines[1:]:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # 중단 시점에 반쯤 쓰인 마지막 줄은 무시
+                continue
+            self._done.add(int(entry["article_index"]))
+            self._restored[int(entry["article_index"])] = entry["rows"]
+            valid_lines.append(line if line.endswith("\n") else line + "\n")
+        if len(valid_lines) != len(lines) or not lines[-1].endswith("\n"):
+            # 깨진 줄 뒤에 이어 쓰지 않도록 정상 줄만 남겨 다시 씀
+            with open(self.path, "w", encoding="utf-8") as f:
+                f.writelines(valid_lines)
+
+    def _start_new(self) -> None:
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            header = {"url": self.url, "total_articles": self.total_articles}
+            f.write(json.dumps(header, ensure_ascii=False) + "\n")
+
+    @property
+    def completed(self) -> int:
+        return len(self._done)
+
+    def is_done(self, article_index: int) -> bool:
+        return article_index in self._done
+
+    def take_rows(self, article_index: int) -> List[Dict[str, Any]]:
+        """복원된 '조'의 행을 꺼냅니다. (한 번 꺼내면 메모리에서 비움)"""
+        return self._restored.pop(article_index, [])
+
+    def record(self, article_index: int, rows: List[Dict[str, Any]]) -> None:
+        """완료된 '조'의 행을 저널에 추가하고 바로 디스크에 반영합니다."""
+        line = json.dumps(
+            {"article_index": article_index, "rows": rows}, ensure_ascii=False
+        )
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._done.add(article_index)
+
+    def restore(self, entries: Dict[int, List[Dict[str, Any]]]) -> None:
+        """
+        다른 곳(예: 변경되지 않은 '조'의 이전 출력)에서 가져온 행을 완료로 기록합니다.
+        record와 같지만 여러 '조'를 한 번에 쓰고, 행은 take_rows로 꺼낼 수 있게 둡니다.
+        """
+        if not entries:
+            return
+        lines = [
+            json.dumps({"article_index": i, "rows": rows}, ensure_ascii=False) + "\n"
+            for i, rows in sorted(entries.items())
+        ]
+        with self._lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self._done.update(entries)
+            self._restored.update(entries)
+
+    def finish(self) -> None:
+        """최종 CSV 저장 후 저널을 지웁니다."""
+        with self._lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 성능 계측.
+
+링크 그룹마다 단계별 소요 시간(초)을 기록해, 법령 하나가 끝나면
+단계별 히스토그램을 {출력파일}.metrics.json 으로 저장하고
+가장 느린 링크 상위 N개를 출력합니다.
+
+단계 이름:
+  cache             캐시 적중으로 끝난 경우 조회 시간
+  http              HTTP 빠른 경로(요청 + 파싱)
+  click_to_window   클릭 → 새 창 전환
+  wait:<형식>       팝업 내용 대기 (jo/table/byl_list/byl_con/timeout)
+  scrape            팝업 텍스트 추출
+  close             팝업 창 닫기
+  total             링크 그룹 전체
+"""
+
+import heapq
+import json
+import os
+import threading
+from typing import Dict, List, Tuple
+
+# 히스토그램 구간 상한(초). 마지막 구간은 그 이상 전부
+BUCKET_BOUNDS = [0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 20.0]
+TOP_N_SLOWEST = 20
+
+
+def bucket_label(index: int) -> str:
+    if index < len(BUCKET_BOUNDS):
+        return f"<={BUCKET_BOUNDS[index]}s"
+    return f">{BUCKET_BOUNDS[-1]}s"
+
+
+class PhaseHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        index = len(BUCKET_BOUNDS)
+        for i, bound in enumerate(BUCKET_BOUNDS):
+            if seconds <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, q: float) -> float:
+        """구간 상한 기준의 근사 백분위수."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return BUCKET_BOUNDS[i] if i < len(BUCKET_BOUNDS) else self.max
+        return self.max
+
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "total_s": round(self.total, 3),
+            "mean_s": round(self.total / self.count, 3) if self.count else 0.0,
+            "p50_s": self.percentile(0.5),
+            "p90_s": self.percentile(0.9),
+            "max_s": round(self.max, 3),
+            "buckets": {bucket_label(i): c for i, c in enumerate(self.counts) if c},
+        }
+
+
+class CrawlMetrics:
+    """법령 하나의 링크별 단계 시간을 모읍니다. (샤드 스레드에서 함께 사용)"""
+
+    def __init__(self, top_n: int = TOP_N_SLOWEST):
+        self.top_n = top_n
+        self._phases: Dict[str, PhaseHistogram] = {}
+        self._slowest: List[Tuple[float, int, Dict]] = []
+        self._seq = 0
+        self._lock = threading.Lock()
+
+    def record(self, article_num: str, merged_text: str, timings: Dict[str, float]):
+        """링크 그룹 하나의 단계별 시간(timings)을 추가합니다."""
+        with self._lock:
+            for phase, seconds in timings.items():
+                self._phases.setdefault(phase, PhaseHistogram()).add(seconds)
+            total = timings.get("total", 0.0)
+            entry = {
+                "조": article_num,
+                "링크 텍스트": merged_text,
+                "timings_s": {k: round(v, 3) for k, v in timings.items()},
+            }
+            self._seq += 1
+            item = (total, self._seq, entry)
+            if len(self._slowest) < self.top_n:
+                heapq.heappush(self._slowest, item)
+            elif total > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, item)
+
+    def slowest(self) -> List[Dict]:
+        with self._lock:
+            return [e for _, _, e in sorted(self._slowest, reverse=True)]
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            phases = {name: h.to_dict() for name, h in sorted(self._phases.items())}
+        return {"phases": phases, "slowest_links": self.slowest()}
+
+    def save(self, path: str) -> None:
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def report(self, limit: int = 10) -> str:
+        data = self.to_dict()
+        lines = ["📊 단계별 소요 시간 (건수 / 합계 / p50 / p90 / 최대)"]
+        for name, h in data["phases"].items():
+            lines.append(
+                f"  {name:<16} {h['count']:>6}건 {h['total_s']:>9.1f}s "
+                f"{h['p50_s']:>6}s {h['p90_s']:>6}s {h['max_s']:>7.2f}s"
+            )
+        if data["slowest_links"]:
+            lines.append(
+                f"🐢 가장 느린 링크 상위 {min(limit, len(data['slowest_links']))}개"
+            )
+            for e in data["slowest_links"][:limit]:
+                lines.append(
+                    f"  {e['timings_s'].get('total', 0.0):>7.2f}s  "
+                    f"제{e['조']}조 '{e['링크 텍스트']}'"
+                )
+        return "\n".join(lines)
+
+
+def metrics_path_for(output_filename: str) -> str:
+    return f"{output_filename}.metrics.json"
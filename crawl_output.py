@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 결과를 만들어지는 즉시 파일에 쓰는 스트리밍 출력.
+
+- CSV: 기존 pandas.to_csv(index=False, encoding="utf-8-sig")와 같은 형식
+- JSONL: 한 줄에 한 행(JSON). 다음 단계에서 pandas 없이 read_rows()로 읽을 수 있음
+
+'조' 단위로 write_article(i, rows)를 호출하면 '조' 번호(i) 순서대로 파일에 씁니다.
+샤드가 동시에 끝나더라도 앞선 '조'가 끝날 때까지 뒤 '조'의 행은 출력 파일 옆의 임시
+파일(스필)에 적어 두고 메모리에는 위치만 보관하므로, 샤드를 써도 메모리 사용량은 일정하고
+출력 순서는 순차 실행과 같습니다. 한 '조'가 끝날 때마다 flush하므로
+크롤링 중에도 부분 결과를 열어 볼 수 있습니다.
+
+#lsLinkTable(표) 팝업은 텍스트와 함께 머리글·행·셀 구조를 "표 데이터" 열에 JSON으로
+저장합니다. (그 밖의 행은 빈 값)
+
+INLINE_TEXT_LIMIT보다 긴 값은 blob 저장소에 두고 "blob:<해시>" 참조만 쓸 수 있습니다.
+읽는 쪽은 blob_store.resolve_text()로 원문을 얻습니다.
+"""
+
+import csv
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+FIELDNAMES = ["조", "링크 텍스트", "링크텍스트 클릭시 데이터", "표 데이터"]
+
+
+class TableText(str):
+    """
+    표 팝업에서 추출한 텍스트. 문자열 그대로 쓰이면서 .table에 구조를 함께 가집니다.
+    table: {"caption": 표 위 제목, "header": [[셀, ...], ...], "rows": [[셀, ...], ...]}
+    셀: {"text": ...} (+ 합쳐진 셀이면 "colspan"/"rowspan")
+    """
+
+    def __new__(cls, text: str, table: Dict[str, Any]):
+        obj = super().__new__(cls, text)
+        obj.table = table
+        return obj
+
+
+def table_json(text: str) -> str:
+    """행의 "표 데이터" 열 값. 표 팝업이 아니면 ""."""
+    table = getattr(text, "table", None)
+    return json.dumps(table, ensure_ascii=False) if table else ""
+
+
+def make_row(article_num: str, merged_text: str, text: str, blob_store=None):
+    """
+    링크 그룹 하나의 출력 행을 만듭니다.
+    blob_store(BlobStore)가 있으면 긴 텍스트·표 구조는 참조("blob:...")로 바꿉니다.
+    """
+    table = table_json(text)
+    if blob_store is not None:
+        text = blob_store.inline_or_ref(text)
+        table = blob_store.inline_or_ref(table)
+    return {
+        "조": article_num,
+        "링크 텍스트": merged_text,
+        "링크텍스트 클릭시 데이터": str(text),
+        "표 데이터": table,
+    }
+
+
+def output_format_for(path: str) -> str:
+    """확장자로 출력 형식을 정합니다. (.jsonl → jsonl, 그 외 → csv)"""
+    return "jsonl" if path.lower().endswith(".jsonl") else "csv"
+
+
+class RowSink:
+    """'조' 순서를 맞춰 행을 스트리밍으로 쓰는 출력기 (CSV/JSONL 공통)."""
+
+    def __init__(self, path: str, fieldnames: List[str] = FIELDNAMES):
+        self.path = path
+        self.format = output_format_for(path)
+        self.fieldnames = fieldnames
+        self.rows_written = 0
+        # '조' 순번별 행 수 (변경 감지 기록용, crawl_fingerprint.py)
+        self.article_row_counts: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._next_index = 0
+        # 순서가 앞서 도착한 '조': 순번 → 스필 파일 안의 (위치, 길이)
+        self._pending: Dict[int, Tuple[int, int]] = {}
+        self._spill = None
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        if self.format == "csv":
+            self._file = open(path, "w", encoding="utf-8-sig", newline="")
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=fieldnames, lineterminator=os.linesep
+            )
+            self._writer.writeheader()
+        else:
+            self._file = open(path, "w", encoding="utf-8")
+            self._writer = None
+        self._file.flush()
+
+    def _write_rows(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            if self._writer is not None:
+                self._writer.writerow(row)
+            else:
+                self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self.rows_written += len(rows)
+
+    def _spill_rows(self, article_index: int, rows: List[Dict[str, Any]]) -> None:
+        if self._spill is None:
+            self._spill = tempfile.TemporaryFile(
+                dir=os.path.dirname(self.path) or ".", suffix=".spill"
+            )
+        data = json.dumps(rows, ensure_ascii=False).encode("utf-8")
+        self._spill.seek(0, os.SEEK_END)
+        self._pending[article_index] = (self._spill.tell(), len(data))
+        self._spill.write(data)
+
+    def _take_spilled(self, article_index: int) -> List[Dict[str, Any]]:
+        offset, size = self._pending.pop(article_index)
+        self._spill.seek(offset)
+        return json.loads(self._spill.read(size).decode("utf-8"))
+
+    def _close_spill(self) -> None:
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+    def write_article(self, article_index: int, rows: List[Dict[str, Any]]) -> None:
+        """
+        '조' 하나의 행들을 넘깁니다. 앞 번호가 모두 도착한 만큼만 파일에 쓰고,
+        먼저 도착한 뒤 번호의 행은 스필 파일에 적어 둡니다.
+        """
+        with self._lock:
+            self.article_row_counts[article_index] = len(rows)
+            if article_index != self._next_index:
+                self._spill_rows(article_index, rows)
+                return
+            self._write_rows(rows)
+            self._next_index += 1
+            while self._next_index in self._pending:
+                self._write_rows(self._take_spilled(self._next_index))
+                self._next_index += 1
+            self._file.flush()
+
+    def close(self) -> int:
+        """남은 행을 번호순으로 모두 쓰고 닫습니다. 쓴 행 수를 반환합니다."""
+        with self._lock:
+            for index in sorted(self._pending):
+                self._write_rows(self._take_spilled(index))
+            self._close_spill()
+            self._file.close()
+        return self.rows_written
+
+    def discard(self) -> None:
+        """행이 하나도 없을 때 빈 파일을 지웁니다."""
+        self._close_spill()
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def read_rows(path: str) -> Iterator[Dict[str, Any]]:
+    """CSV/JSONL 출력 파일을 한 행씩 읽습니다. (pandas 불필요)"""
+    if output_format_for(path) == "jsonl":
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, "r", encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+요청 속도 제한과 재시도 정책.
+
+- TokenBucket: 모든 워커(법령·샤드·HTTP 빠른 경로)가 함께 쓰는 토큰 버킷.
+  사이트에 요청(팝업 클릭, HTTP 요청, 본문 열기)을 보내기 전에 acquire()로 토큰을 받습니다.
+  실제 요청이 성공하면 속도를 조금씩 올리고(reward), 사이트가 막았다는 신호(429/503,
+  차단 안내 페이지)가 오면 절반으로 줄여(penalize) 막기 직전의 속도를 유지합니다. (AIMD)
+  죽은 링크·알 수 없는 형식 같은 실패는 속도와 무관하므로 속도를 바꾸지 않습니다.
+- is_transient: 재시도하면 성공할 수 있는 실패(시간 초과, 연결 오류, 429/5xx 등)를 구분합니다.
+- is_throttled: 그중 속도를 줄여야 하는 차단 신호만 구분합니다.
+- RetryPolicy: 지수 백오프(+지터) 대기 시간. 일시 오류로 실패한 링크는 법령(구간) 끝의
+  재시도 큐에서 이 정책대로 다시 시도합니다.
+"""
+
+import random
+import threading
+import time
+
+import requests
+from selenium.common.exceptions import (
+    NoSuchWindowException,
+    TimeoutException,
+    WebDriverException,
+)
+
+# 차단·서버 과부하로 보고 재시도할 HTTP 상태 코드
+TRANSIENT_STATUS = {408, 429, 500, 502, 503, 504}
+# 사이트가 요청을 막았다는 신호로 보고 속도를 줄일 HTTP 상태 코드
+THROTTLE_STATUS = {429, 503}
+# 팝업·응답 본문에 이 문구가 있으면 차단 안내 페이지로 봄
+THROTTLE_PAGE_MARKERS = (
+    "Too Many Requests",
+    "Service Unavailable",
+    "과도한 요청",
+    "비정상적인 접근",
+    "접근이 제한",
+    "접속이 제한",
+)
+# WebDriver 오류 메시지 중 네트워크·브라우저 일시 오류로 보는 문구
+TRANSIENT_MESSAGES = ("net::ERR_", "timed out", "timeout", "disconnected")
+
+
+class TransientError(Exception):
+    """
+    재시도하면 성공할 수 있는 실패.
+    str(e)는 재시도를 모두 실패했을 때 행에 남길 문구입니다.
+    """
+
+
+class ThrottledError(TransientError):
+    """사이트가 요청을 막은 실패(429/503, 차단 안내 페이지). 재시도하고 속도도 줄입니다."""
+
+
+def is_throttle_page(text: str) -> bool:
+    return bool(text) and any(marker in text for marker in THROTTLE_PAGE_MARKERS)
+
+
+def is_throttled(exc: BaseException) -> bool:
+    """예외가 속도를 줄여야 하는 차단 신호인지 판단합니다."""
+    if isinstance(exc, ThrottledError):
+        return True
+    response = getattr(exc, "response", None)
+    return getattr(response, "status_code", None) in THROTTLE_STATUS
+
+
+def is_transient(exc: BaseException) -> bool:
+    """예외가 일시적인(재시도할 만한) 실패인지 판단합니다."""
+    if isinstance(exc, TransientError):
+        return True
+    response = getattr(exc, "response", None)
+    status = getattr(response, "status_code", None)
+    if status is not None:
+        return status in TRANSIENT_STATUS
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    if isinstance(exc, (TimeoutException, NoSuchWindowException)):
+        return True
+    if isinstance(exc, WebDriverException):
+        return any(m in str(exc) for m in TRANSIENT_MESSAGES)
+    return False
+
+
+class TokenBucket:
+    """스레드 간 공유하는 적응형 토큰 버킷 (초당 rate개, 최대 burst개 누적)."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 5,
+        min_rate: float = 0.5,
+        max_rate: float = None,
+        increase: float = 0.1,
+    ):
+        self.rate = float(rate)
+        self.burst = max(1, int(burst))
+        self.min_rate = min_rate
+        self.max_rate = max_rate if max_rate is not None else self.rate * 2
+        self.increase = increase
+        self.throttled = 0
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """토큰 하나를 받을 때까지 기다립니다."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def reward(self) -> None:
+        """요청이 성공하면 속도를 조금 올립니다."""
+        with self._lock:
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def penalize(self) -> None:
+        """차단·일시 오류가 나면 속도를 절반으로 줄이고 쌓인 토큰을 버립니다."""
+        with self._lock:
+            self._refill()
+            self.rate = max(self.min_rate, self.rate / 2)
+            self._tokens = 0.0
+            self.throttled += 1
+
+
+class RetryPolicy:
+    """일시 오류 재시도 횟수와 지수 백오프 대기 시간."""
+
+    def __init__(
+        self, max_attempts: int = 3, base_delay: float = 2.0, max_delay: float = 60.0
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt: int) -> float:
+        """attempt(1부터)번째 재시도 전 대기 시간(초). 워커끼리 겹치지 않게 지터를 섞습니다."""
+        backoff = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return backoff * random.uniform(0.5, 1.0)
@@ -1,234 +1,1151 @@
-import pandas as pd
 import re
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
+from annex_index import AnnexIndex, annex_not_found_text, annex_scope, link_annex_key
+from blob_store import BlobStore
+from crawl_archive import ArchiveServer, CrawlArchive
+from crawl_fingerprint import (
+    article_fingerprint,
+    fingerprint_path_for,
+    load_unchanged_rows,
+    save_fingerprints,
+)
+from crawl_journal import ArticleJournal, journal_path_for
+from crawl_metrics import CrawlMetrics, metrics_path_for
+from crawl_output import RowSink, TableText, make_row
+from crawl_throttle import (
+    RetryPolicy,
+    ThrottledError,
+    TokenBucket,
+    TransientError,
+    is_throttle_page,
+    is_transient,
+)
+from link_cache import LinkCache, anchor_target, make_link_key
+from link_grouping import group_links, merge_group_text
+from link_http import HttpLinkResolver, find_annex_option
+from popup_wait import PopupWaiter
+from resource_blocking import apply_chrome_options, block_requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import os
+import sys
+import threading
 import time
 
+try:
+    import psutil  # 선택: 있으면 크롬 프로세스 전체의 메모리로 재시작 여부를 판단
+except ImportError:
+    psutil = None
 
 # ==============================================================================
-# 기존 scrape_law_data_with_clicks 함수는 수정 없이 그대로 사용합니다.
-# (이하 생략)
+# 병렬 실행 설정
 # ==============================================================================
-def get_sfon_number(element):
-    """링크 요소의 클래스에서 sfon 번호를 정수로 추출합니다. 없으면 0을 반환합니다."""
-    class_attr = element.get_attribute("class") or ""
-    match = re.search(r"sfon(\d+)", class_attr)
-    return int(match.group(1)) if match else 0
+# 동시에 크롤링할 법령 수(= 동시에 띄울 헤드리스 크롬 수)
+MAX_WORKERS = 3
+# 법령 하나를 몇 개의 브라우저로 나눠 클릭할지 (1이면 기존처럼 순차 처리)
+SHARDS_PER_LAW = 1
+# 팝업 창을 여는 대신 링크 대상 페이지를 HTTP로 직접 가져올지 (실패 시 클릭 방식으로 대체)
+USE_HTTP_FAST_PATH = True
+# 링크 대상 내용 캐시(SQLite). None이면 캐시를 쓰지 않음
+LINK_CACHE_PATH = "./data/cache/link_cache.sqlite"
+LINK_CACHE_TTL_DAYS = 7
+# 결과 파일 형식: "csv" 또는 "jsonl" (JSONL은 pandas 없이 다음 단계에서 읽을 수 있음)
+OUTPUT_FORMAT = "csv"
+# 지난 실행과 본문이 같은 '조'는 이전 결과를 재사용하고 바뀐 '조'만 다시 수집
+INCREMENTAL_RECRAWL = True
+# 크롤링 엔진: "selenium"(기본) 또는 "cdp"(asyncio + 여러 탭 동시 처리, async_crawler.py)
+CRAWL_ENGINE = "selenium"
+# 기록해 둔 아카이브(crawl_archive.py)로 재생할 때의 경로. None이면 실제 사이트를 크롤링
+REPLAY_ARCHIVE_DIR = None
+# 모든 워커가 함께 지킬 초기 요청 속도(초당). 성공하면 서서히 올리고 차단되면 절반으로 줄임.
+# None이면 제한하지 않음
+RATE_LIMIT_PER_SECOND = 4.0
+# 일시 오류(시간 초과, 429/5xx 등)로 실패한 링크를 법령 끝에서 다시 시도할 횟수
+RETRY_ATTEMPTS = 3
+# 브라우저 재시작 기준: 연 페이지(법령 본문 + 팝업 창) 수, 처음보다 늘어난 메모리(MB).
+# 법령 하나가 끝나 풀에 반납될 때 확인합니다. None이면 해당 기준을 쓰지 않음
+RECYCLE_AFTER_PAGES = 3000
+RECYCLE_MEMORY_GROWTH_MB = 1500
+# 이미지·폰트·방문 통계 요청을 막고 DOMContentLoaded에서 페이지 로딩을 끝냄 (resource_blocking.py)
+BLOCK_RESOURCES = True
 
 
-def scrape_law_data_with_clicks(url, output_filename):
+# ==============================================================================
+# 드라이버 관리
+# ==============================================================================
+_chromedriver_path = None
+_chromedriver_lock = threading.Lock()
+
+
+def get_chromedriver_path():
     """
-    '시행령', '시행규칙' 페이지용 크롤링 함수 (진행률 표시 기능 추가)
+    chromedriver 경로를 프로세스당 한 번만 확인합니다.
+    (ChromeDriverManager().install()은 호출마다 버전 조회를 하므로 결과를 재사용)
     """
-    driver = None
-    print("-" * 50)
-    print(f"▶️ 작업을 시작합니다 (유형 1 - 목록형): {output_filename}")
+    global _chromedriver_path
+    with _chromedriver_lock:
+        if _chromedriver_path is None:
+            _chromedriver_path = ChromeDriverManager().install()
+        return _chromedriver_path
+
+
+def create_driver(block_resources=BLOCK_RESOURCES):
+    """
+    크롤링용 헤드리스 크롬 드라이버를 생성합니다.
+    block_resources=True면 텍스트 수집에 필요 없는 자원을 막습니다. (resource_blocking.py)
+    """
+    service = Service(get_chromedriver_path())
+    options = webdriver.ChromeOptions()
+    options.add_argument("--headless")
+    options.add_argument("--window-size=1920x1080")
+    options.add_argument("--log-level=3")
+    if block_resources:
+        apply_chrome_options(options)
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.maximize_window()
+    if block_resources:
+        block_requests(driver)
+    driver.pages_opened = 0
+    driver.baseline_memory_mb = browser_memory_mb(driver)
+    return driver
+
+
+def count_page(driver, pages=1):
+    """드라이버가 연 페이지 수를 셉니다. (재시작 기준)"""
+    driver.pages_opened = getattr(driver, "pages_opened", 0) + pages
+
+
+def browser_memory_mb(driver):
+    """
+    브라우저의 메모리 사용량(MB)을 반환합니다. 측정할 수 없으면 None.
+    psutil이 있으면 chromedriver 아래 크롬 프로세스 전체의 RSS,
+    없으면 현재 탭의 JS 힙 크기를 사용합니다.
+    """
+    if psutil is not None:
+        try:
+            root = psutil.Process(driver.service.process.pid)
+            processes = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in processes) / 2**20
+        except (psutil.Error, AttributeError):
+            pass
     try:
-        service = Service(ChromeDriverManager().install())
-        options = webdriver.ChromeOptions()
-        options.add_argument("--headless")
-        options.add_argument("--window-size=1920x1080")
-        options.add_argument("--log-level=3")
-        driver = webdriver.Chrome(service=service, options=options)
-        driver.maximize_window()
-        driver.get(url)
-        wait = WebDriverWait(driver, 20)
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div.lawcon")))
-        law_articles = driver.find_elements(By.CSS_SELECTOR, "div.lawcon")
-
-        # ==================================================================
-        # 수정된 부분 1: 전체 '조' 개수 저장
-        # ==================================================================
-        total_articles = len(law_articles)
-        final_data_list = []
-        print(f"✅ 총 {total_articles}개의 '조'를 발견했습니다. 분석을 시작합니다.")
-        print("⚠️ 이 작업은 모든 링크를 클릭하므로 시간이 매우 오래 걸릴 수 있습니다.")
+        heap = driver.execute_script(
+            "return window.performance.memory"
+            " ? window.performance.memory.usedJSHeapSize : null;"
+        )
+    except WebDriverException:
+        return None
+    return heap / 2**20 if heap else None
+
+
+def needs_recycle(driver):
+    """연 페이지 수나 메모리 증가량이 기준을 넘었으면 재시작 사유를, 아니면 None을 반환합니다."""
+    pages = getattr(driver, "pages_opened", 0)
+    if RECYCLE_AFTER_PAGES and pages >= RECYCLE_AFTER_PAGES:
+        return f"페이지 {pages}개"
+    baseline = getattr(driver, "baseline_memory_mb", None)
+    if RECYCLE_MEMORY_GROWTH_MB and baseline is not None:
+        current = browser_memory_mb(driver)
+        if current is not None and current - baseline >= RECYCLE_MEMORY_GROWTH_MB:
+            return f"메모리 {baseline:.0f}MB → {current:.0f}MB"
+    return None
 
-        # ==================================================================
-        # 수정된 부분 2: enumerate를 사용하여 인덱스(i) 추가
-        # ==================================================================
-        for i, article_div in enumerate(law_articles):
-            article_num = ""  # article_num 초기화
+
+class DriverPool:
+    """
+    재사용 가능한 WebDriver 워커 풀.
+    최대 size개의 브라우저만 띄우고, 작업이 끝난 드라이버는 다음 법령에 재사용합니다.
+    반납할 때 needs_recycle 기준을 넘은 드라이버는 종료하고, 다음 acquire에서 새로 띄웁니다.
+    """
+
+    def __init__(self, size=MAX_WORKERS):
+        self.size = max(1, int(size))
+        self._idle = []  # 최근에 반납한 드라이버부터 재사용 (LIFO)
+        self._drivers = []
+        self._creating = 0  # 생성 중인 드라이버 수 (자리 예약)
+        # 반납·종료·생성 실패마다 notify해, 자리가 나면 기다리던 acquire가 깨어남
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        """유휴 드라이버를 꺼내고, 없으면 한도 내에서 새로 만들거나 자리가 날 때까지 기다립니다."""
+        with self._cond:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._drivers) + self._creating < self.size:
+                    self._creating += 1
+                    break
+                self._cond.wait()
+        return self._create()
+
+    def try_acquire(self):
+        """기다리지 않는 acquire. 유휴 드라이버도 빈 자리도 없으면 None (샤드용)"""
+        with self._cond:
+            if self._idle:
+                return self._idle.pop()
+            if len(self._drivers) + self._creating >= self.size:
+                return None
+            self._creating += 1
+        return self._create()
+
+    def _create(self):
+        """acquire/try_acquire가 자리를 예약한 뒤 드라이버를 띄웁니다."""
+        try:
+            driver = create_driver()
+        except Exception:
+            with self._cond:
+                self._creating -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._creating -= 1
+            self._drivers.append(driver)
+        return driver
+
+    def release(self, driver, broken=False):
+        """드라이버를 반납합니다. 오류가 났거나 재시작 기준을 넘은 드라이버는 종료합니다."""
+        if not broken:
+            reason = needs_recycle(driver)
+            if reason:
+                print(f"♻️ 브라우저를 재시작합니다 ({reason})")
+                broken = True
+        if broken:
             try:
-                title_element = article_div.find_element(By.CSS_SELECTOR, "p.pty1_p4")
-                match = re.search(r"제(\d+(?:의\d+)?)조", title_element.text)
-                article_num = match.group(1) if match else ""
-            except:
-                continue
-
-            # article_num이 없으면 이번 반복은 건너뜀
-            if not article_num:
-                continue
-
-            # --- (기존 링크 분석 및 클릭 로직은 그대로 유지) ---
-            p_tags_in_article = article_div.find_elements(By.TAG_NAME, "p")
-            for p_tag in p_tags_in_article:
-                links = p_tag.find_elements(By.CSS_SELECTOR, 'a.link, a[class*="sfon"]')
-                if not links:
-                    continue
-
-                link_groups = []
-                current_group = []
-                for link in links:
-                    if not current_group:
-                        current_group = [link]
-                        continue
+                driver.quit()
+            except Exception:
+                pass
+            with self._cond:
+                if driver in self._drivers:
+                    self._drivers.remove(driver)
+                self._cond.notify()
+            return
+        with self._cond:
+            self._idle.append(driver)
+            self._cond.notify()
+
+    def close(self):
+        """풀의 모든 드라이버를 종료합니다."""
+        with self._cond:
+            drivers = list(self._drivers)
+            self._drivers = []
+            self._idle = []
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+
+# ==============================================================================
+# 크롤링 함수
+# ==============================================================================
+# 본문의 모든 div.lawcon을 한 번의 스크립트 호출로 읽어 오는 스크립트.
+# '조'마다 제목(p.pty1_p4), 본문 텍스트(변경 감지용), 문단(p)별 링크의 class/텍스트/요소를 반환합니다.
+# (링크마다 find_elements/get_attribute/.text를 부르던 WebDriver 왕복을 없앰)
+SNAPSHOT_ARTICLES_JS = """
+var result = [];
+var divs = document.querySelectorAll("div.lawcon");
+for (var i = 0; i < divs.length; i++) {
+    var title = divs[i].querySelector("p.pty1_p4");
+    var paragraphs = [];
+    var ps = divs[i].getElementsByTagName("p");
+    for (var j = 0; j < ps.length; j++) {
+        var anchors = ps[j].querySelectorAll('a.link, a[class*="sfon"]');
+        if (!anchors.length) continue;
+        var links = [];
+        for (var k = 0; k < anchors.length; k++) {
+            links.push({
+                cls: anchors[k].getAttribute("class") || "",
+                text: (anchors[k].innerText || "").trim(),
+                el: anchors[k]
+            });
+        }
+        paragraphs.push(links);
+    }
+    result.push({
+        title: title ? title.innerText : null,
+        text: divs[i].innerText,
+        paragraphs: paragraphs
+    });
+}
+return result;
+"""
+
+
+def get_article_num(article):
+    """'조' 제목(p.pty1_p4)에서 '조' 번호(예: 4, 4의2)를 추출합니다. 없으면 ""."""
+    if article["title"] is None:
+        return ""
+    match = re.search(r"제(\d+(?:의\d+)?)조", article["title"])
+    return match.group(1) if match else ""
+
+
+def iter_article_link_groups(article):
+    """'조' 하나의 모든 문단을 돌며 링크 그룹을 문서 순서대로 반환합니다."""
+    for links in article["paragraphs"]:
+        for group in group_links(links):
+            yield group
+
+
+def scrape_link_group(
+    driver,
+    waiter,
+    group,
+    http_resolver=None,
+    link_cache=None,
+    page_url="",
+    timings=None,
+    limiter=None,
+    annex_index=None,
+):
+    """
+    링크 그룹 하나의 대상 내용을 수집합니다.
+    annex_index(AnnexIndex)에 이미 목록이 있는 별표·서식 링크는 팝업 없이 바로 찾습니다.
+    link_cache가 있으면 먼저 캐시를 조회하고, 새로 수집한 내용은 캐시에 저장합니다.
+    timings(dict)를 넘기면 단계별 소요 시간(초)을 채웁니다. (crawl_metrics.py)
+    limiter(TokenBucket)가 있으면 사이트에 요청하기 전에 토큰을 받습니다.
+    일시 오류면 TransientError를 올립니다. (crawl_throttle.py)
+    반환: (병합된 링크 텍스트, 새 창 데이터)
+    """
+    merged_text = merge_group_text(group)
+    element_to_click = group[-1]["el"]
+    # 캐시 키와 별표·서식 색인은 모두 앵커의 onclick/href로 대상을 식별함 (왕복 1회)
+    target = None
+    if link_cache is not None or (
+        annex_index is not None and link_annex_key(merged_text) is not None
+    ):
+        target = anchor_target(driver, element_to_click)
+    scope = annex_scope(*target) if target is not None else None
+    if annex_index is not None:
+        started = time.perf_counter()
+        annex_text = annex_index.lookup(merged_text, scope)
+        if annex_text is not None:
+            if timings is not None:
+                timings["annex"] = time.perf_counter() - started
+            return merged_text, annex_text
+    cache_key = None
+    if link_cache is not None:
+        started = time.perf_counter()
+        cache_key = make_link_key(*target, page_url, merged_text)
+        cached_text = link_cache.get(cache_key)
+        if cached_text is not None:
+            if timings is not None:
+                timings["cache"] = time.perf_counter() - started
+            return merged_text, cached_text
+
+    new_window_text = fetch_link_target(
+        driver,
+        waiter,
+        element_to_click,
+        merged_text,
+        http_resolver,
+        timings,
+        limiter,
+        annex_index,
+        scope,
+    )
+    if link_cache is not None:
+        link_cache.put(cache_key, new_window_text)
+    return merged_text, new_window_text
+
+
+# #lsLinkTable 팝업을 한 번의 스크립트 호출로 읽는 스크립트.
+# 기존 형식의 텍스트(표 위 제목 + 머리글 + 본문 문단, 문단이 없으면 tbody 전체)와
+# 머리글·행·셀 구조를 함께 반환합니다. 표가 없으면 null
+LINK_TABLE_JS = """
+var table = document.getElementById("lsLinkTable");
+if (!table) return null;
+var top = document.getElementById("lsLinkTableTop");
+var thead = table.tHead;
+var tbody = table.tBodies.length ? table.tBodies[0] : null;
+function textOf(el) { return el ? (el.innerText || "").trim() : ""; }
+function rowsOf(section) {
+    if (!section) return [];
+    return Array.prototype.map.call(section.rows, function (tr) {
+        return Array.prototype.map.call(tr.cells, function (td) {
+            var cell = {text: textOf(td)};
+            if (td.colSpan > 1) cell.colspan = td.colSpan;
+            if (td.rowSpan > 1) cell.rowspan = td.rowSpan;
+            return cell;
+        });
+    });
+}
+var texts = [];
+var caption = textOf(top);
+if (caption) texts.push(caption);
+if (textOf(thead)) texts.push(textOf(thead));
+var bodyTexts = [];
+var ps = table.getElementsByTagName("p");
+for (var i = 0; i < ps.length; i++) {
+    if (ps[i].closest("thead")) continue;
+    var t = (ps[i].textContent || "").trim();
+    if (t) bodyTexts.push(t);
+}
+if (bodyTexts.length) texts.push(bodyTexts.join("\\n"));
+else if (textOf(tbody)) texts.push(textOf(tbody));
+return {
+    text: texts.join("\\n").trim(),
+    table: {caption: caption, header: rowsOf(thead), rows: rowsOf(tbody)}
+};
+"""
+
+
+def extract_link_table_text(driver):
+    """
+    #lsLinkTable 팝업(표)에서 머리글과 본문 문단 텍스트를 모읍니다.
+    반환값(TableText)은 .table에 머리글·행·셀 구조를 함께 가집니다. (crawl_output.py)
+    """
+    try:
+        WebDriverWait(driver, 5).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#lsLinkTable p"))
+        )
+    except Exception:
+        pass
+    try:
+        extracted = driver.execute_script(LINK_TABLE_JS)
+    except Exception:
+        extracted = None
+    if not extracted:
+        return ""
+    return TableText(extracted["text"], extracted["table"])
+
+
+# select 요소의 모든 option을 [텍스트, value] 목록으로 한 번에 읽는 스크립트
+SELECT_OPTIONS_JS = """
+return Array.prototype.map.call(arguments[0].options, function (o) {
+    return [o.text, o.value];
+});
+"""
+
+
+def extract_popup_text(
+    driver, kind, element, merged_text, annex_index=None, scope=None
+):
+    """
+    PopupWaiter가 찾은 형식(kind)에 맞춰 팝업 텍스트를 추출합니다.
+    별표·서식 목록은 annex_index가 있으면 팝업 대상 식별자(scope)별로 색인에 넣어
+    같은 법령의 다음 링크가 재사용합니다. (annex_index.py)
+    """
+    if kind == "jo":
+        return element.text.strip()
+    if kind == "table":
+        return extract_link_table_text(driver)
+    if kind == "byl_list":
+        options = [tuple(o) for o in driver.execute_script(SELECT_OPTIONS_JS, element)]
+        if annex_index is not None:
+            return annex_index.learn(merged_text, options, scope)
+        found_text = find_annex_option(merged_text, [text for text, _ in options])
+        return found_text or annex_not_found_text(merged_text)
+    if kind == "byl_con":
+        return (
+            element.text.strip()
+            or "정보: 텍스트 데이터 없음 (이미지 전용 페이지일 수 있습니다)."
+        )
+    return "오류: 새 창에서 알려진 데이터 형식(#linkedJoContent, Table, #bylList, .byl_con)을 찾을 수 없습니다."
+
+
+def fetch_link_target(
+    driver,
+    waiter,
+    element_to_click,
+    merged_text,
+    http_resolver=None,
+    timings=None,
+    limiter=None,
+    annex_index=None,
+    scope=None,
+):
+    """
+    링크를 클릭해 새 창의 내용을 수집합니다.
+    http_resolver가 있으면 먼저 새 창 없이 HTTP로 가져오고, 실패할 때만 클릭합니다.
+    새 창에서는 알려진 형식을 한꺼번에 기다려 먼저 나타난 형식으로 처리합니다. (popup_wait.py)
+    연결 오류 등 일시 오류는 행에 오류로 남기지 않고 TransientError로, 차단 안내 페이지는
+    ThrottledError로 올려 재시도 큐에서 다시 시도하게 합니다.
+    새 창이 열리지 않는 링크(죽은 링크)와 알 수 없는 형식은 다시 눌러도 같으므로 행에 오류로 남깁니다.
+    scope는 별표·서식 색인에 쓰는 팝업 대상 식별자입니다. (annex_index.annex_scope)
+    """
+    if timings is None:
+        timings = {}
+    if http_resolver is not None:
+        if limiter is not None:
+            limiter.acquire()
+        started = time.perf_counter()
+        new_window_text = http_resolver.resolve(
+            driver, element_to_click, merged_text, annex_index, scope
+        )
+        timings["http"] = time.perf_counter() - started
+        if new_window_text is not None:
+            return new_window_text
+
+    new_window_text = ""
+    if limiter is not None:
+        limiter.acquire()
+    original_window = driver.current_window_handle
+    try:
+        started = time.perf_counter()
+        driver.execute_script("arguments[0].click();", element_to_click)
+        try:
+            WebDriverWait(driver, waiter.max_timeout).until(
+                EC.number_of_windows_to_be(2)
+            )
+        except TimeoutException:
+            return "오류: 링크를 클릭해도 새 창이 열리지 않았습니다."
+        count_page(driver)
+        for handle in driver.window_handles:
+            if handle != original_window:
+                driver.switch_to.window(handle)
+                break
+        timings["click_to_window"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        kind, element = waiter.wait_for_content(driver)
+        timings[f"wait:{kind or 'timeout'}"] = time.perf_counter() - started
+
+        started = time.perf_counter()
+        new_window_text = extract_popup_text(
+            driver, kind, element, merged_text, annex_index, scope
+        )
+        timings["scrape"] = time.perf_counter() - started
+        if kind is None and is_throttle_page(
+            driver.execute_script(
+                "return document.body ? document.body.innerText : '';"
+            )
+        ):
+            raise ThrottledError(new_window_text)
+    except TransientError:
+        raise
+    except Exception as e:
+        if is_transient(e):
+            raise TransientError(f"오류 발생 또는 텍스트 수집 실패: {e}") from e
+        new_window_text = f"오류 발생 또는 텍스트 수집 실패: {e}"
+    finally:
+        started = time.perf_counter()
+        while len(driver.window_handles) > 1:
+            for handle in driver.window_handles:
+                if handle != original_window:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                    break
+            time.sleep(0.1)
+        driver.switch_to.window(original_window)
+        timings["close"] = time.perf_counter() - started
+    return new_window_text
+
+
+def load_law_articles(driver, url, limiter=None, page_type="list"):
+    """
+    법령 페이지를 열고 '조' 스냅샷 목록을 반환합니다.
+    스냅샷: [{"title": 제목 or None, "text": 본문,
+             "paragraphs": [[{"cls", "text", "el"}, ...], ...]}]
+    page_type: "list"(div.lawcon 목록형), "content"(#content 본문형), "auto"(목록형이
+    없으면 본문형). 본문형 페이지면 None을 반환합니다.
+    """
+    if limiter is not None:
+        limiter.acquire()
+    driver.get(url)
+    count_page(driver)
+    if page_type == "content":
+        return None
+    try:
+        WebDriverWait(driver, 20).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.lawcon"))
+        )
+    except TimeoutException:
+        if page_type == "auto" and driver.find_elements(By.ID, "content"):
+            return None
+        raise
+    return driver.execute_script(SNAPSHOT_ARTICLES_JS)
+
 
-                    prev_link = current_group[-1]
-                    prev_sfon_num = get_sfon_number(prev_link)
-                    current_sfon_num = get_sfon_number(link)
-                    prev_class = prev_link.get_attribute("class") or ""
-                    current_class = link.get_attribute("class") or ""
-
-                    break_group = False
-                    if (
-                        prev_sfon_num == 0
-                        or current_sfon_num == 0
-                        or current_sfon_num <= prev_sfon_num
-                    ):
-                        break_group = True
-                    elif "sfon6" in current_class and "sfon6" not in prev_class:
-                        break_group = True
-
-                    if break_group:
-                        link_groups.append(current_group)
-                        current_group = [link]
-                    else:
-                        current_group.append(link)
-
-                if current_group:
-                    link_groups.append(current_group)
-
-                for group in link_groups:
-                    merged_text = " ".join([link.text.strip() for link in group])
-                    element_to_click = group[-1]
-                    new_window_text = ""
-                    original_window = driver.current_window_handle
+def scrape_content_page(driver, output_filename, blob_store=None):
+    """
+    '조' 목록(div.lawcon)이 없는 페이지의 본문(#content) 전체를 한 행으로 저장합니다.
+    반환: 저장 행수
+    """
+    content_div = WebDriverWait(driver, 20).until(
+        EC.presence_of_element_located((By.ID, "content"))
+    )
+    print("✅ 'div.lawcon'이 없어 본문 전체를 수집합니다. (유형 2 - 본문형)")
+    sink = RowSink(output_filename)
+    sink.write_article(
+        0, [make_row("전체", "본문 내용", content_div.text.strip(), blob_store)]
+    )
+    return sink.close()
+
+
+def scrape_article_range(
+    driver,
+    url,
+    start,
+    end,
+    total_articles,
+    law_articles=None,
+    use_http=False,
+    link_cache=None,
+    journal=None,
+    sink=None,
+    metrics=None,
+    limiter=None,
+    retry_policy=None,
+    annex_index=None,
+    blob_store=None,
+):
+    """
+    law_articles[start:end] 범위의 '조'만 크롤링해 '조'마다 sink(RowSink)로 넘깁니다.
+    law_articles를 넘기지 않으면 driver로 url을 새로 열어서 찾습니다. (샤드용)
+    use_http=True면 링크 대상을 HTTP 빠른 경로로 먼저 시도합니다.
+    link_cache가 있으면 클릭 전에 캐시를 조회합니다.
+    journal(ArticleJournal)이 있으면 완료된 '조'는 건너뛰고, 새로 끝난 '조'를 기록합니다.
+    metrics(CrawlMetrics)가 있으면 링크 그룹마다 단계별 소요 시간을 기록합니다.
+    limiter(TokenBucket)가 있으면 요청 속도를 맞추고, 실제 요청의 성공/차단을 알려 속도를 조절합니다.
+    일시 오류로 실패한 링크는 구간 끝의 재시도 큐에서 retry_policy(RetryPolicy)대로
+    다시 시도합니다. 그 '조'는 재시도가 끝난 뒤에 기록·출력합니다. (crawl_throttle.py)
+    annex_index(AnnexIndex)는 법령 단위 별표·서식 목록 색인입니다. (annex_index.py)
+    blob_store(BlobStore)가 있으면 긴 텍스트는 행 대신 저장소에 두고 참조만 씁니다.
+    반환: 이 구간에서 만든 행 수
+    """
+    if law_articles is None:
+        law_articles = load_law_articles(driver, url, limiter)
+    if retry_policy is None:
+        retry_policy = RetryPolicy(max_attempts=RETRY_ATTEMPTS)
+    waiter = PopupWaiter()
+    http_resolver = HttpLinkResolver.from_driver(driver) if use_http else None
+    page_url = driver.current_url if link_cache is not None else url
+
+    def _scrape(group, article_num):
+        timings = {}
+        started = time.perf_counter()
+        try:
+            merged_text, new_window_text = scrape_link_group(
+                driver,
+                waiter,
+                group,
+                http_resolver,
+                link_cache,
+                page_url,
+                timings,
+                limiter,
+                annex_index,
+            )
+        finally:
+            timings["total"] = time.perf_counter() - started
+            if metrics is not None:
+                metrics.record(article_num, merge_group_text(group), timings)
+        # 색인·캐시 적중은 요청을 보내지 않았고, 오류 행은 성공이 아니므로 속도를 올리지 않음
+        if (
+            limiter is not None
+            and "annex" not in timings
+            and "cache" not in timings
+            and not str(new_window_text).startswith("오류")
+        ):
+            limiter.reward()
+        return merged_text, new_window_text
+
+    def _finish_article(i, article_rows):
+        if journal is not None:
+            journal.record(i, article_rows)
+        sink.write_article(i, article_rows)
+        return len(article_rows)
+
+    row_count = 0
+    # 일시 오류가 난 '조': (순번, '조' 번호, 행 목록, [(행 위치, 링크 그룹), ...])
+    retry_queue = []
+    for i in range(start, end):
+        if journal is not None and journal.is_done(i):
+            restored_rows = journal.take_rows(i)
+            sink.write_article(i, restored_rows)
+            row_count += len(restored_rows)
+            continue
+
+        article_num = get_article_num(law_articles[i])
+        # article_num이 없으면 이번 반복은 건너뜀 (출력 순서를 위해 빈 '조'로 알림)
+        if not article_num:
+            sink.write_article(i, [])
+            continue
+
+        article_rows = []
+        failed = []
+        for group in iter_article_link_groups(law_articles[i]):
+            try:
+                merged_text, new_window_text = _scrape(group, article_num)
+            except TransientError as e:
+                merged_text, new_window_text = merge_group_text(group), str(e)
+                failed.append((len(article_rows), group))
+                if limiter is not None and isinstance(e, ThrottledError):
+                    limiter.penalize()
+            article_rows.append(
+                make_row(article_num, merged_text, new_window_text, blob_store)
+            )
+        if failed:
+            retry_queue.append((i, article_num, article_rows, failed))
+        else:
+            row_count += _finish_article(i, article_rows)
+
+        percentage = (i + 1) / total_articles * 100
+        print(
+            f"⏳ [진행률: {percentage:.1f}%] 제{article_num}조 분석 완료 ({i + 1}/{total_articles})"
+        )
+
+    if retry_queue:
+        failed_count = sum(len(failed) for *_, failed in retry_queue)
+        print(f"🔁 일시 오류로 실패한 링크 {failed_count}개를 다시 시도합니다.")
+        recovered = 0
+        for i, article_num, article_rows, failed in retry_queue:
+            for position, group in failed:
+                for attempt in range(1, retry_policy.max_attempts + 1):
+                    time.sleep(retry_policy.delay(attempt))
                     try:
-                        driver.execute_script("arguments[0].click();", element_to_click)
-                        wait.until(EC.number_of_windows_to_be(2))
-                        for handle in driver.window_handles:
-                            if handle != original_window:
-                                driver.switch_to.window(handle)
-                                break
-                        try:
-                            new_text_element = wait.until(
-                                EC.presence_of_element_located(
-                                    (By.CSS_SELECTOR, "#linkedJoContent")
-                                )
-                            )
-                            new_window_text = new_text_element.text.strip()
-                        except Exception:
-                            try:
-                                select_element = wait.until(
-                                    EC.presence_of_element_located(
-                                        (By.CSS_SELECTOR, "select#bylList")
-                                    )
-                                )
-                                options = select_element.find_elements(
-                                    By.TAG_NAME, "option"
-                                )
-                                target_option_start = ""
-                                if "별지" in merged_text and "서식" in merged_text:
-                                    match = re.search(
-                                        r"제(\d+)호(?:의(\d+))?서식", merged_text
-                                    )
-                                    if match:
-                                        main_num, sub_num = match.groups()
-                                        form_num_str = (
-                                            f"{main_num}의 {sub_num}"
-                                            if sub_num
-                                            else main_num
-                                        )
-                                        target_option_start = f"[서식 {form_num_str}]"
-                                elif "별표" in merged_text:
-                                    match = re.search(
-                                        r"(별표\s*\d+(?:의\d+)?)", merged_text
-                                    )
-                                    if match:
-                                        bylpyo_text = match.group(1)
-                                        target_option_start = f"[{bylpyo_text}]"
-                                found_text = ""
-                                if target_option_start:
-                                    for opt in options:
-                                        if opt.text.strip().startswith(
-                                            target_option_start
-                                        ):
-                                            found_text = opt.text.strip()
-                                            break
-                                new_window_text = (
-                                    found_text
-                                    or f"'{merged_text}'에 해당하는 항목을 찾지 못했습니다."
-                                )
-                            except Exception:
-                                new_window_text = "오류: #linkedJoContent 또는 #bylList 요소를 찾을 수 없습니다."
-                        TEXT_LENGTH_LIMIT = 5000
-                        if len(new_window_text) > TEXT_LENGTH_LIMIT:
-                            print(
-                                f"⚠️ '{merged_text}' 링크의 내용이 너무 길어 수집하지 않습니다."
-                            )
-                            new_window_text = "내용이 너무 길어 수집 제외"
-                    except Exception as e:
-                        new_window_text = f"오류 발생 또는 텍스트 수집 실패: {e}"
-                    finally:
-                        while len(driver.window_handles) > 1:
-                            for handle in driver.window_handles:
-                                if handle != original_window:
-                                    driver.switch_to.window(handle)
-                                    driver.close()
-                                    break
-                            time.sleep(0.1)
-                        driver.switch_to.window(original_window)
-                    final_data_list.append(
-                        {
-                            "조": article_num,
-                            "링크 텍스트": merged_text,
-                            "링크텍스트 클릭시 데이터": new_window_text,
-                        }
+                        _, new_window_text = _scrape(group, article_num)
+                    except TransientError as e:
+                        article_rows[position] = make_row(
+                            article_num, merge_group_text(group), str(e), blob_store
+                        )
+                        if limiter is not None and isinstance(e, ThrottledError):
+                            limiter.penalize()
+                        continue
+                    article_rows[position] = make_row(
+                        article_num,
+                        merge_group_text(group),
+                        new_window_text,
+                        blob_store,
                     )
-            # --- (기존 로직 끝) ---
+                    recovered += 1
+                    break
+            row_count += _finish_article(i, article_rows)
+        print(f"🔁 재시도 결과: {failed_count}개 중 {recovered}개 복구")
+    if http_resolver is not None:
+        print(
+            f"🌐 HTTP 빠른 경로: {http_resolver.hits}건 성공, "
+            f"{http_resolver.fallbacks}건은 새 창으로 처리"
+        )
+    return row_count
 
-            # ==================================================================
-            # 수정된 부분 3: 현재 '조'에 대한 작업 완료 후 진행률 출력
-            # ==================================================================
-            percentage = (i + 1) / total_articles * 100
+
+def count_link_groups(law_articles, journal=None):
+    """
+    '조'별 링크 그룹 수를 미리 세어 반환합니다. (샤드 분할 가중치)
+    체크포인트에 이미 완료된 '조'는 다시 클릭하지 않으므로 0으로 셉니다.
+    """
+    counts = []
+    for i, article in enumerate(law_articles):
+        if (journal is not None and journal.is_done(i)) or not get_article_num(article):
+            counts.append(0)
+            continue
+        counts.append(sum(1 for _ in iter_article_link_groups(article)))
+    return counts
+
+
+def make_shards(weights, shard_count):
+    """
+    '조'별 가중치(링크 그룹 수)를 보고 연속된 '조' 구간 [(start, end), ...]으로 나눕니다.
+    각 구간의 링크 수가 최대한 비슷해지도록 자릅니다.
+    """
+    total = sum(weights)
+    shard_count = max(1, min(shard_count, len(weights)))
+    if shard_count == 1 or total == 0:
+        return [(0, len(weights))]
+
+    shards = []
+    start = 0
+    acc = 0
+
+    def _can_cut(cut_at):
+        # 남은 '조' 수가 남은 구간 수보다 적으면 더 자르지 않음
+        return shard_count - len(shards) - 1 <= len(weights) - cut_at
+
+    for i, w in enumerate(weights):
+        if len(shards) == shard_count - 1:
+            break
+        target = total * (len(shards) + 1) / shard_count
+        # 이번 '조'를 넣으면 목표를 더 크게 넘는 경우, 넣기 전에 자름
+        if i > start and acc + w > target and target - acc < acc + w - target:
+            if _can_cut(i):
+                shards.append((start, i))
+                start = i
+                target = total * (len(shards) + 1) / shard_count
+        acc += w
+        if acc >= target and len(shards) < shard_count - 1 and _can_cut(i + 1):
+            shards.append((start, i + 1))
+            start = i + 1
+    shards.append((start, len(weights)))
+    return [s for s in shards if s[0] < s[1]]
+
+
+def drop_empty_shards(ranges, weights):
+    """
+    링크가 없는(가중치 0) 구간을 이웃 구간에 합칩니다. 브라우저를 띄울 필요가 없는 구간입니다.
+    (체크포인트·변경 감지로 모두 복원되는 '조'와 링크 없는 '조'는 이웃 구간이 곧바로 씀)
+    """
+    merged = []
+    for start, end in ranges:
+        if merged and (
+            sum(weights[start:end]) == 0
+            or sum(weights[merged[-1][0] : merged[-1][1]]) == 0
+        ):
+            merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def scrape_law_data_with_clicks(
+    url,
+    output_filename,
+    driver=None,
+    shards=1,
+    use_http=USE_HTTP_FAST_PATH,
+    link_cache=None,
+    resume=True,
+    incremental=INCREMENTAL_RECRAWL,
+    rate_limiter=None,
+    retry_policy=None,
+    blob_store=None,
+    page_type="auto",
+    driver_pool=None,
+):
+    """
+    '시행령', '시행규칙' 페이지용 크롤링 함수 (진행률 표시 기능 추가)
+    page_type: "list"(div.lawcon '조' 목록), "content"(#content 본문 전체를 한 행으로),
+    "auto"(목록이 없으면 본문형으로 수집). (load_law_articles 참고)
+    driver를 넘기면 해당 브라우저를 재사용하고 종료하지 않습니다. (DriverPool용)
+    shards > 1이면 링크 그룹을 미리 세어 '조' 구간별로 나누고, 구간마다
+    별도의 브라우저가 같은 URL을 열어 동시에 클릭합니다. 결과는 원래 문서 순서로 합칩니다.
+    driver_pool(DriverPool)을 넘기면 추가 구간의 브라우저는 풀에서 기다리지 않고 빌릴 수 있는
+    만큼만 쓰므로 브라우저 수가 풀 크기를 넘지 않습니다. (scrape_shards 참고)
+    use_http=True면 팝업 창 대신 링크 대상 페이지를 HTTP로 직접 가져옵니다. (link_http.py)
+    link_cache(LinkCache)를 넘기면 이미 수집한 링크 대상은 클릭하지 않습니다. (link_cache.py)
+    '조'가 끝날 때마다 {output_filename}.journal.jsonl 에 기록하며, resume=True면
+    이전 실행이 중단된 지점부터 이어서 수집합니다. (crawl_journal.py)
+    incremental=True면 지난 성공 실행과 본문 해시를 비교해, 바뀌지 않은 '조'는 이전
+    output_filename의 행을 그대로 쓰고 바뀐 '조'만 클릭합니다. (crawl_fingerprint.py)
+    rate_limiter(TokenBucket)는 여러 법령이 함께 쓰는 요청 속도 제한이고, 일시 오류로 실패한
+    링크는 법령(구간) 끝에서 retry_policy대로 다시 시도합니다. (crawl_throttle.py)
+    INLINE_TEXT_LIMIT보다 긴 링크 대상 텍스트는 잘라 버리지 않고 blob_store(기본
+    ./data/blobs)에 압축 저장하며, 행에는 참조("blob:<해시>")만 씁니다. (blob_store.py)
+    링크별 단계 시간 히스토그램과 느린 링크 목록을 {output_filename}.metrics.json 에
+    저장합니다. (crawl_metrics.py)
+    행은 메모리에 모으지 않고 '조'가 끝날 때마다 output_filename에 바로 씁니다.
+    확장자가 .jsonl이면 JSON Lines로 저장합니다. (crawl_output.py)
+    반환: {"output": 파일명, "rows": 저장 행수, "error": 오류 메시지 or None}
+    """
+    own_driver = driver is None
+    sink = None
+    result = {"output": output_filename, "rows": 0, "error": None}
+    print("-" * 50)
+    print(f"▶️ 작업을 시작합니다: {output_filename}")
+    try:
+        if own_driver:
+            driver = create_driver()
+        if blob_store is None:
+            blob_store = BlobStore()
+        law_articles = load_law_articles(driver, url, rate_limiter, page_type)
+        if law_articles is None:
+            result["rows"] = scrape_content_page(driver, output_filename, blob_store)
+            print(f"✅ 작업 완료! '{output_filename}' 파일로 저장되었습니다.")
+            return result
+
+        total_articles = len(law_articles)
+        print(
+            f"✅ 총 {total_articles}개의 '조'를 발견했습니다. 분석을 시작합니다. (유형 1 - 목록형)"
+        )
+        print("⚠️ 이 작업은 모든 링크를 클릭하므로 시간이 매우 오래 걸릴 수 있습니다.")
+
+        journal = ArticleJournal(
+            journal_path_for(output_filename), url, total_articles, resume=resume
+        )
+        if journal.completed:
             print(
-                f"⏳ [진행률: {percentage:.1f}%] 제{article_num}조 분석 완료 ({i + 1}/{total_articles})"
+                f"♻️ 체크포인트에서 {journal.completed}개 '조'를 복원했습니다. 나머지만 수집합니다."
             )
+        fingerprints = [article_fingerprint(a["text"]) for a in law_articles]
+        if incremental:
+            # 이전 출력 파일은 RowSink가 덮어쓰기 전에 읽어 둠
+            unchanged = load_unchanged_rows(output_filename, url, fingerprints)
+            unchanged = {
+                i: rows for i, rows in unchanged.items() if not journal.is_done(i)
+            }
+            journal.restore(unchanged)
+            if unchanged:
+                print(
+                    f"🔎 본문이 바뀌지 않은 {len(unchanged)}개 '조'는 이전 결과를 재사용합니다. "
+                    f"(다시 수집: {total_articles - journal.completed}개)"
+                )
+        # 출력 파일을 새로 쓰므로 지난 기록은 지우고, 이번 실행이 성공하면 다시 저장
+        if os.path.exists(fingerprint_path_for(output_filename)):
+            os.remove(fingerprint_path_for(output_filename))
+        sink = RowSink(output_filename)
+        metrics = CrawlMetrics()
+        annex_index = AnnexIndex()
+        opts = {
+            "use_http": use_http,
+            "link_cache": link_cache,
+            "journal": journal,
+            "sink": sink,
+            "metrics": metrics,
+            "limiter": rate_limiter,
+            "retry_policy": retry_policy,
+            "annex_index": annex_index,
+            "blob_store": blob_store,
+        }
+
+        ranges = [(0, total_articles)]
+        if shards > 1:
+            weights = count_link_groups(law_articles, journal)
+            ranges = drop_empty_shards(make_shards(weights, shards), weights)
 
-        if final_data_list:
-            df = pd.DataFrame(final_data_list)
-            df.to_csv(output_filename, index=False, encoding="utf-8-sig")
+        if len(ranges) == 1:
+            scrape_article_range(
+                driver, url, 0, total_articles, total_articles, law_articles, **opts
+            )
+        else:
+            scrape_shards(
+                driver, url, ranges, law_articles, weights, driver_pool, **opts
+            )
+
+        result["rows"] = sink.close()
+        if result["rows"]:
             print(f"✅ 작업 완료! '{output_filename}' 파일로 저장되었습니다.")
         else:
+            sink.discard()
             print("⚠️ 수집된 데이터가 없습니다.")
+        save_fingerprints(
+            fingerprint_path_for(output_filename),
+            url,
+            fingerprints,
+            [sink.article_row_counts.get(i, 0) for i in range(total_articles)],
+        )
+        journal.finish()
+        if annex_index.hits:
+            print(
+                f"📑 별표·서식 링크 {annex_index.hits}개는 목록 색인으로 처리했습니다."
+            )
+        metrics.save(metrics_path_for(output_filename))
+        print(metrics.report())
 
     except Exception as e:
+        result["error"] = str(e)
+        if sink is not None:
+            # 부분 결과는 남겨 둠 (다음 실행은 체크포인트에서 이어서 다시 씀)
+            result["rows"] = sink.close()
         print(f"❌ '{output_filename}' 작업 중 오류가 발생했습니다: {e}")
     finally:
-        if driver:
+        if own_driver and driver:
             driver.quit()
+    return result
 
 
-# --- 메인 실행부 ---
-if __name__ == "__main__":
+def scrape_shards(driver, url, ranges, law_articles, weights, driver_pool=None, **opts):
+    """
+    구간별로 브라우저를 하나씩 배정해 동시에 크롤링합니다.
+    첫 구간은 이미 페이지를 연 driver가 맡고, 나머지는 추가 브라우저가 맡습니다.
+    driver_pool이 있으면 추가 브라우저는 풀에서 기다리지 않고 빌릴 수 있는 만큼만 빌리고,
+    모자라면 그 수에 맞춰 구간을 다시 나눕니다. (다른 법령이 쓰는 브라우저를 기다리다
+    서로 막히지 않고, 브라우저 수는 풀 크기를 넘지 않음)
+    풀이 없으면 구간마다 새 드라이버를 띄웁니다.
+    opts는 scrape_article_range에 그대로 넘깁니다. (use_http, link_cache, journal, sink,
+    metrics, limiter, retry_policy, annex_index, blob_store)
+    """
+    total_articles = len(law_articles)
+    shard_drivers = []
+    if driver_pool is not None:
+        for _ in range(len(ranges) - 1):
+            try:
+                shard_driver = driver_pool.try_acquire()
+            except Exception as e:
+                print(f"⚠️ 구간용 브라우저를 띄우지 못했습니다: {e}")
+                shard_driver = None
+            if shard_driver is None:
+                break
+            shard_drivers.append(shard_driver)
+        if len(shard_drivers) < len(ranges) - 1:
+            ranges = drop_empty_shards(
+                make_shards(weights, len(shard_drivers) + 1), weights
+            )
+            for shard_driver in shard_drivers[len(ranges) - 1 :]:
+                driver_pool.release(shard_driver)
+            shard_drivers = shard_drivers[: len(ranges) - 1]
+    if len(ranges) == 1:
+        scrape_article_range(
+            driver, url, 0, total_articles, total_articles, law_articles, **opts
+        )
+        return
+    print(
+        f"🔀 링크 {sum(weights)}개를 {len(ranges)}개 구간으로 나눠 동시에 수집합니다: "
+        + ", ".join(f"{s + 1}~{e}조" for s, e in ranges)
+    )
+
+    def _run_shard(index, start, end):
+        if index == 0:
+            return scrape_article_range(
+                driver, url, start, end, total_articles, law_articles, **opts
+            )
+        if driver_pool is None:
+            shard_driver = create_driver()
+        else:
+            shard_driver = shard_drivers[index - 1]
+        broken = True
+        try:
+            scrape_article_range(shard_driver, url, start, end, total_articles, **opts)
+            broken = False
+        finally:
+            if driver_pool is None:
+                shard_driver.quit()
+            else:
+                driver_pool.release(shard_driver, broken=broken)
+
+    with ThreadPoolExecutor(max_workers=len(ranges)) as executor:
+        futures = [
+            executor.submit(_run_shard, index, start, end)
+            for index, (start, end) in enumerate(ranges)
+        ]
+        # 출력 순서는 RowSink가 '조' 번호순으로 맞춤. 여기서는 오류만 전달
+        for future in futures:
+            future.result()
 
-    # 1. 기존 '시행령/규칙' 유형의 URL
-    list_type_jobs = {
-        # "산업안전보건법_시행규칙": 'https://www.law.go.kr/LSW/lsSc.do?section=&menuId=1&subMenuId=15&tabMenuId=81&eventGubun=060101&query=%EC%82%B0%EC%97%85%EC%95%88%EC%A0%84%EB%B3%B4%EA%B1%B4%EB%B2%95+%EC%8B%9C%ED%96%89%EA%B7%9C%EC%B9%99#undefined',
-        # "산업안전보건법_시행령": "https://www.law.go.kr/LSW/lsSc.do?section=&menuId=1&subMenuId=15&tabMenuId=81&eventGubun=060101&query=%EC%82%B0%EC%97%85%EC%95%88%EC%A0%84%EB%B3%B4%EA%B1%B4%EB%B2%95+%EC%8B%9C%ED%96%89%EB%A0%B9#undefined",
-        "중대재해처벌법": "https://www.law.go.kr/LSW/lsSc.do?section=&menuId=1&subMenuId=15&tabMenuId=81&eventGubun=060101&query=%EC%A4%91%EB%8C%80%EC%9E%AC%ED%95%B4%20%EC%B2%98%EB%B2%8C%20%EB%93%B1%EC%97%90%20%EA%B4%80%ED%95%9C%20%EB%B2%95%EB%A5%A0#undefined",
-        "중대재해처벌법 시행령" : "https://www.law.go.kr/LSW/lsSc.do?section=&menuId=1&subMenuId=15&tabMenuId=81&eventGubun=060101&query=%EC%A4%91%EB%8C%80%EC%9E%AC%ED%95%B4%20%EC%B2%98%EB%B2%8C%20%EB%93%B1%EC%97%90%20%EA%B4%80%ED%95%9C%20%EB%B2%95%EB%A5%A0%20%EC%8B%9C%ED%96%89%EB%A0%B9#undefined",
-        "안전보건규칙": "https://www.law.go.kr/LSW/lsSc.do?section=&menuId=1&subMenuId=15&tabMenuId=81&eventGubun=060101&query=%EC%82%B0%EC%97%85%EC%95%88%EC%A0%84%EB%B3%B4%EA%B1%B4%EA%B8%B0%EC%A4%80%EC%97%90%20%EA%B4%80%ED%95%9C%20%EA%B7%9C%EC%B9%99#undefined"
-    }
 
-    # 각 유형에 맞는 함수를 호출하여 크롤링 수행
-    for law_name, law_url in list_type_jobs.items():
-        output_csv_name = f"./data/{law_name}_data.csv"
-        scrape_law_data_with_clicks(law_url, output_csv_name)  # 기존 함수 호출
+def run_jobs_parallel(
+    jobs,
+    output_dir=None,
+    max_workers=MAX_WORKERS,
+    shards=SHARDS_PER_LAW,
+    cache_path=LINK_CACHE_PATH,
+    resume=True,
+    output_format=OUTPUT_FORMAT,
+    incremental=INCREMENTAL_RECRAWL,
+    engine=CRAWL_ENGINE,
+    replay_archive=REPLAY_ARCHIVE_DIR,
+    page_types=None,
+):
+    """
+    여러 법령을 DriverPool 위에서 동시에 크롤링합니다.
+    jobs: {법령명: URL}
+    page_types: {법령명: "list" | "content" | "auto"} (없는 법령은 "auto")
+    max_workers: 브라우저 총수. 동시에 크롤링하는 법령 수도 이를 넘지 않습니다.
+    shards: 법령별 구간 분할 수. 추가 구간은 풀에 남는 브라우저가 있을 때만 씁니다.
+        (scrape_shards 참고)
+    cache_path: 링크 캐시(SQLite) 경로. 모든 법령이 같은 캐시를 공유합니다.
+    resume: 중단된 법령을 체크포인트부터 이어서 수집할지 여부
+    output_format: "csv" 또는 "jsonl"
+    incremental: 본문이 바뀌지 않은 '조'는 지난 결과를 재사용할지 여부
+    engine: "cdp"면 법령마다 async_crawler 엔진(브라우저 하나 + 여러 탭)으로 수집합니다.
+        async_crawler는 목록형만 다루므로 page_type이 "list"가 아닌 법령은 Selenium으로 수집합니다.
+        어느 엔진이든 같은 요청 속도 제한과 링크 캐시를 함께 씁니다.
+    output_dir: 결과 디렉터리. 기본은 "./data"이고, 재생 모드에서는 실제 결과(출력 파일,
+        체크포인트, 변경 감지 기록)를 덮어쓰지 않도록 "{replay_archive}/output"입니다.
+    replay_archive: 아카이브 경로를 주면 로컬 재생 서버를 띄우고 jobs의 URL을 그 주소로
+        바꿔 네트워크 없이 크롤링합니다. (벤치마크용이면 cache_path=None 권장)
+    반환: {법령명: {"output", "rows", "error", "elapsed"}}
+    """
+    if output_dir is None:
+        output_dir = (
+            os.path.join(replay_archive, "output") if replay_archive else "./data"
+        )
+    os.makedirs(output_dir, exist_ok=True)
+    page_types = page_types or {}
+    replay_server = None
+    if replay_archive:
+        replay_server = ArchiveServer(CrawlArchive(replay_archive)).start()
+        jobs = {name: replay_server.replay_url(u) for name, u in jobs.items()}
+        print(f"📼 아카이브 재생 모드: {replay_server.base_url}")
+    pool = DriverPool(size=max_workers)
+    rate_limiter = (
+        TokenBucket(RATE_LIMIT_PER_SECOND, burst=max(1, max_workers * shards))
+        if RATE_LIMIT_PER_SECOND
+        else None
+    )
+    link_cache = (
+        LinkCache(cache_path, ttl_seconds=LINK_CACHE_TTL_DAYS * 24 * 3600)
+        if cache_path
+        else None
+    )
+    results = {}
+
+    def _run(law_name, law_url):
+        output_name = os.path.join(output_dir, f"{law_name}_data.{output_format}")
+        started = time.time()
+        page_type = page_types.get(law_name, "auto")
+        if engine == "cdp" and page_type == "list":
+            from async_crawler import scrape_law_data_with_clicks as scrape_async
+
+            result = scrape_async(
+                law_url,
+                output_name,
+                resume=resume,
+                incremental=incremental,
+                link_cache=link_cache,
+                rate_limiter=rate_limiter,
+            )
+            result["elapsed"] = time.time() - started
+            return result
+        driver = pool.acquire()
+        result = None
+        try:
+            result = scrape_law_data_with_clicks(
+                law_url,
+                output_name,
+                driver=driver,
+                shards=shards,
+                link_cache=link_cache,
+                resume=resume,
+                incremental=incremental,
+                rate_limiter=rate_limiter,
+                page_type=page_type,
+                driver_pool=pool,
+            )
+        finally:
+            broken = result is None or result["error"] is not None
+            pool.release(driver, broken=broken)
+        result["elapsed"] = time.time() - started
+        return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=min(pool.size, len(jobs)) or 1) as executor:
+            futures = {
+                executor.submit(_run, law_name, law_url): law_name
+                for law_name, law_url in jobs.items()
+            }
+            for future in as_completed(futures):
+                law_name = futures[future]
+                try:
+                    results[law_name] = future.result()
+                except Exception as e:
+                    results[law_name] = {
+                        "output": None,
+                        "rows": 0,
+                        "error": str(e),
+                        "elapsed": 0.0,
+                    }
+    finally:
+        pool.close()
+        if link_cache is not None:
+            link_cache.close()
+        if replay_server is not None:
+            replay_server.stop()
+
+    print("=" * 50)
+    for law_name in jobs:
+        r = results[law_name]
+        status = "❌ 실패" if r["error"] else "✅ 완료"
+        print(f"{status} {law_name}: {r['rows']}행, {r['elapsed']:.1f}초")
+    if link_cache is not None:
+        print(link_cache.report())
+    if rate_limiter is not None:
+        print(
+            f"🚦 요청 속도: 최종 초당 {rate_limiter.rate:.1f}회, "
+            f"차단 신호로 감속 {rate_limiter.throttled}회"
+        )
+    return results
+
+
+# --- 메인 실행부 ---
+# 작업 목록은 jobs.yaml에 있습니다. 옵션(--jobs, --workers, --only, --resume, --cache-dir)은
+# crawl.py를 참고하세요.
+if __name__ == "__main__":
+    from crawl import main
 
-    print("\n🎉 모든 작업이 완료되었습니다.")
+    sys.exit(main())
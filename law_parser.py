@@ -0,0 +1,467 @@
+# -*- coding: utf-8 -*-
+"""
+법령 본문 구조 파서 (편/장/절/관 · 조/항/호/목). 1make_layout.py와 3-1remove.py가 함께 씁니다.
+
+예전에는 두 단계가 정규식과 분할 함수를 각자 복사해 두고 있었고, 3-1에만 제목 줄 추출과
+별표·별지용 '기타' 노드가 있었습니다. 이제 규칙은 이 모듈 한 곳에만 있습니다.
+
+  parse(text, law_title)   # 원문 → 노드 목록 (조가 없는 별표·별지는 '기타' 노드 하나)
+  parse_cell(cell_text)    # 첫 줄이 법령명인 링크 대상 텍스트 → 노드 목록 (3-1remove.py)
+
+벤치마크(기존 다중 패스 빌더와 비교)는 law_parser_bench.py에 있습니다.
+"""
+
+import re
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# 파싱 규칙(노드 구조·텍스트)이 바뀌면 올림. 파싱 결과 캐시(parse_cache.py)의 키에 들어감
+PARSER_VERSION = 2
+
+# 항(①~⑳) 매핑 및 정규식
+CIRCLED_CHARS = [
+    "①",
+    "②",
+    "③",
+    "④",
+    "⑤",
+    "⑥",
+    "⑦",
+    "⑧",
+    "⑨",
+    "⑩",
+    "⑪",
+    "⑫",
+    "⑬",
+    "⑭",
+    "⑮",
+    "⑯",
+    "⑰",
+    "⑱",
+    "⑲",
+    "⑳",
+]
+CIRCLED_MAP = {ch: i + 1 for i, ch in enumerate(CIRCLED_CHARS)}
+CIRCLED_RE = re.compile("|".join(map(re.escape, CIRCLED_CHARS)))
+
+# 조(제n조/제n조의m) 패턴: (제목)은 선택
+# group(1)=본조번호, group(2)=의번호(optional), group(3)=제목(optional)
+JOSA_RE = re.compile(
+    r"^제\s*(\d+)(?:\s*조의\s*(\d+)|\s*조)(?:\(([^)]*)\))?", re.MULTILINE
+)
+
+# 텍스트형 항 보조 식별자: 문단 시작에서 '제 n 항'
+HANG_TEXT_RE = re.compile(r"(?m)^\s*제\s*(\d+)\s*항\b")
+
+# 호: 문단 시작 '1. ', '2. ' …
+HO_LINE_RE = re.compile(r"(?m)^\s*(\d+)\.\s")
+
+# 편/장/절/관 제목 줄: '제1장 총칙', '제2장의2 …' (상위 → 하위 순)
+CONTAINER_LEVELS = ("편", "장", "절", "관")
+HEADING_RE = re.compile(r"제\s*(\d+)\s*(편|장|절|관)(?:의\s*(\d+))?")
+
+# 목: 호 안의 문단 시작 '가. ', '나. ' …
+MOK_CHARS = "가나다라마바사아자차카타파하"
+
+# 법령명 다음의 '[시행 2024. 1. 1.] [고용노동부령 제1호, …]' 같은 메타 줄
+META_LINE_RE = re.compile(r"^(?:\s*\[[^\]]+\]\s*)+$")
+
+
+# ====================================
+# 유틸
+# ====================================
+def normalize_text(s: str) -> str:
+    """줄바꿈/스페이스 정규화"""
+    s = s.replace("\r\n", "\n").replace("\r", "\n")
+    s = s.replace("\xa0", " ")
+    s = re.sub(r"[ \t]+", " ", s)
+    return s.strip()
+
+
+def extract_law_title_and_body(raw: str) -> Tuple[str, str]:
+    """
+    첫 줄(빈 줄 제외)을 법령명으로, 바로 뒤의 메타 줄('[시행 …]')을 건너뛴 나머지를 본문으로 반환.
+    문자열이 아니거나 비어 있으면 ("", "")
+    """
+    if not isinstance(raw, str):
+        return "", ""
+    txt = normalize_text(raw)
+    lines = [ln for ln in txt.split("\n")]
+    title = ""
+    i = 0
+    while i < len(lines) and not title:
+        cand = lines[i].strip()
+        if cand:
+            title = cand
+        i += 1
+    if not title:
+        return "", ""
+    while i < len(lines) and META_LINE_RE.match(lines[i].strip() or ""):
+        i += 1
+    body = "\n".join(lines[i:]).strip()
+    return title, body
+
+
+def make_article_id(prefix: str, main_no: str, sub_no: Optional[str] = None) -> str:
+    """제4조→산업안전보건법시행규칙-4, 제4조의2→산업안전보건법시행규칙-4_2"""
+    return f"{prefix}-{main_no}_{sub_no}" if sub_no else f"{prefix}-{main_no}"
+
+
+def make_article_number_field(main_no: str, sub_no: Optional[str] = None) -> str:
+    """number 필드: 4, 4의2"""
+    return f"{main_no}의{sub_no}" if sub_no else str(main_no)
+
+
+# ====================================
+# 단일 패스 토크나이저
+# ====================================
+# 본문을 한 번만 훑어 구조 표지를 문서 순서대로 냅니다. (패턴은 위 정규식과 같음)
+#   ARTICLE   줄 시작 '제n조' / '제n조의m'       (JOSA_RE)
+#   HANG      ①~⑳ (위치 무관)                  (CIRCLED_RE)
+#   HANG_LINE 줄 시작 '제n항' (분할 기준은 아니고 조.text를 자르는 데만 씀)  (HANG_TEXT_RE)
+#   HO        줄 시작 'n. '                    (HO_LINE_RE)
+#   HEADING   줄 시작 '제n편/장/절/관'           (HEADING_RE)
+#   MOK       줄 시작 '가. '                   (MOK_CHARS)
+# 표지 사이의 본문(TEXT)은 따로 토큰을 만들지 않고 오프셋으로만 다루며,
+# 노드를 만들 때 한 번만 잘라냅니다.
+ARTICLE = "ARTICLE"
+HANG = "HANG"
+HANG_LINE = "HANG_LINE"
+HO = "HO"
+HEADING = "HEADING"
+MOK = "MOK"
+
+# 편/장/절/관·목은 같은 정규식의 대안으로 넣어, 단계가 늘어도 본문은 한 번만 훑음.
+# 앞의 세 대안이 맞는 곳에서는 결과가 그대로이도록 새 대안은 뒤에 둠
+_LINE_MARKERS = (
+    r"(?P<article>제\s*\d+(?:\s*조의\s*\d+|\s*조))"
+    r"|\s*(?P<hang_line>제)\s*\d+\s*항\b"
+    r"|\s*(?P<ho>\d+)\.(?=\s)"
+    r"|\s*(?P<heading>제)\s*\d+\s*(?:편|장|절|관)(?:의\s*\d+)?(?=\s|$)"
+    r"|\s*(?P<mok>[" + MOK_CHARS + r"])\.(?=\s)"
+)
+# 줄 시작 표지는 '\n'으로 시작하게 해 정규식 엔진이 줄바꿈 위치에서만 시도하도록 함.
+# 호·목 뒤 공백은 소비하지 않음(다음 줄의 '\n'을 남겨 둠)
+LINE_TOKEN_RE = re.compile(r"\n(?:" + _LINE_MARKERS + ")")
+FIRST_LINE_TOKEN_RE = re.compile(_LINE_MARKERS)
+# 항 텍스트 맨 앞('① 1. …')의 호. 원래 규칙은 항 텍스트를 잘라 낸 뒤 ^로 찾으므로
+# 줄 시작이 아니어도 호로 봅니다.
+HO_AT_RE = re.compile(r"(\d+)\.\s")
+
+
+class Token(NamedTuple):
+    kind: str
+    start: int  # 표지 시작 (HANG_LINE·HEADING은 '제', HO·MOK은 번호 위치)
+    end: int  # HO·MOK은 번호 뒤 공백까지
+    number: int = 0  # HANG·HO 번호
+    main_no: str = ""  # ARTICLE·HEADING 번호, MOK 기호('가')
+    sub_no: Optional[str] = None
+    title: str = ""
+    level: str = ""  # HEADING: 편/장/절/관
+
+
+def _iter_line_markers(full_text: str):
+    first = FIRST_LINE_TOKEN_RE.match(full_text)
+    if first:
+        yield first
+    yield from LINE_TOKEN_RE.finditer(full_text, first.end() if first else 0)
+
+
+def tokenize(full_text: str) -> Iterator[Token]:
+    """
+    full_text의 구조 표지를 문서 순서대로 반환합니다.
+    줄 시작 표지(조·제n항·호·편/장/절/관·목)는 줄바꿈마다, ①~⑳는 문자 위치마다
+    한 번씩만 확인하고 두 흐름을 위치순으로 합칩니다. (각 표지 영역 안에는 다른 표지가 없음)
+    """
+    circled = CIRCLED_RE.finditer(full_text)
+    hang = next(circled, None)
+    header_end = -1
+    for m in _iter_line_markers(full_text):
+        kind = m.lastgroup
+        pos = m.start(kind)
+        while hang is not None and hang.start() < pos:
+            yield Token(HANG, hang.start(), hang.end(), CIRCLED_MAP[hang.group()])
+            hang = next(circled, None)
+        if kind == "ho":
+            yield Token(HO, pos, m.end() + 1, int(m.group(kind)))
+        elif kind == "hang_line":
+            yield Token(HANG_LINE, pos, m.end())
+        elif kind == "mok":
+            yield Token(MOK, pos, m.end() + 1, main_no=m.group(kind))
+        elif pos < header_end:
+            # 이전 조 제목 안의 '제n조'·'제n장'은 표지로 보지 않음 (JOSA_RE.finditer와 같게)
+            continue
+        elif kind == "heading":
+            head = HEADING_RE.match(full_text, pos)
+            yield Token(
+                HEADING,
+                pos,
+                m.end(),
+                main_no=head.group(1),
+                sub_no=head.group(3),
+                level=head.group(2),
+            )
+        else:
+            # 제목 괄호는 줄을 넘을 수 있어 전체 머리는 JOSA_RE로 다시 맞춤.
+            head = JOSA_RE.match(full_text, pos)
+            header_end = head.end()
+            yield Token(
+                ARTICLE,
+                pos,
+                header_end,
+                0,
+                head.group(1),
+                head.group(2),
+                head.group(3) or "",
+            )
+    while hang is not None:
+        yield Token(HANG, hang.start(), hang.end(), CIRCLED_MAP[hang.group()])
+        hang = next(circled, None)
+
+
+def _rstrip_end(text: str, start: int, end: int) -> int:
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return end
+
+
+def _lstrip_start(text: str, start: int, end: int) -> int:
+    while start < end and text[start].isspace():
+        start += 1
+    return start
+
+
+def _make_node(law_title, node_id, level, number, parent_id, text):
+    return {
+        "id": node_id,
+        "law_title": law_title,
+        "level": level,
+        "number": number,
+        "parent_id": parent_id,
+        "Children_id": [],
+        "text": text,
+        "refs": [],
+    }
+
+
+# ====================================
+# 메인 빌더
+# ====================================
+def build_nodes(
+    full_text: str, law_title: str, prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    규칙:
+      - 편/장/절/관.text: 제목 줄 (다음 조·제목 전까지). 조 블록에는 넣지 않음
+      - 조.text: '제n조(제목)' + (있다면 ① 이전 프롤로그까지만)
+      - 항.text: '호' 목록 앞의 머리말만
+      - 호.text: '1. …' 항목 본문 중 '목' 목록 앞부분
+      - 목.text: 호 안의 각 '가. …' 항목 본문
+      - 항(① 등)이 전혀 없으면 조만 생성(정의형 조 등)
+      - refs는 항상 []
+    id: 조 '{prefix}-4_2', 항 '…(1)', 호 '…[1]', 목 '…{가}',
+        편/장/절/관 '{상위 id 또는 prefix}-제1장', '…-제1장-제2절'
+    조의 parent_id는 가장 안쪽 편/장/절/관 (없으면 None)
+    tokenize()의 표지 목록만으로 경계를 정하고, 노드 텍스트만 마지막에 잘라냅니다.
+    full_text는 normalize_text를 거친 본문, prefix는 조 id 앞부분(기본: law_title)
+    """
+    if prefix is None:
+        prefix = law_title
+    # 조·제목마다 [ARTICLE/HEADING 토큰, 나머지 토큰들]
+    units: List[Tuple[Token, List[Token]]] = []
+    for token in tokenize(full_text):
+        if token.kind in (ARTICLE, HEADING):
+            units.append((token, []))
+        elif units:
+            units[-1][1].append(token)
+
+    nodes: List[Dict[str, Any]] = []
+    # 열려 있는 편/장/절/관: [(CONTAINER_LEVELS 순위, 노드)]
+    containers: List[Tuple[int, Dict[str, Any]]] = []
+    for i, (head, tokens) in enumerate(units):
+        start, head_end = head.start, head.end
+        next_start = units[i + 1][0].start if i + 1 < len(units) else len(full_text)
+        block_end = _rstrip_end(full_text, start, next_start)
+
+        if head.kind == HEADING:
+            rank = CONTAINER_LEVELS.index(head.level)
+            while containers and containers[-1][0] >= rank:
+                containers.pop()
+            parent = containers[-1][1] if containers else None
+            label = f"제{head.main_no}{head.level}" + (
+                f"의{head.sub_no}" if head.sub_no else ""
+            )
+            container = _make_node(
+                law_title,
+                f"{parent['id'] if parent else prefix}-{label}",
+                head.level,
+                make_article_number_field(head.main_no, head.sub_no),
+                parent["id"] if parent else None,
+                full_text[start:block_end],
+            )
+            nodes.append(container)
+            if parent:
+                parent["Children_id"].append(container["id"])
+            containers.append((rank, container))
+            continue
+
+        hangs = [t for t in tokens if t.kind == HANG]
+        first_hang_line = next((t.start for t in tokens if t.kind == HANG_LINE), None)
+        first_hang_idx = min(
+            (
+                p
+                for p in (hangs[0].start if hangs else None, first_hang_line)
+                if p is not None
+            ),
+            default=None,
+        )
+
+        # 조 텍스트(헤더 + ① 이전 프롤로그). ①/제n항 이후는 넣지 않음
+        if first_hang_idx is None:
+            article_text = full_text[start:block_end]
+        elif hangs and hangs[0].start < head_end:
+            article_text = full_text[start : hangs[0].start].rstrip()
+        elif first_hang_line is not None and first_hang_line < head_end:
+            article_text = full_text[start:first_hang_line].rstrip()
+        else:
+            header_txt = full_text[start:head_end]
+            preface = full_text[head_end:first_hang_idx].strip()
+            article_text = header_txt + "\n" + preface if preface else header_txt
+            # 프롤로그가 새 줄에서 시작하므로 그 줄이 '제n항'이면 잘라냄 (짧은 문자열만 확인)
+            m = HANG_TEXT_RE.search(article_text)
+            if m:
+                article_text = article_text[: m.start()].rstrip()
+
+        article_id = make_article_id(prefix, head.main_no, head.sub_no)
+        parent = containers[-1][1] if containers else None
+        art_node = _make_node(
+            law_title,
+            article_id,
+            "조",
+            make_article_number_field(head.main_no, head.sub_no),
+            parent["id"] if parent else None,
+            article_text,
+        )
+        nodes.append(art_node)
+        if parent:
+            parent["Children_id"].append(article_id)
+
+        hos = [t for t in tokens if t.kind == HO]
+        moks = [t for t in tokens if t.kind == MOK]
+        ho_index = 0
+        mok_index = 0
+        for j, hang in enumerate(hangs):
+            hang_end = hangs[j + 1].start if j + 1 < len(hangs) else block_end
+            text_end = _rstrip_end(full_text, hang.end, hang_end)
+            text_start = _lstrip_start(full_text, hang.end, text_end)
+
+            # 이 항 안의 호 (표지가 항 텍스트 안에 온전히 들어가는 것만)
+            while ho_index < len(hos) and hos[ho_index].start < text_start:
+                ho_index += 1
+            hang_hos = []
+            while ho_index < len(hos) and hos[ho_index].start < hang_end:
+                if hos[ho_index].end <= text_end:
+                    hang_hos.append(hos[ho_index])
+                ho_index += 1
+            if not hang_hos or hang_hos[0].start != text_start:
+                m = HO_AT_RE.match(full_text, text_start, text_end)
+                if m:
+                    hang_hos.insert(0, Token(HO, text_start, m.end(), int(m.group(1))))
+
+            preface_end = hang_hos[0].start if hang_hos else text_end
+            hang_id = f"{article_id}({hang.number})"
+            hang_node = _make_node(
+                law_title,
+                hang_id,
+                "항",
+                str(hang.number),
+                article_id,
+                full_text[text_start:preface_end].strip(),
+            )
+            nodes.append(hang_node)
+            art_node["Children_id"].append(hang_id)
+
+            for k, ho in enumerate(hang_hos):
+                ho_end = hang_hos[k + 1].start if k + 1 < len(hang_hos) else text_end
+
+                # 이 호 안의 목 (표지가 호 텍스트 안에 온전히 들어가는 것만)
+                while mok_index < len(moks) and moks[mok_index].start < ho.end:
+                    mok_index += 1
+                ho_moks = []
+                while mok_index < len(moks) and moks[mok_index].start < ho_end:
+                    if moks[mok_index].end <= ho_end:
+                        ho_moks.append(moks[mok_index])
+                    mok_index += 1
+
+                ho_id = f"{hang_id}[{ho.number}]"
+                ho_node = _make_node(
+                    law_title,
+                    ho_id,
+                    "호",
+                    str(ho.number),
+                    hang_id,
+                    full_text[ho.end : ho_moks[0].start if ho_moks else ho_end].strip(),
+                )
+                nodes.append(ho_node)
+                hang_node["Children_id"].append(ho_id)
+
+                for n, mok in enumerate(ho_moks):
+                    mok_end = ho_moks[n + 1].start if n + 1 < len(ho_moks) else ho_end
+                    mok_id = f"{ho_id}{{{mok.main_no}}}"
+                    nodes.append(
+                        _make_node(
+                            law_title,
+                            mok_id,
+                            "목",
+                            mok.main_no,
+                            ho_id,
+                            full_text[mok.end : mok_end].strip(),
+                        )
+                    )
+                    ho_node["Children_id"].append(mok_id)
+    return nodes
+
+
+# ====================================
+# 공개 API
+# ====================================
+def _annex_node(law_title: str) -> Dict[str, Any]:
+    """조가 없는 별표·별지 문서를 나타내는 '기타' 노드 하나."""
+    return {
+        "id": law_title,
+        "law_title": law_title,
+        "level": "기타",
+        "number": "기타",
+        "parent_id": None,
+        "Children_id": [],
+        "text": law_title,
+        "refs": [],
+    }
+
+
+def _parse_body(
+    body: str, law_title: str, prefix: Optional[str]
+) -> List[Dict[str, Any]]:
+    nodes = build_nodes(body, law_title, prefix)
+    has_article = any(node["level"] == "조" for node in nodes)
+    if not has_article and ("별표" in law_title or "별지" in law_title):
+        return [_annex_node(law_title)]
+    return nodes
+
+
+def parse(
+    text: str, law_title: str, prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    법령 원문을 편/장/절/관·조/항/호/목 노드 목록으로 변환합니다.
+    - law_title: 모든 노드의 law_title. prefix(조 id 앞부분)를 주지 않으면 이 값을 씀
+    - 조가 하나도 없고 법령명에 '별표'/'별지'가 있으면 '기타' 노드 하나를 반환
+    """
+    return _parse_body(normalize_text(text), law_title, prefix)
+
+
+def parse_cell(cell_text: str) -> List[Dict[str, Any]]:
+    """첫 줄이 법령명인 링크 대상 텍스트를 노드 목록으로 변환합니다. 법령명이 없으면 []"""
+    law_title, body = extract_law_title_and_body(cell_text)
+    if not law_title:
+        return []
+    return _parse_body(body, law_title, None)
@@ -0,0 +1,353 @@
+# -*- coding: utf-8 -*-
+"""
+law_parser 빌더 벤치마크.
+
+law_parser.build_nodes(단일 패스)와, 그 전에 쓰던 다중 패스 빌더(조 블록·항 텍스트마다
+JOSA/CIRCLED/HANG_TEXT/HO 정규식을 다시 훑는 방식)를 같은 원문으로 비교합니다.
+다중 패스 빌더는 비교용으로만 여기에 남겨 두며 파이프라인에서는 쓰지 않습니다.
+
+  python law_parser_bench.py [원문.txt]   # 원문이 없으면 고정 시드 합성 원문
+  python 1make_layout.py --bench [원문.txt]
+"""
+
+import gc
+import os
+import random
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+from law_parser import (
+    CIRCLED_CHARS,
+    CIRCLED_MAP,
+    CIRCLED_RE,
+    HANG_TEXT_RE,
+    HO_LINE_RE,
+    JOSA_RE,
+    build_nodes,
+    make_article_id,
+    make_article_number_field,
+    normalize_text,
+    tokenize,
+)
+
+
+# ====================================
+# 기존 다중 패스 빌더
+# ====================================
+def split_by_articles(full_text: str) -> List[Tuple[str, Optional[str], str, int, int]]:
+    """
+    전체 문서를 조 단위 블록으로 분할.
+    반환: [(본조번호, 의번호 or None, 제목, start, end)]
+    """
+    matches = list(JOSA_RE.finditer(full_text))
+    chunks: List[Tuple[str, Optional[str], str, int, int]] = []
+    for i, m in enumerate(matches):
+        main_no = m.group(1)
+        sub_no = m.group(2)  # None or '2'
+        title = m.group(3) or ""
+        start = m.start()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(full_text)
+        chunks.append((main_no, sub_no, title, start, end))
+    return chunks
+
+
+def find_first_hang_start(block: str) -> int:
+    """
+    블록 내 '항' 시작 위치(① 또는 문단 시작 '제n항')의 인덱스 반환. 없으면 -1
+    """
+    p1 = CIRCLED_RE.search(block)
+    pos1 = p1.start() if p1 else -1
+    p2 = HANG_TEXT_RE.search(block)
+    pos2 = p2.start() if p2 else -1
+    if pos1 == -1 and pos2 == -1:
+        return -1
+    if pos1 == -1:
+        return pos2
+    if pos2 == -1:
+        return pos1
+    return min(pos1, pos2)
+
+
+def find_hang_positions(block_text: str) -> List[Tuple[int, int, str]]:
+    """
+    ①②… 항 위치 목록: [(index, 번호, 기호)]
+    (텍스트형 '제n항'은 분할 기준에서 제외. 실제 파일은 ① 형태가 주류)
+    """
+    positions: List[Tuple[int, int, str]] = []
+    for m in CIRCLED_RE.finditer(block_text):
+        sym = m.group(0)
+        positions.append((m.start(), CIRCLED_MAP[sym], sym))
+    positions.sort(key=lambda x: x[0])
+    return positions
+
+
+def split_hang_texts(
+    block_text: str, hang_positions: List[Tuple[int, int, str]]
+) -> List[Tuple[int, str]]:
+    """
+    항 분리: [(항번호, 항 텍스트)]. 선두 ① 기호 제거.
+    """
+    parts: List[Tuple[int, str]] = []
+    if not hang_positions:
+        return parts
+    for i, (pos, num, sym) in enumerate(hang_positions):
+        start = pos
+        end = (
+            hang_positions[i + 1][0] if i + 1 < len(hang_positions) else len(block_text)
+        )
+        raw = block_text[start:end].lstrip()
+        if raw.startswith(sym):
+            raw = raw[len(sym) :].lstrip()
+        parts.append((num, raw.rstrip()))
+    return parts
+
+
+def split_ho_with_preface(hang_text: str) -> Tuple[str, List[Tuple[int, str]]]:
+    """
+    항 텍스트에서 '호'를 분리하되,
+    - 반환1: 항 머리말(첫 '1.' 이전 텍스트, 없으면 전체)
+    - 반환2: [(호번호, 호 텍스트)] 목록
+    """
+    matches = list(HO_LINE_RE.finditer(hang_text))
+    if not matches:
+        # 호가 없으면 항 텍스트 그대로 머리말로 반환
+        return hang_text.strip(), []
+
+    preface_end = matches[0].start()
+    preface = hang_text[:preface_end].strip()
+
+    results: List[Tuple[int, str]] = []
+    for i, m in enumerate(matches):
+        ho_no = int(m.group(1))
+        start = m.start()
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(hang_text)
+        piece = hang_text[start:end].strip()
+        piece = re.sub(r"^\s*\d+\.\s*", "", piece)  # '1. ' 제거
+        results.append((ho_no, piece.strip()))
+    return preface, results
+
+
+def hard_cut_article_text(article_text: str) -> str:
+    """
+    조.text에 ① 또는 문단 시작 '제n항'이 들어있으면 강제 컷(이중 안전장치)
+    """
+    m = CIRCLED_RE.search(article_text)
+    if m:
+        return article_text[: m.start()].rstrip()
+    m2 = HANG_TEXT_RE.search(article_text)
+    if m2:
+        return article_text[: m2.start()].rstrip()
+    return article_text.rstrip()
+
+
+def build_nodes_multipass(
+    full_text: str, law_title: str, prefix: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    기존 구현(패턴별로 조 블록·항 텍스트를 여러 번 다시 훑음). 벤치마크용.
+    편/장/절/관·목 표지가 없는 본문에서는 build_nodes와 결과가 같습니다.
+    규칙:
+      - 조.text: '제n조(제목)' + (있다면 ① 이전 프롤로그까지만)
+      - 항.text: '호' 목록 앞의 머리말만
+      - 호.text: 각 '1. …' 항목 본문
+      - 항(① 등)이 전혀 없으면 조만 생성(정의형 조 등)
+      - refs는 항상 []
+    """
+    if prefix is None:
+        prefix = law_title
+    nodes: List[Dict[str, Any]] = []
+    node_map: Dict[str, Dict[str, Any]] = {}
+
+    for main_no, sub_no, title, start, end in split_by_articles(full_text):
+        block = full_text[start:end].strip()
+
+        # 조 헤더(제n조(제목)) 문자열
+        m_head = JOSA_RE.match(block)
+        header_txt = (
+            m_head.group(0).strip() if m_head else block.split("\n", 1)[0].strip()
+        )
+
+        # 블록 내 첫 '항' 시작 위치(① 또는 문단 시작 '제n항')
+        first_hang_idx = find_first_hang_start(block)
+
+        # 조 텍스트(헤더 + ① 이전 프롤로그)
+        if first_hang_idx != -1 and m_head:
+            preface = block[m_head.end() : first_hang_idx].strip()
+            article_text = header_txt if not preface else (header_txt + "\n" + preface)
+        else:
+            # 항 자체가 없으면 전체 블록(요청사항)
+            article_text = block
+
+        # 이중 안전장치: 조.text에서 ①/제n항 등장 시 무조건 컷
+        article_text = hard_cut_article_text(article_text)
+
+        # 조 노드 생성
+        article_id = make_article_id(prefix, main_no, sub_no)
+        number_field = make_article_number_field(main_no, sub_no)
+        art_node = {
+            "id": article_id,
+            "law_title": law_title,
+            "level": "조",
+            "number": number_field,
+            "parent_id": None,
+            "Children_id": [],
+            "text": article_text,
+            "refs": [],
+        }
+        nodes.append(art_node)
+        node_map[article_id] = art_node
+
+        # 항 분해: ① 없으면 종료
+        if first_hang_idx == -1:
+            continue
+
+        # ① 이후만 잘라서 항 분해
+        after_header = block[first_hang_idx:]
+        hang_positions = find_hang_positions(after_header)
+        hang_parts = split_hang_texts(after_header, hang_positions)
+
+        for hang_no, hang_txt in hang_parts:
+            # 항의 머리말/호 분리 (핵심 수정)
+            hang_preface, ho_list = split_ho_with_preface(hang_txt)
+
+            hang_id = f"{article_id}({hang_no})"
+            hang_node = {
+                "id": hang_id,
+                "law_title": law_title,
+                "level": "항",
+                "number": str(hang_no),
+                "parent_id": article_id,
+                "Children_id": [],
+                "text": hang_preface,  # ✅ 항.text에는 머리말만
+                "refs": [],
+            }
+            nodes.append(hang_node)
+            node_map[article_id]["Children_id"].append(hang_id)
+            node_map[hang_id] = hang_node
+
+            # 호 분해
+            for ho_no, ho_txt in ho_list:
+                ho_id = f"{hang_id}[{ho_no}]"
+                ho_node = {
+                    "id": ho_id,
+                    "law_title": law_title,
+                    "level": "호",
+                    "number": str(ho_no),
+                    "parent_id": hang_id,
+                    "Children_id": [],
+                    "text": ho_txt,
+                    "refs": [],
+                }
+                nodes.append(ho_node)
+                node_map[hang_id]["Children_id"].append(ho_id)
+                node_map[ho_id] = ho_node
+
+    return nodes
+
+
+# ====================================
+# 벤치마크
+# ====================================
+BENCH_TEXT_PATH = "./data/한글/산업안전보건기준에 관한 규칙_원문.txt"
+# 원문 파일이 없을 때 쓰는 합성 원문의 '조' 수와 난수 시드 (같은 시드 → 같은 원문)
+SYNTHETIC_ARTICLES = 700
+SYNTHETIC_SEED = 20240101
+
+
+def make_synthetic_text(
+    articles: int = SYNTHETIC_ARTICLES, seed: int = SYNTHETIC_SEED
+) -> str:
+    """
+    규칙 원문과 비슷한 모양(조·①항·1.호, 가끔 '제n조의m')의 합성 원문을 만듭니다.
+    편/장/절/관·목 표지는 넣지 않으므로 두 빌더의 결과가 같아야 합니다.
+    """
+    rng = random.Random(seed)
+    lines = []
+    for n in range(1, articles + 1):
+        suffix = f"의{rng.randint(2, 3)}" if rng.random() < 0.1 else ""
+        lines.append(
+            f"제{n}조{suffix}(작업장의 안전조치) 사업주는 근로자가 작업하는 장소에서 "
+            "다음 각 호의 조치를 하여야 한다."
+        )
+        for hang in CIRCLED_CHARS[: rng.randint(0, 5)]:
+            lines.append(
+                f"{hang} 사업주는 제{rng.randint(1, articles)}조에 따른 설비를 "
+                "설치하는 경우 다음 각 호의 사항을 지켜야 한다."
+            )
+            for ho in range(1, rng.randint(1, 8)):
+                lines.append(
+                    f"{ho}. 해당 설비의 구조와 강도를 확인하고 "
+                    "이상이 있으면 즉시 보수할 것"
+                )
+    return normalize_text("\n".join(lines))
+
+
+def run_benchmark(path: str = BENCH_TEXT_PATH, repeat: int = 21) -> None:
+    """
+    같은 원문으로 build_nodes(단일 패스)와 build_nodes_multipass(기존)를 비교합니다.
+    path가 없으면 고정 시드의 합성 원문을 씁니다.
+    두 빌더를 매 회차 번갈아 돌리고(GC는 끈 채) 회차별 시간과 비율의 중앙값과 범위를 보여 줍니다.
+    속도 차이는 기계와 부하에 따라 달라지므로 이 수치로만 판단합니다.
+    """
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            text = normalize_text(f.read())
+        law_title = os.path.basename(path).rsplit("_원문", 1)[0]
+    else:
+        print(f"⚠️ 원문이 없어 합성 원문을 씁니다: {path}")
+        text = make_synthetic_text()
+        law_title = "합성규칙"
+    builders = (
+        ("기존(다중 패스)", build_nodes_multipass),
+        ("단일 패스", build_nodes),
+    )
+    timings = {name: [] for name, _ in builders}
+    results = {}
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for name, builder in builders:
+            results[name] = builder(text, law_title)  # 예열
+        for _ in range(repeat):
+            for name, builder in builders:
+                started = time.perf_counter()
+                builder(text, law_title)
+                timings[name].append(time.perf_counter() - started)
+            gc.collect()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    for name, _ in builders:
+        samples = timings[name]
+        print(
+            f"⏱️ {name}: 중앙값 {statistics.median(samples) * 1000:.1f}ms "
+            f"(범위 {min(samples) * 1000:.1f}~{max(samples) * 1000:.1f}ms, "
+            f"노드 {len(results[name])}개, {len(text):,}자, {repeat}회)"
+        )
+    started = time.perf_counter()
+    token_count = sum(1 for _ in tokenize(text))
+    print(
+        f"   (단일 패스 중 토큰화: 표지 {token_count}개, "
+        f"{(time.perf_counter() - started) * 1000:.1f}ms)"
+    )
+    before, after = (timings[name] for name, _ in builders)
+    ratios = sorted(b / a for b, a in zip(before, after))
+    levels = Counter(node["level"] for node in results["단일 패스"])
+    print(
+        f"📉 회차별 비율(기존/단일 패스): 중앙값 {statistics.median(ratios):.2f}배 "
+        f"(범위 {ratios[0]:.2f}~{ratios[-1]:.2f}배, 단일 패스 노드: {dict(levels)})"
+    )
+    if not any(
+        node["level"] in ("편", "장", "절", "관", "목") for node in results["단일 패스"]
+    ):
+        same = results["기존(다중 패스)"] == results["단일 패스"]
+        print(f"{'✅' if same else '❌'} 두 빌더 결과 {'같음' if same else '다름'}")
+
+
+if __name__ == "__main__":
+    run_benchmark(*sys.argv[1:2])
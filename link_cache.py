@@ -0,0 +1,168 @@
+# -*- coding: utf-8 -*-
+"""
+링크 대상 내용을 디스크(SQLite)에 보관하는 캐시.
+
+같은 참조(「산업안전보건법」 제38조, [별표 1] 등)가 법령 안팎에서 반복되므로,
+'링크 대상 식별자 + 링크 텍스트'를 키로 수집 결과를 저장해 두고
+다음 클릭 전에 먼저 조회합니다.
+
+- TTL: 저장 후 ttl_seconds가 지난 항목은 조회 시 무시하고 삭제
+- 축출: max_entries를 넘으면 가장 오래 조회되지 않은 항목부터 삭제
+- 오류 문자열("오류 ...")은 저장하지 않음 (다음 실행에서 다시 시도)
+- 표 팝업(TableText)은 구조도 함께 저장해, 캐시에서 꺼내도 "표 데이터"가 유지됨
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, Tuple
+
+from crawl_output import TableText, table_json
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 200_000
+
+# 앵커의 onclick/href를 한 번에 읽는 스크립트 (arguments[0] = 앵커)
+ANCHOR_TARGET_JS = """
+var a = arguments[0];
+return [a.getAttribute("onclick") || "", a.getAttribute("href") || ""];
+"""
+
+
+def make_link_key(onclick: str, href: str, page_url: str, merged_text: str) -> str:
+    """
+    캐시 키를 만듭니다. 대상은 onclick > 실제 URL인 href > 본문 URL 순으로 식별합니다.
+    (onclick/href로 대상을 특정할 수 없으면 같은 법령 안에서만 재사용)
+    """
+    onclick = (onclick or "").strip()
+    href = (href or "").strip()
+    if onclick:
+        scope = onclick
+    elif href and not href.lower().startswith(("#", "javascript:")):
+        scope = href
+    else:
+        scope = page_url
+    return f"{scope}|{merged_text}"
+
+
+def anchor_target(driver, anchor) -> Tuple[str, str]:
+    """앵커의 (onclick, href). 읽지 못하면 ("", ""). (WebDriver 왕복 1회)"""
+    try:
+        onclick, href = driver.execute_script(ANCHOR_TARGET_JS, anchor)
+    except Exception:
+        onclick, href = "", ""
+    return onclick, href
+
+
+def anchor_key(driver, anchor, page_url: str, merged_text: str) -> str:
+    """앵커 요소에서 캐시 키를 만듭니다. (WebDriver 왕복 1회)"""
+    return make_link_key(*anchor_target(driver, anchor), page_url, merged_text)
+
+
+class LinkCache:
+    """여러 스레드(법령/샤드)가 함께 쓰는 SQLite 캐시."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS link_cache ("
+            " key TEXT PRIMARY KEY,"
+            " text TEXT NOT NULL,"
+            " created REAL NOT NULL,"
+            " accessed REAL NOT NULL)"
+        )
+        columns = {r[1] for r in self._conn.execute("PRAGMA table_info(link_cache)")}
+        if "table_json" not in columns:
+            # 표 팝업의 구조(TableText.table). 이전 캐시 파일에는 열을 추가
+            self._conn.execute("ALTER TABLE link_cache ADD COLUMN table_json TEXT")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_link_cache_accessed"
+            " ON link_cache(accessed)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, created, table_json FROM link_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl_seconds:
+                self._conn.execute("DELETE FROM link_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE link_cache SET accessed = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.hits += 1
+            if row[2]:
+                return TableText(row[0], json.loads(row[2]))
+            return row[0]
+
+    def put(self, key: str, text: str) -> None:
+        if text is None or text.startswith("오류"):
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO link_cache"
+                " (key, text, created, accessed, table_json) VALUES (?, ?, ?, ?, ?)",
+                (key, str(text), now, now, table_json(text) or None),
+            )
+            self._conn.commit()
+            self.stores += 1
+
+    def evict(self) -> int:
+        """만료 항목과 max_entries 초과분(오래 안 쓰인 순)을 지웁니다. 삭제 수 반환."""
+        with self._lock:
+            cur = self._conn.execute(
+                "DELETE FROM link_cache WHERE created < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            removed = cur.rowcount
+            count = self._conn.execute("SELECT COUNT(*) FROM link_cache").fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                cur = self._conn.execute(
+                    "DELETE FROM link_cache WHERE key IN ("
+                    " SELECT key FROM link_cache ORDER BY accessed LIMIT ?)",
+                    (overflow,),
+                )
+                removed += cur.rowcount
+            self._conn.commit()
+        return removed
+
+    def report(self) -> str:
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        return (
+            f"🗃️ 링크 캐시: 조회 {total}건, 적중 {self.hits}건 ({ratio:.1f}%), "
+            f"신규 저장 {self.stores}건"
+        )
+
+    def close(self) -> None:
+        self.evict()
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+"""
+본문 링크 → 참조 단위(링크 그룹) 묶기 규칙. (브라우저 없이 동작)
+
+law.go.kr 본문에서 하나의 참조는 여러 개의 <a>로 쪼개져 있습니다.
+예) 「산업안전보건법」 / 제38조 / 제1항 / 제2호  → "「산업안전보건법」제38조 제1항 제2호"
+각 링크의 class에 붙은 sfonN 번호가 커지는 동안은 같은 참조로 보고 묶습니다.
+
+입력 레코드: {"cls": class 문자열, "text": 링크 텍스트, ...}
+(그 밖의 키, 예: 클릭할 WebElement "el"은 그대로 유지됩니다)
+
+  python link_grouping.py          # 마이크로 벤치마크
+  python -m pytest tests/test_link_grouping.py   # 규칙 검증
+"""
+
+import re
+import time
+from typing import Any, Dict, List
+
+SFON_RE = re.compile(r"sfon(\d+)")
+
+# 다음 링크('제n조')와 하나로 묶어야 하는 법령 참조 텍스트
+SAME_LAW_REF_TEXTS = ("같은 법", "같은 법 시행령", "같은 법 시행규칙")
+
+Link = Dict[str, Any]
+
+
+def get_sfon_number(class_attr: str) -> int:
+    """링크 class 문자열에서 sfon 번호를 정수로 추출합니다. 없으면 0을 반환합니다."""
+    match = SFON_RE.search(class_attr or "")
+    return int(match.group(1)) if match else 0
+
+
+def is_special_merge_case(prev_link: Link, link: Link) -> bool:
+    """
+    「…」 또는 '같은 법' 링크 바로 뒤의 '제n조' 링크는 sfon 번호와 상관없이 묶습니다.
+    (두 링크 모두 class에 'link'가 있어야 함)
+    """
+    prev_text = prev_link["text"]
+    is_prev_link_a_law_ref = prev_text.endswith("」") or prev_text in SAME_LAW_REF_TEXTS
+    return (
+        is_prev_link_a_law_ref
+        and link["text"].startswith("제")
+        and "link" in prev_link["cls"]
+        and "link" in link["cls"]
+    )
+
+
+def group_links(links: List[Link], merge_law_refs: bool = True) -> List[List[Link]]:
+    """
+    한 문단(p)의 링크들을 sfon 번호 규칙에 따라 하나의 참조 단위로 묶습니다.
+    merge_law_refs=True면 is_special_merge_case도 적용합니다.
+    """
+    link_groups: List[List[Link]] = []
+    current_group: List[Link] = []
+    prev_sfon_num = 0
+    for link in links:
+        current_sfon_num = get_sfon_number(link["cls"])
+        if not current_group:
+            current_group = [link]
+            prev_sfon_num = current_sfon_num
+            continue
+
+        prev_link = current_group[-1]
+        break_group = False
+        if not (merge_law_refs and is_special_merge_case(prev_link, link)):
+            if (
+                prev_sfon_num == 0
+                or current_sfon_num == 0
+                or current_sfon_num <= prev_sfon_num
+            ):
+                break_group = True
+            elif "sfon6" in link["cls"] and "sfon6" not in prev_link["cls"]:
+                break_group = True
+
+        if break_group:
+            link_groups.append(current_group)
+            current_group = [link]
+        else:
+            current_group.append(link)
+        prev_sfon_num = current_sfon_num
+
+    if current_group:
+        link_groups.append(current_group)
+    return link_groups
+
+
+def merge_group_text(group: List[Link]) -> str:
+    """링크 그룹의 텍스트를 합칩니다. '「법」 제n조'는 '「법」제n조'로 붙입니다."""
+    merged_text = " ".join(link["text"] for link in group)
+    return merged_text.replace("」 제", "」제")
+
+
+# 벤치마크용 문단 예시 (class, text). 규칙 검증은 tests/test_link_grouping.py
+BENCH_PARAGRAPHS = [
+    [("link sfon1", "제38조"), ("link sfon2", "제1항"), ("link sfon3", "제2호")],
+    [("link sfon1", "제5조"), ("link sfon1", "제6조"), ("link sfon2", "제1항")],
+    [("link", "별표 1"), ("link sfon1", "제3조"), ("link", "별지 제2호서식")],
+    [("link sfon2", "제4조"), ("link sfon6", "제7조")],
+    [("link", "「산업안전보건법」"), ("link sfon1", "제38조"), ("link sfon2", "제1항")],
+    [("link", "같은 법"), ("link sfon1", "제2조")],
+]
+
+
+def run_benchmark(paragraphs: int = 20000, repeat: int = 3) -> None:
+    """예시 문단을 반복해 만든 문단들로 group_links 처리 속도를 잽니다."""
+    corpus = [
+        [
+            {"cls": cls, "text": text}
+            for cls, text in BENCH_PARAGRAPHS[i % len(BENCH_PARAGRAPHS)]
+        ]
+        for i in range(paragraphs)
+    ]
+    link_count = sum(len(p) for p in corpus)
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for links in corpus:
+            for group in group_links(links):
+                merge_group_text(group)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(
+        f"⏱️ 문단 {paragraphs}개 / 링크 {link_count}개: {best * 1000:.1f}ms "
+        f"(링크당 {best / link_count * 1e6:.2f}µs, {repeat}회 중 최고)"
+    )
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+"""
+링크 팝업을 새 창 없이 HTTP로 직접 가져오는 빠른 경로.
+
+동작:
+ 1) 앵커의 href가 실제 URL이면 그대로 사용하고, 아니면 window.open을 잠시
+    가로챈 상태로 onclick을 실행해 팝업이 열려던 URL만 기록합니다. (창은 열리지 않음)
+ 2) 그 URL을 커넥션 풀을 쓰는 requests.Session으로 받아
+    #linkedJoContent / #lsLinkTable / select#bylList / div.byl_con 을
+    BeautifulSoup으로 파싱합니다. (브라우저 경로와 같은 우선순위)
+ 3) URL을 얻지 못했거나 알려진 요소가 없으면 None을 반환 → 호출부가 기존
+    클릭/새 창 방식으로 처리합니다.
+
+브라우저는 본문 페이지 렌더링에만 쓰이므로, 저장해 둔 HTML을 로컬 HTTP 서버로
+띄운 뒤 그 주소로 크롤링하면 팝업 요청도 같은 서버로 향합니다.
+  python -m http.server 8000 --directory tests/fixtures/popups
+  python link_http.py http://localhost:8000/jo.html "제38조"
+  python -m pytest tests/test_link_http.py   # 형식별 팝업 HTML + 로컬 서버 검증
+"""
+
+import re
+import sys
+from typing import List, Optional
+from urllib.parse import urljoin
+
+import requests
+from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+
+from annex_index import annex_not_found_text, link_annex_key, option_annex_key
+from crawl_output import TableText
+from crawl_throttle import (
+    ThrottledError,
+    TransientError,
+    is_throttle_page,
+    is_throttled,
+    is_transient,
+)
+
+HTTP_TIMEOUT = 20
+HTTP_POOL_SIZE = 10
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+
+# 팝업 URL을 알아내는 스크립트. href가 실제 URL이면 클릭하지 않고 그대로 반환하고,
+# 아니면 window.open을 가로챈 채 클릭해 팝업 URL만 수집한 뒤 원래 함수로 되돌립니다.
+# (실제 href를 클릭하면 본문 탭이 이동하거나 진짜 창이 열릴 수 있음)
+# arguments[0] = 앵커
+CAPTURE_POPUP_URL_JS = """
+var anchor = arguments[0];
+var href = anchor.getAttribute("href") || "";
+if (href && !/^(javascript:|#)/i.test(href.trim())) {
+    return {urls: [], href: href};
+}
+var urls = [];
+var origOpen = window.open;
+window.open = function (u) { urls.push(u ? String(u) : ""); return null; };
+try { anchor.click(); } catch (e) {} finally { window.open = origOpen; }
+return {urls: urls, href: href};
+"""
+
+BLOCK_TAGS = {
+    "p",
+    "div",
+    "li",
+    "tr",
+    "table",
+    "thead",
+    "tbody",
+    "h1",
+    "h2",
+    "h3",
+    "h4",
+    "h5",
+    "h6",
+    "ul",
+    "ol",
+    "dl",
+    "dt",
+    "dd",
+}
+MULTI_NL_RE = re.compile(r"\n\s*\n+")
+
+
+# ====================================
+# 유틸
+# ====================================
+def make_session(pool_size: int = HTTP_POOL_SIZE) -> requests.Session:
+    """keep-alive 커넥션 풀을 쓰는 세션을 만듭니다."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+def element_text(el) -> str:
+    """블록 요소마다 줄을 바꿔, 브라우저의 element.text와 비슷한 텍스트를 만듭니다."""
+    for br in el.find_all("br"):
+        br.replace_with("\n")
+    for block in el.find_all(BLOCK_TAGS):
+        block.insert_after("\n")
+    # 표 셀은 innerText처럼 칸을 띄움 (줄 끝 공백은 아래에서 제거)
+    for cell in el.find_all(("td", "th")):
+        cell.insert_after("\t")
+    text = el.get_text("")
+    lines = [re.sub(r"[ \t\xa0]+", " ", ln).strip() for ln in text.split("\n")]
+    return MULTI_NL_RE.sub("\n", "\n".join(lines)).strip()
+
+
+def find_annex_option(merged_text: str, option_texts: List[str]) -> str:
+    """
+    링크 텍스트(예: '별표 1의2', '별지 제3호서식')에 해당하는 bylList 항목을 찾습니다.
+    없으면 "". (비교 규칙은 annex_index.py)
+    """
+    parsed = link_annex_key(merged_text)
+    if parsed is None:
+        return ""
+    for opt_text in option_texts:
+        if option_annex_key(opt_text) == parsed[1]:
+            return opt_text.strip()
+    return ""
+
+
+def parse_popup_html(
+    html: str, merged_text: str, annex_index=None, annex_scope=None
+) -> Optional[str]:
+    """
+    팝업 HTML에서 링크 대상 텍스트를 추출합니다. (브라우저 경로와 같은 규칙)
+    알려진 요소가 없으면 None (스크립트로 채워지는 페이지 등 → 브라우저로 처리).
+    annex_index(AnnexIndex)를 넘기면 별표·서식 목록을 팝업 대상 식별자(annex_scope)별로
+    색인에 넣어 다음 링크가 재사용합니다.
+    """
+    soup = BeautifulSoup(html, "html.parser")
+    content = soup.select_one("#linkedJoContent")
+    if content is not None:
+        text = element_text(content)
+        if text:
+            return text
+    table = soup.select_one("#lsLinkTable")
+    if table is not None:
+        return parse_link_table(soup, table)
+    select_element = soup.select_one("select#bylList")
+    if select_element is not None:
+        options = [
+            (opt.get_text(" ", strip=True), opt.get("value", ""))
+            for opt in select_element.find_all("option")
+        ]
+        if annex_index is not None:
+            return annex_index.learn(merged_text, options, annex_scope)
+        found_text = find_annex_option(merged_text, [text for text, _ in options])
+        return found_text or annex_not_found_text(merged_text)
+    byl_con = soup.select_one("div.byl_con")
+    if byl_con is not None:
+        return (
+            element_text(byl_con)
+            or "정보: 텍스트 데이터 없음 (이미지 전용 페이지일 수 있습니다)."
+        )
+    return None
+
+
+def table_section_rows(section) -> List[List[dict]]:
+    """thead/tbody의 행·셀 구조. (브라우저 경로 LINK_TABLE_JS와 같은 형식)"""
+    if section is None:
+        return []
+    rows = []
+    for tr in section.find_all("tr", recursive=False):
+        cells = []
+        for td in tr.find_all(["td", "th"], recursive=False):
+            cell = {"text": element_text(td)}
+            for span in ("colspan", "rowspan"):
+                value = int(td.get(span, 1) or 1)
+                if value > 1:
+                    cell[span] = value
+            cells.append(cell)
+        rows.append(cells)
+    return rows
+
+
+def parse_link_table(soup, table) -> TableText:
+    """#lsLinkTable 팝업(표)에서 머리글과 본문 문단 텍스트, 표 구조를 모읍니다."""
+    collected_texts = []
+    top = soup.select_one("#lsLinkTableTop")
+    caption = element_text(top) if top is not None else ""
+    if caption:
+        collected_texts.append(caption)
+    thead = table.find("thead", recursive=False)
+    if thead is not None and element_text(thead):
+        collected_texts.append(element_text(thead))
+    body_p_texts = [
+        p.get_text("").strip()
+        for p in table.find_all("p")
+        if p.find_parent("thead") is None and p.get_text("").strip()
+    ]
+    if body_p_texts:
+        collected_texts.append("\n".join(body_p_texts))
+    else:
+        tbody = table.find("tbody", recursive=False)
+        if tbody is not None and element_text(tbody):
+            collected_texts.append(element_text(tbody))
+    structure = {
+        "caption": caption,
+        "header": table_section_rows(thead),
+        "rows": table_section_rows(table.find("tbody", recursive=False) or table),
+    }
+    return TableText("\n".join(collected_texts).strip(), structure)
+
+
+# ====================================
+# 리졸버
+# ====================================
+class HttpLinkResolver:
+    """
+    드라이버 하나(= 본문 페이지 하나)에 묶이는 HTTP 리졸버.
+    본문 페이지의 쿠키를 세션에 복사해, 팝업 요청이 같은 세션으로 나가게 합니다.
+    """
+
+    def __init__(self, base_url: str, session: Optional[requests.Session] = None):
+        self.base_url = base_url
+        self.session = session or make_session()
+        self.hits = 0
+        self.fallbacks = 0
+
+    @classmethod
+    def from_driver(cls, driver) -> "HttpLinkResolver":
+        resolver = cls(driver.current_url)
+        for c in driver.get_cookies():
+            resolver.session.cookies.set(
+                c["name"], c["value"], domain=c.get("domain"), path=c.get("path", "/")
+            )
+        return resolver
+
+    def popup_url(self, driver, anchor) -> str:
+        """앵커가 열 팝업 URL을 새 창 없이 알아냅니다. 모르면 ""."""
+        captured = driver.execute_script(CAPTURE_POPUP_URL_JS, anchor) or {}
+        href = (captured.get("href") or "").strip()
+        candidates = [u for u in captured.get("urls") or [] if u.strip()]
+        if (
+            not candidates
+            and href
+            and not href.lower().startswith(("javascript:", "#"))
+        ):
+            candidates = [href]
+        # form.submit 등으로 새 창이 열렸다면 항상 닫음. 남겨 두면 다음 클릭 경로가
+        # 이 창을 팝업으로 잘못 읽음
+        original_window = driver.current_window_handle
+        extra_windows = [h for h in driver.window_handles if h != original_window]
+        for handle in extra_windows:
+            driver.switch_to.window(handle)
+            driver.close()
+        if extra_windows:
+            driver.switch_to.window(original_window)
+        if not candidates:
+            return ""
+        return urljoin(self.base_url, candidates[-1])
+
+    def fetch(self, url: str) -> str:
+        resp = self.session.get(url, timeout=HTTP_TIMEOUT)
+        resp.raise_for_status()
+        if not resp.encoding or resp.encoding.lower() == "iso-8859-1":
+            resp.encoding = resp.apparent_encoding
+        return resp.text
+
+    def resolve(
+        self, driver, anchor, merged_text: str, annex_index=None, annex_scope=None
+    ) -> Optional[str]:
+        """
+        링크 대상 텍스트를 HTTP로 가져옵니다. 실패하면 None (→ 클릭 방식으로 처리).
+        요청이 시간 초과 등 일시 오류로 실패하면 클릭해도 같으므로 TransientError를,
+        차단(429/503, 차단 안내 페이지)이면 ThrottledError를 올려 재시도 큐로 보냅니다.
+        (crawl_throttle.py)
+        """
+        url = ""
+        try:
+            url = self.popup_url(driver, anchor)
+            if not url:
+                self.fallbacks += 1
+                return None
+            page = self.fetch(url)
+            text = parse_popup_html(page, merged_text, annex_index, annex_scope)
+            if text is None and is_throttle_page(page):
+                raise ThrottledError(
+                    "오류 발생 또는 텍스트 수집 실패: 차단 안내 페이지"
+                )
+        except ThrottledError:
+            raise
+        except Exception as e:
+            message = f"오류 발생 또는 텍스트 수집 실패: {e}"
+            if url and is_throttled(e):
+                raise ThrottledError(message) from e
+            if url and is_transient(e):
+                raise TransientError(message) from e
+            text = None
+        if text is None:
+            self.fallbacks += 1
+        else:
+            self.hits += 1
+        return text
+
+
+# ====================================
+# 실행: 저장된 팝업 HTML(또는 URL) 파싱 확인용
+# ====================================
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python link_http.py <팝업 URL 또는 HTML 파일> [링크 텍스트]")
+        sys.exit(1)
+    target = sys.argv[1]
+    link_text = sys.argv[2] if len(sys.argv) > 2 else ""
+    if target.startswith(("http://", "https://")):
+        page = HttpLinkResolver(target).fetch(target)
+    else:
+        with open(target, "r", encoding="utf-8") as f:
+            page = f.read()
+    parsed = parse_popup_html(page, link_text)
+    print(
+        parsed
+        if parsed is not None
+        else "⚠️ 알려진 요소(#linkedJoContent, Table, #bylList, .byl_con)가 없습니다."
+    )
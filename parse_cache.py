@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+링크 대상 텍스트 셀의 파싱 결과(노드 JSON) 캐시.
+
+같은 팝업 텍스트(예: 「산업안전보건법」 제38조 전문)가 한 파일의 여러 행과 여러 법령 파일에
+반복해서 나옵니다. 셀 내용의 SHA-256 해시를 키로 파싱 결과를 보관해 같은 셀은 한 번만 파싱합니다.
+
+- 메모리: 프로세스 안의 LRU (max_entries개)
+- 디스크(선택): path를 주면 SQLite에도 저장해 다음 실행에서도 재사용
+- 키에 law_parser.PARSER_VERSION이 들어가므로 파싱 규칙이 바뀌면 이전 결과는 쓰지 않음
+- blob 참조("blob:<해시>")는 저장소의 해시가 곧 내용 해시이므로 본문을 읽지 않고 키를 만듦
+"""
+
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from blob_store import BLOB_PREFIX, is_blob_ref
+from law_parser import PARSER_VERSION
+
+PARSE_CACHE_PATH = "./data/cache/parse_cache.sqlite"
+DEFAULT_MAX_ENTRIES = 4096
+
+
+def content_key(value: str) -> str:
+    """셀 값(텍스트 또는 blob 참조)의 캐시 키: '파서버전:SHA-256'"""
+    if is_blob_ref(value):
+        digest = value[len(BLOB_PREFIX) :]
+    else:
+        digest = hashlib.sha256(str(value).encode("utf-8")).hexdigest()
+    return f"{PARSER_VERSION}:{digest}"
+
+
+class ParseCache:
+    """
+    키 → (노드 JSON, 파싱에 걸린 초). 적중 시 그 파싱 시간만큼 절약한 것으로 셉니다.
+    """
+
+    def __init__(
+        self, path: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ):
+        self.path = path
+        self.max_entries = max_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.parse_seconds = 0.0
+        self.saved_seconds = 0.0
+        self._memory: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS parse_cache ("
+                " key TEXT PRIMARY KEY,"
+                " nodes_json TEXT NOT NULL,"
+                " parse_seconds REAL NOT NULL,"
+                " created REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def _remember(self, key: str, entry: Tuple[str, float]) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Tuple[str, float]]:
+        """(노드 JSON, 파싱 초) 또는 None. 통계는 record_hit/put에서 셉니다."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+            if self._conn is None:
+                return None
+            row = self._conn.execute(
+                "SELECT nodes_json, parse_seconds FROM parse_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.disk_hits += 1
+            entry = (row[0], row[1])
+            self._remember(key, entry)
+            return entry
+
+    def put(self, key: str, nodes_json: str, seconds: float) -> None:
+        """새로 파싱한 결과를 저장합니다. (미적중 1건)"""
+        with self._lock:
+            self.misses += 1
+            self.parse_seconds += seconds
+            self._remember(key, (nodes_json, seconds))
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO parse_cache"
+                    " (key, nodes_json, parse_seconds, created) VALUES (?, ?, ?, ?)",
+                    (key, nodes_json, seconds, time.time()),
+                )
+
+    def record_hit(self, seconds: float) -> None:
+        """파싱하지 않고 캐시 결과를 쓴 셀 1건."""
+        with self._lock:
+            self.hits += 1
+            self.saved_seconds += seconds
+
+    def flush(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+
+    def report(self) -> str:
+        total = self.hits + self.misses
+        ratio = (self.hits / total * 100) if total else 0.0
+        return (
+            f"🗃️ 파싱 캐시: 셀 {total}건, 적중 {self.hits}건 ({ratio:.1f}%, "
+            f"디스크 {self.disk_hits}건), 파싱 {self.misses}건 "
+            f"{self.parse_seconds:.1f}초, 절약 {self.saved_seconds:.1f}초"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.commit()
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+링크 팝업 창의 내용 대기.
+
+팝업은 형식에 따라 #linkedJoContent(조문) / #lsLinkTable(표) /
+select#bylList(별표·서식 목록) / div.byl_con(별표 본문) 중 하나를 가집니다.
+예전에는 형식마다 WebDriverWait(20초)를 차례로 걸어, 이미지뿐인 별표 팝업은
+앞선 형식들의 타임아웃을 모두 기다린 뒤에야 처리됐습니다.
+
+PopupWaiter는 알려진 선택자를 한 번의 스크립트 호출로 동시에 확인하고,
+먼저 나타난 형식을 바로 반환합니다. 대기 시간은 최근 팝업 로딩 시간을 보고 조정합니다.
+조정한 대기 시간이 지나도 내용이 없으면 최대 대기 시간(MAX_TIMEOUT)까지 더 기다린 뒤에야
+포기하므로, 빠른 팝업이 이어진 뒤 한 번 느린 팝업이 와도 데이터를 잃지 않습니다.
+"""
+
+import threading
+import time
+from collections import deque
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+# (형식, CSS 선택자). 같은 시점에 여러 개가 있으면 앞의 것이 우선
+POPUP_SELECTORS = [
+    ("jo", "#linkedJoContent"),
+    ("table", "#lsLinkTable"),
+    ("byl_list", "select#bylList"),
+    ("byl_con", "div.byl_con"),
+]
+
+# arguments[0] = 선택자 목록. 처음 찾은 [순번, 요소] 또는 null
+FIND_FIRST_SELECTOR_JS = """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var el = document.querySelector(selectors[i]);
+    if (el) return [i, el];
+}
+return null;
+"""
+
+MIN_TIMEOUT = 3.0
+MAX_TIMEOUT = 20.0
+# 관측된 로딩 시간의 상위(90%) 값에 곱할 여유 배수
+TIMEOUT_MARGIN = 3.0
+SAMPLE_WINDOW = 50
+MIN_SAMPLES = 5
+
+
+class PopupWaiter:
+    """팝업 내용 대기 + 관측 지연 기반 타임아웃 조정 (드라이버 하나당 하나)."""
+
+    def __init__(self, min_timeout=MIN_TIMEOUT, max_timeout=MAX_TIMEOUT):
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self._samples = deque(maxlen=SAMPLE_WINDOW)
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self) -> float:
+        with self._lock:
+            if len(self._samples) < MIN_SAMPLES:
+                return self.max_timeout
+            ordered = sorted(self._samples)
+        p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+        return max(self.min_timeout, min(self.max_timeout, p90 * TIMEOUT_MARGIN))
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def wait_for_content(self, driver):
+        """
+        현재 창에서 알려진 팝업 형식 중 먼저 나타난 것을 기다립니다.
+        조정된 대기 시간(timeout) 안에 없으면 max_timeout까지 이어서 기다립니다.
+        반환: (형식, 요소) / max_timeout 안에 아무것도 없으면 (None, None)
+        """
+        selectors = [css for _, css in POPUP_SELECTORS]
+        started = time.time()
+        found = _wait_first(driver, selectors, self.timeout)
+        if found is None:
+            # 적응형 대기가 짧았을 수 있으므로 남은 시간만큼 더 기다림
+            remaining = self.max_timeout - (time.time() - started)
+            if remaining > 0:
+                found = _wait_first(driver, selectors, remaining)
+        # 늦게 나타났거나 끝내 없었던 경우도 표본으로 기록해 다음 대기를 늘림
+        self.record(time.time() - started)
+        if found is None:
+            return None, None
+        index, element = found
+        return POPUP_SELECTORS[index][0], element
+
+
+def _wait_first(driver, selectors, timeout):
+    """선택자 중 처음 나타난 [순번, 요소]. timeout초 안에 없으면 None"""
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script(FIND_FIRST_SELECTOR_JS, selectors)
+        )
+    except TimeoutException:
+        return None
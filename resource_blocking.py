@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+"""
+헤드리스 브라우저의 불필요한 자원 차단.
+
+크롤러는 본문·팝업의 텍스트만 읽지만, 브라우저는 페이지마다 이미지·폰트·방문 통계
+스크립트까지 내려받은 뒤에야 한가해집니다. 이 모듈은 모든 크롤러 드라이버에 다음을 적용합니다.
+
+- 이미지 끄기 (크롬 설정 → 본문·팝업 모든 탭)
+- 방문 통계·광고 호스트 차단 (--host-resolver-rules → 모든 탭에서 즉시 실패)
+- URL 패턴 차단 목록 (CDP Network.setBlockedURLs → 본문 탭. Playwright는 모든 탭)
+- 페이지 로드 전략 "eager": driver.get이 load 이벤트가 아니라 DOMContentLoaded에서 반환
+  (본문은 어차피 div.lawcon이 나타날 때까지 따로 기다림)
+
+CSS는 막지 않습니다. innerText/.text는 CSS로 숨긴 요소를 빼고 읽으므로,
+CSS를 막으면 수집 결과가 달라질 수 있습니다.
+
+  python resource_blocking.py <아카이브> [법령당 링크 수]   # 재생 아카이브로 팝업 지연 비교
+"""
+
+import fnmatch
+import statistics
+import sys
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+# 본문 탭에서 막을 URL 패턴 (CDP 와일드카드: *)
+BLOCKED_URL_PATTERNS = [
+    "*.png*",
+    "*.jpg*",
+    "*.jpeg*",
+    "*.gif*",
+    "*.bmp*",
+    "*.webp*",
+    "*.svg*",
+    "*.ico*",
+    "*.woff*",
+    "*.ttf*",
+    "*.otf*",
+    "*.eot*",
+    "*.mp4*",
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*wcs.naver.net*",
+]
+# 모든 탭에서 이름 풀이부터 실패시킬 방문 통계·광고 호스트
+BLOCKED_HOSTS = [
+    "www.google-analytics.com",
+    "www.googletagmanager.com",
+    "stats.g.doubleclick.net",
+    "wcs.naver.net",
+]
+# Playwright에서 막을 자원 종류 (request.resource_type)
+BLOCKED_RESOURCE_TYPES = {"image", "font", "media"}
+DISABLE_IMAGES = True
+# "normal"(load 이벤트까지 대기) / "eager"(DOMContentLoaded) / "none"
+PAGE_LOAD_STRATEGY = "eager"
+
+
+def apply_chrome_options(
+    options,
+    disable_images=DISABLE_IMAGES,
+    page_load_strategy=PAGE_LOAD_STRATEGY,
+    blocked_hosts=BLOCKED_HOSTS,
+):
+    """ChromeOptions에 브라우저 전체(모든 탭)에 걸리는 차단 설정을 더합니다."""
+    if disable_images:
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+    if blocked_hosts:
+        rules = ", ".join(f"MAP {host} ~NOTFOUND" for host in blocked_hosts)
+        options.add_argument(f"--host-resolver-rules={rules}")
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
+    return options
+
+
+def block_requests(driver, patterns=BLOCKED_URL_PATTERNS) -> bool:
+    """
+    현재 탭에 URL 패턴 차단 목록을 겁니다. (크롬 전용 CDP 명령)
+    탭 단위 설정이므로 드라이버를 만든 직후 본문 탭에 한 번 호출합니다.
+    반환: 적용 여부
+    """
+    if not patterns:
+        return False
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(patterns)})
+        return True
+    except (WebDriverException, AttributeError):
+        return False
+
+
+def is_blocked_url(url: str, patterns=BLOCKED_URL_PATTERNS) -> bool:
+    return any(fnmatch.fnmatchcase(url, pattern) for pattern in patterns)
+
+
+async def apply_playwright_blocking(
+    context,
+    resource_types=BLOCKED_RESOURCE_TYPES,
+    patterns=BLOCKED_URL_PATTERNS,
+):
+    """Playwright BrowserContext의 모든 탭(팝업 포함)에 차단 규칙을 겁니다."""
+
+    async def _route(route):
+        request = route.request
+        if request.resource_type in resource_types or is_blocked_url(
+            request.url, patterns
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await context.route("**/*", _route)
+
+
+# ====================================
+# 벤치마크
+# ====================================
+def measure_popup_latency(archive_dir, block_resources, links_per_law=50):
+    """
+    재생 아카이브의 법령마다 앞쪽 links_per_law개 링크를 클릭해, 팝업 하나당
+    클릭 → 내용 추출 → 창 닫기 시간(초) 목록을 반환합니다.
+    """
+    from crawl_archive import ArchiveServer, CrawlArchive
+    from crawl_throttle import TransientError
+    from law_crawling import (
+        create_driver,
+        fetch_link_target,
+        iter_article_link_groups,
+        load_law_articles,
+    )
+    from link_grouping import merge_group_text
+    from popup_wait import PopupWaiter
+
+    archive = CrawlArchive(archive_dir)
+    samples = []
+    with ArchiveServer(archive, port=0) as server:
+        driver = create_driver(block_resources=block_resources)
+        try:
+            for law_url in archive.laws.values():
+                articles = load_law_articles(driver, server.replay_url(law_url))
+                groups = [g for a in articles for g in iter_article_link_groups(a)]
+                waiter = PopupWaiter()
+                for group in groups[:links_per_law]:
+                    started = time.perf_counter()
+                    try:
+                        fetch_link_target(
+                            driver, waiter, group[-1]["el"], merge_group_text(group)
+                        )
+                    except TransientError:
+                        pass
+                    samples.append(time.perf_counter() - started)
+        finally:
+            driver.quit()
+    return samples
+
+
+def run_benchmark(archive_dir, links_per_law=50) -> None:
+    """자원 차단 전후의 팝업 지연을 비교해 출력합니다."""
+    results = {}
+    for label, block in (("차단 안 함", False), ("자원 차단", True)):
+        samples = measure_popup_latency(archive_dir, block, links_per_law)
+        if not samples:
+            print("⚠️ 아카이브에서 클릭할 링크를 찾지 못했습니다.")
+            return
+        ordered = sorted(samples)
+        p90 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))]
+        results[label] = statistics.median(ordered)
+        print(
+            f"⏱️ {label}: 팝업 {len(ordered)}개, "
+            f"중앙값 {results[label] * 1000:.0f}ms, "
+            f"p90 {p90 * 1000:.0f}ms, "
+            f"평균 {statistics.mean(ordered) * 1000:.0f}ms"
+        )
+    before, after = results["차단 안 함"], results["자원 차단"]
+    print(
+        f"📉 팝업당 중앙값 {(before - after) * 1000:.0f}ms 감소 ({1 - after / before:.0%})"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python resource_blocking.py <아카이브> [법령당 링크 수]")
+        sys.exit(1)
+    run_benchmark(sys.argv[1], int(sys.argv[2]) if len(sys.argv) > 2 else 50)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""annex_index의 별표·서식 목록 색인 검증. (브라우저 없이 동작)"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from annex_index import (  # noqa: E402
+    AnnexIndex,
+    annex_not_found_text,
+    annex_scope,
+    link_annex_key,
+)
+from link_grouping import group_links, merge_group_text  # noqa: E402
+
+# 시행규칙(lsiSeq=100)과 다른 법령(lsiSeq=200)의 별표 목록
+RULE_SCOPE = annex_scope("", "/LSW/lsBylInfoPLinkR.do?lsiSeq=100&bylNo=0002")
+OTHER_SCOPE = annex_scope("", "/LSW/lsBylInfoPLinkR.do?lsiSeq=200&bylNo=0002")
+RULE_OPTIONS = [("[별표 1] 규칙 별표 1", "1"), ("[별표 2] 규칙 별표 2", "2")]
+OTHER_OPTIONS = [("[별표 1] 다른 법 별표 1", "1"), ("[별표 2] 다른 법 별표 2", "2")]
+
+
+@pytest.mark.parametrize(
+    "onclick, href, expected",
+    [
+        pytest.param(
+            "", "/LSW/lsBylInfoPLinkR.do?lsiSeq=123&bylNo=0002", "lsiseq=123", id="href"
+        ),
+        pytest.param("fncLsPop('lsiSeq','123')", "#", "lsiseq=123", id="onclick"),
+        pytest.param("go({admRulSeq: '77'})", "", "admrulseq=77", id="행정규칙"),
+        pytest.param("fncPop()", "javascript:;", None, id="식별자 없음"),
+    ],
+)
+def test_annex_scope(onclick, href, expected):
+    assert annex_scope(onclick, href) == expected
+
+
+@pytest.mark.parametrize(
+    "merged_text, expected",
+    [
+        ("별표 1의2", ("", ("별표", 1, 2))),
+        (
+            "「산업안전보건법 시행규칙」 별지 제3호의2서식",
+            ("「산업안전보건법 시행규칙」", ("서식", 3, 2)),
+        ),
+        ("제38조", None),
+    ],
+)
+def test_link_annex_key(merged_text, expected):
+    assert link_annex_key(merged_text) == expected
+
+
+def test_bare_annex_after_same_law_ref_is_not_served_from_index():
+    # '같은 법 시행규칙' 뒤의 '별표 2'는 제n조가 아니므로 따로 떨어진 그룹이 됨
+    groups = group_links(
+        [
+            {"cls": "link", "text": "같은 법 시행규칙"},
+            {"cls": "link sfon1", "text": "별표 2"},
+        ]
+    )
+    assert [merge_group_text(g) for g in groups] == ["같은 법 시행규칙", "별표 2"]
+
+    index = AnnexIndex()
+    # 같은 페이지의 다른 법령 별표 링크가 먼저 목록을 색인함
+    assert (
+        index.learn("별표 1", OTHER_OPTIONS, OTHER_SCOPE) == "[별표 1] 다른 법 별표 1"
+    )
+    # 앞부분 없는 '별표 2'는 식별자가 달라도 같아도 색인 목록을 쓰지 않음 → 팝업
+    assert index.lookup("별표 2", RULE_SCOPE) is None
+    assert index.lookup("별표 2", OTHER_SCOPE) is None
+    assert index.lookup("같은 법 시행규칙 별표 2", RULE_SCOPE) is None
+    # 팝업에서 읽은 목록은 그 링크의 대상 법령 것으로 처리됨
+    assert index.learn("별표 2", RULE_OPTIONS, RULE_SCOPE) == "[별표 2] 규칙 별표 2"
+    assert index.hits == 0
+
+
+def test_lists_are_kept_per_target():
+    index = AnnexIndex()
+    index.learn("「규칙」 별표 1", RULE_OPTIONS, RULE_SCOPE)
+    index.learn("「다른 법」 별표 1", OTHER_OPTIONS, OTHER_SCOPE)
+    assert index.lookup("「규칙」 별표 2", RULE_SCOPE) == "[별표 2] 규칙 별표 2"
+    assert index.lookup("「다른 법」 별표 2", OTHER_SCOPE) == "[별표 2] 다른 법 별표 2"
+    assert index.lookup("「규칙」 별표 9", RULE_SCOPE) == annex_not_found_text(
+        "「규칙」 별표 9"
+    )
+    assert index.hits == 3
+
+
+def test_unknown_target_is_never_indexed():
+    index = AnnexIndex()
+    assert index.learn("「규칙」 별표 1", RULE_OPTIONS, None) == "[별표 1] 규칙 별표 1"
+    assert index.lookup("「규칙」 별표 2", None) is None
+    assert index.lookup("「규칙」 별표 2", RULE_SCOPE) is None
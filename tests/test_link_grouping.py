@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+"""link_grouping의 묶기 규칙 검증. (브라우저 없이 동작)"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from link_grouping import get_sfon_number, group_links, merge_group_text  # noqa: E402
+
+
+def _links(pairs):
+    return [{"cls": cls, "text": text} for cls, text in pairs]
+
+
+def _grouped_texts(pairs, **kwargs):
+    return [merge_group_text(g) for g in group_links(_links(pairs), **kwargs)]
+
+
+# (class, text) → 기대 그룹 텍스트
+@pytest.mark.parametrize(
+    "pairs, expected",
+    [
+        pytest.param(
+            [
+                ("link sfon1", "제38조"),
+                ("link sfon2", "제1항"),
+                ("link sfon3", "제2호"),
+            ],
+            ["제38조 제1항 제2호"],
+            id="sfon 번호가 커지는 동안 한 그룹",
+        ),
+        pytest.param(
+            [("link sfon1", "제5조"), ("link sfon1", "제6조"), ("link sfon2", "제1항")],
+            ["제5조", "제6조 제1항"],
+            id="번호가 같거나 작아지면 새 그룹",
+        ),
+        pytest.param(
+            [("link", "별표 1"), ("link sfon1", "제3조"), ("link", "별지 제2호서식")],
+            ["별표 1", "제3조", "별지 제2호서식"],
+            id="sfon 번호 없는 링크는 항상 단독",
+        ),
+        pytest.param(
+            [("link sfon2", "제4조"), ("link sfon6", "제7조")],
+            ["제4조", "제7조"],
+            id="sfon6은 앞 링크가 sfon6이 아니면 분리",
+        ),
+        pytest.param(
+            [("link sfon1", "제4조"), ("link sfon6", "제7조"), ("link sfon7", "제1항")],
+            ["제4조", "제7조 제1항"],
+            id="sfon6 뒤의 더 큰 번호는 sfon6 그룹에 붙음",
+        ),
+        pytest.param(
+            [("link sfon6", "제7조"), ("link sfon6", "제8조")],
+            ["제7조", "제8조"],
+            id="sfon6 다음 sfon6은 번호가 같으므로 분리",
+        ),
+        pytest.param(
+            [("link", "「산업안전보건법」"), ("link sfon6", "제38조")],
+            ["「산업안전보건법」제38조"],
+            id="특수 병합은 sfon6 규칙보다 우선",
+        ),
+        pytest.param(
+            [
+                ("link", "「산업안전보건법」"),
+                ("link sfon1", "제38조"),
+                ("link sfon2", "제1항"),
+            ],
+            ["「산업안전보건법」제38조 제1항"],
+            id="「법」 + 제n조 특수 병합",
+        ),
+        pytest.param(
+            [("link", "같은 법"), ("link sfon1", "제2조")],
+            ["같은 법 제2조"],
+            id="같은 법 + 제n조 특수 병합",
+        ),
+        pytest.param(
+            [
+                ("link", "같은 법 시행령"),
+                ("link sfon1", "제2조"),
+                ("link sfon2", "제3항"),
+            ],
+            ["같은 법 시행령 제2조 제3항"],
+            id="같은 법 시행령 + 제n조 특수 병합",
+        ),
+        pytest.param(
+            [("link", "같은 법 시행규칙"), ("link sfon1", "별표 2")],
+            ["같은 법 시행규칙", "별표 2"],
+            id="특수 병합은 제n조일 때만",
+        ),
+        pytest.param(
+            [("sfon1", "「산업안전보건법」"), ("link sfon1", "제38조")],
+            ["「산업안전보건법」", "제38조"],
+            id="특수 병합은 두 링크 모두 link class일 때만",
+        ),
+        pytest.param(
+            [
+                ("link sfon1", "제3조"),
+                ("link sfon2", "제1항"),
+                ("link", "별표 1"),
+                ("link sfon1", "제5조"),
+                ("link sfon3", "제2호"),
+                ("link sfon2", "제4항"),
+                ("link", "같은 법"),
+                ("link sfon1", "제9조"),
+            ],
+            ["제3조 제1항", "별표 1", "제5조 제2호", "제4항", "같은 법 제9조"],
+            id="한 문단에 여러 sfon class가 섞인 경우",
+        ),
+        pytest.param([], [], id="링크 없는 문단"),
+    ],
+)
+def test_group_links(pairs, expected):
+    assert _grouped_texts(pairs) == expected
+
+
+@pytest.mark.parametrize(
+    "pairs, expected",
+    [
+        pytest.param(
+            [
+                ("link", "「산업안전보건법」"),
+                ("link sfon1", "제38조"),
+                ("link sfon2", "제1항"),
+            ],
+            ["「산업안전보건법」", "제38조 제1항"],
+            id="「법」 뒤 제n조도 분리",
+        ),
+        pytest.param(
+            [("link", "같은 법 시행령"), ("link sfon1", "제2조")],
+            ["같은 법 시행령", "제2조"],
+            id="같은 법 시행령 뒤 제n조도 분리",
+        ),
+        pytest.param(
+            [("link sfon1", "제38조"), ("link sfon2", "제1항")],
+            ["제38조 제1항"],
+            id="sfon 규칙은 그대로",
+        ),
+    ],
+)
+def test_group_links_without_law_ref_merge(pairs, expected):
+    assert _grouped_texts(pairs, merge_law_refs=False) == expected
+
+
+def test_group_links_keeps_extra_keys():
+    links = [
+        {"cls": "link sfon1", "text": "제38조", "el": "a1"},
+        {"cls": "link sfon2", "text": "제1항", "el": "a2"},
+    ]
+    (group,) = group_links(links)
+    assert [link["el"] for link in group] == ["a1", "a2"]
+
+
+@pytest.mark.parametrize(
+    "class_attr, expected",
+    [("link sfon3", 3), ("sfon12 link", 12), ("link", 0), ("", 0), (None, 0)],
+)
+def test_get_sfon_number(class_attr, expected):
+    assert get_sfon_number(class_attr) == expected
@@ -0,0 +1,162 @@
+# -*- coding: utf-8 -*-
+"""link_http의 팝업 HTML 파싱과 HTTP 빠른 경로 검증. (저장한 팝업 HTML + 로컬 HTTP 서버)"""
+
+import functools
+import os
+import sys
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from annex_index import AnnexIndex, annex_not_found_text  # noqa: E402
+from crawl_output import TableText  # noqa: E402
+from link_http import HttpLinkResolver, parse_popup_html  # noqa: E402
+
+FIXTURE_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "fixtures", "popups"
+)
+
+JO_TEXT = (
+    "제38조(안전조치) ① 사업주는 다음 각 호의 위험으로 인한 산업재해를 예방하기 위하여 "
+    "필요한 조치를 하여야 한다.\n"
+    "1. 기계·기구, 그 밖의 설비에 의한 위험\n"
+    "2. 폭발성, 발화성 및 인화성 물질 등에 의한 위험"
+)
+TABLE_TEXT = (
+    "관련 법령\n법령 조문\n산업안전보건법\n제38조\n산업안전보건기준에 관한 규칙"
+)
+
+
+def _read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), "r", encoding="utf-8") as f:
+        return f.read()
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def popup_server():
+    """FIXTURE_DIR를 내보내는 로컬 HTTP 서버. 기본 URL을 반환합니다."""
+    handler = functools.partial(_QuietHandler, directory=FIXTURE_DIR)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FakeDriver:
+    """본문 창 하나만 있는 드라이버. 앵커는 팝업 URL(href) 문자열로 대신합니다."""
+
+    current_window_handle = "main"
+    window_handles = ["main"]
+
+    def execute_script(self, script, anchor):
+        return {"urls": [], "href": anchor}
+
+
+@pytest.mark.parametrize(
+    "fixture, merged_text, expected",
+    [
+        pytest.param("jo.html", "제38조", JO_TEXT, id="jo"),
+        pytest.param("table.html", "별표 1", TABLE_TEXT, id="table"),
+        pytest.param(
+            "byl_list.html",
+            "별표 1의2",
+            "[별표 1의2] 관리감독자의 업무 내용",
+            id="byl_list",
+        ),
+        pytest.param(
+            "byl_list.html",
+            "별표 9",
+            annex_not_found_text("별표 9"),
+            id="byl_list 없음",
+        ),
+        pytest.param(
+            "byl_con.html",
+            "별표 3",
+            "[별표 3] 안전검사 대상 기계\n1. 프레스",
+            id="byl_con",
+        ),
+        pytest.param(
+            "byl_con_image.html",
+            "별표 3",
+            "정보: 텍스트 데이터 없음 (이미지 전용 페이지일 수 있습니다).",
+            id="byl_con 이미지",
+        ),
+        pytest.param("unsupported.html", "제38조", None, id="알 수 없는 형식"),
+    ],
+)
+def test_parse_popup_html(fixture, merged_text, expected):
+    assert parse_popup_html(_read_fixture(fixture), merged_text) == expected
+
+
+def test_parse_link_table_keeps_structure():
+    text = parse_popup_html(_read_fixture("table.html"), "")
+    assert isinstance(text, TableText)
+    assert text.table["caption"] == "관련 법령"
+    assert text.table["header"] == [[{"text": "법령"}, {"text": "조문"}]]
+    assert text.table["rows"][1] == [
+        {"text": "산업안전보건기준에 관한 규칙", "colspan": 2}
+    ]
+
+
+def test_byl_list_is_learned_by_annex_index():
+    index = AnnexIndex()
+    html = _read_fixture("byl_list.html")
+    scope = "lsiseq=1"
+    assert (
+        parse_popup_html(html, "「규칙」 별표 1", index, scope)
+        == "[별표 1] 안전관리자를 두어야 하는 사업의 종류"
+    )
+    assert index.lookup("「규칙」 별표 2", scope) == (
+        "[별표 2] 안전보건관리책임자를 두어야 하는 사업의 종류"
+    )
+
+
+@pytest.mark.parametrize(
+    "fixture, merged_text, expected",
+    [
+        pytest.param("jo.html", "제38조", JO_TEXT, id="jo"),
+        pytest.param("table.html", "", TABLE_TEXT, id="table"),
+        pytest.param(
+            "byl_list.html",
+            "별표 2",
+            "[별표 2] 안전보건관리책임자를 두어야 하는 사업의 종류",
+            id="byl_list",
+        ),
+        pytest.param(
+            "byl_con.html",
+            "별표 3",
+            "[별표 3] 안전검사 대상 기계\n1. 프레스",
+            id="byl_con",
+        ),
+    ],
+)
+def test_resolve_over_http(popup_server, fixture, merged_text, expected):
+    resolver = HttpLinkResolver(popup_server)
+    assert resolver.resolve(FakeDriver(), fixture, merged_text) == expected
+    assert (resolver.hits, resolver.fallbacks) == (1, 0)
+
+
+@pytest.mark.parametrize(
+    "anchor_href",
+    [
+        pytest.param("unsupported.html", id="알 수 없는 형식"),
+        pytest.param("missing.html", id="404"),
+        pytest.param("javascript:void(0)", id="팝업 URL 없음"),
+    ],
+)
+def test_resolve_falls_back_to_clicking(popup_server, anchor_href):
+    resolver = HttpLinkResolver(popup_server)
+    assert resolver.resolve(FakeDriver(), anchor_href, "제38조") is None
+    assert (resolver.hits, resolver.fallbacks) == (0, 1)
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""popup_wait.PopupWaiter의 대기 시간 검증. (가짜 드라이버, 브라우저 없이 동작)"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from popup_wait import MIN_SAMPLES, POPUP_SELECTORS, PopupWaiter  # noqa: E402
+
+
+class SlowPopupDriver:
+    """delay초가 지나야 selector_index번 형식의 요소가 나타나는 가짜 드라이버 (None이면 끝내 없음)"""
+
+    def __init__(self, delay, selector_index=0):
+        self.delay = delay
+        self.selector_index = selector_index
+        self.started = time.time()
+
+    def execute_script(self, script, *args):
+        if self.delay is None or time.time() - self.started < self.delay:
+            return None
+        return [self.selector_index, "element"]
+
+
+def _trained_waiter(min_timeout=0.05, max_timeout=1.5):
+    """빠른 팝업이 이어져 대기 시간이 min_timeout까지 줄어든 waiter"""
+    waiter = PopupWaiter(min_timeout=min_timeout, max_timeout=max_timeout)
+    for _ in range(MIN_SAMPLES):
+        waiter.record(0.001)
+    assert waiter.timeout == min_timeout
+    return waiter
+
+
+def test_fast_popup_is_found():
+    waiter = _trained_waiter()
+    kind, element = waiter.wait_for_content(SlowPopupDriver(0.0, 2))
+    assert (kind, element) == (POPUP_SELECTORS[2][0], "element")
+
+
+def test_popup_slower_than_adaptive_timeout_is_still_found():
+    waiter = _trained_waiter()
+    started = time.time()
+    kind, element = waiter.wait_for_content(SlowPopupDriver(0.4))
+    assert (kind, element) == ("jo", "element")
+    assert 0.4 <= time.time() - started < 1.5
+    # 늦은 팝업을 기록해 다음 대기 시간이 늘어남
+    assert waiter.timeout > waiter.min_timeout
+
+
+def test_missing_content_gives_up_after_max_timeout():
+    waiter = _trained_waiter(max_timeout=0.5)
+    started = time.time()
+    assert waiter.wait_for_content(SlowPopupDriver(None)) == (None, None)
+    assert time.time() - started >= 0.5